@@ -13,15 +13,36 @@ import sys
 import threading
 import subprocess
 import datetime
-from typing import Optional, Tuple, List, Dict, Set
+from typing import Optional, Tuple, List, Dict, Set, Callable
 from tkinter import Tk, Frame, Label, Button, Entry, Text, Scrollbar, StringVar, OptionMenu, messagebox, filedialog, Listbox, BooleanVar, Checkbutton, Spinbox
 from tkinter.ttk import Progressbar, Style
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from driver_pool import ChromeDriverPool
+from chapter_index import ChapterIndex
+from concurrent_downloader import ConcurrentChapterDownloader
+from page_waits import (wait_for_document_ready, wait_for_content, wait_for_element,
+                        wait_for_chapter_links, wait_for_more_links, count_links)
+from link_harvest import expand_all_volumes, harvest_chapter_links
+from http_fetch import HTTP_FETCH_AVAILABLE, HttpChapterFetcher, is_challenge_title
+from chapter_probe import ChapterProber, chapter_failure, is_valid_chapter
+from html_store import HtmlStore
+from selector_stats import SelectorStats, find_content
+from page_text import extract_page_text
+from request_blocking import enable_request_blocking
+from rate_limit import get_rate_limiter, limit_navigation_rate
+from retry_policy import (BLOCKED, NOT_FOUND, RetryPolicy, fetch_with_retry, get_circuit_breaker, report_failure,
+                          take_failure)
+from page_load import PAGE_LOAD_STRATEGIES, enable_site_page_loads
+from sitemap_discovery import discover_from_sitemap
+from chapter_archive import archive_via_browser, fetch_chapter_archive
+from feed_watch import FeedWatcher
+from wp_rest import WordPressApi, WordPressChapterSource, discover_new_posts
+from site_adapters import (KATREADINGCAFE, NOVELBIN, detect_website_type, get_adapter, novel_name_from_url,
+                           registered_types)
 
 class AppConfig:
     """Application configuration"""
@@ -40,6 +61,41 @@ class AppConfig:
         self.window_width = 800
         self.window_height = 600
         self.theme = "light"  # or "dark"
+        
+        # Browser reuse settings
+        self.DRIVER_POOL_SIZE = 1
+        self.DRIVER_MAX_PAGE_LOADS = 50  # Recycle a browser after this many page loads
+        self.DRIVER_MAX_RSS_MB = 1024  # Recycle a browser once it uses this much memory
+        self.DRIVER_FRESH_SESSION = True  # Clear cookies and cache between chapters
+        
+        # Concurrent download settings
+        self.DOWNLOAD_WORKERS = 1  # Chapters fetched in parallel (1 = one at a time)
+        self.PER_HOST_CONCURRENCY = 0  # Max chapters in flight per website (caps DOWNLOAD_WORKERS); 0 follows DOWNLOAD_WORKERS
+        
+        # Chapter fetch settings
+        self.USE_HTTP_FETCH = True  # Try a plain HTTP GET before loading a chapter in Chrome
+        self.SAVE_RAW_HTML = False  # Keep compressed chapter HTML for offline re-extraction
+        self.SCRIPT_TEXT_EXTRACTION = True  # Read chapter text with one script call instead of WebElement.text
+        self.USE_SITEMAP_DISCOVERY = True  # Build the chapter index from the site's XML sitemaps before using Chrome
+        self.USE_WP_REST_API = True  # Pull WordPress chapter posts in bulk through wp-json (KatReadingCafe)
+        self.USE_CHAPTER_ARCHIVE = True  # Read the whole chapter list from the archive endpoint instead of scrolling (NovelBin)
+        
+        # Network request blocking (applies to browsers started after a change)
+        self.BLOCK_REQUESTS = True  # Block ads, trackers, fonts and media through Chrome DevTools
+        self.BLOCK_STYLESHEETS = False  # Also block CSS on sites that don't allowlist it
+        self.PAGE_LOAD_STRATEGY = "eager"  # "normal", "eager" or "none" for sites without their own setting
+        
+        # Request pacing, shared by every browser and HTTP session per website
+        self.RATE_LIMIT_PER_MINUTE = 30  # Sustained requests per minute to one site (0 = unlimited)
+        self.RATE_LIMIT_BURST = 3  # Requests allowed back to back before pacing starts
+        self.RATE_LIMIT_JITTER = 0.5  # Extra random delay in seconds
+        self.RATE_LIMIT_OVERRIDES = {}  # {"novelbin.me": 20} for sites that need a different rate
+        
+        # Failure handling
+        self.RETRY_MAX_ATTEMPTS = 3  # Tries per chapter before counting it as failed
+        self.RETRY_BASE_DELAY = 5  # Seconds before the first retry, doubling each time
+        self.BREAKER_THRESHOLD = 3  # Block signals in a row before a site is paused
+        self.BREAKER_COOLDOWN = 300  # Seconds a blocking site is paused (doubles if it keeps blocking)
 
     def save(self):
         """Save configuration to file"""
@@ -50,7 +106,30 @@ class AppConfig:
             "CHROME_PROFILE_PATH": self.CHROME_PROFILE_PATH,
             "window_width": self.window_width,
             "window_height": self.window_height,
-            "theme": self.theme
+            "theme": self.theme,
+            "DRIVER_POOL_SIZE": self.DRIVER_POOL_SIZE,
+            "DRIVER_MAX_PAGE_LOADS": self.DRIVER_MAX_PAGE_LOADS,
+            "DRIVER_MAX_RSS_MB": self.DRIVER_MAX_RSS_MB,
+            "DRIVER_FRESH_SESSION": self.DRIVER_FRESH_SESSION,
+            "DOWNLOAD_WORKERS": self.DOWNLOAD_WORKERS,
+            "PER_HOST_CONCURRENCY": self.PER_HOST_CONCURRENCY,
+            "USE_HTTP_FETCH": self.USE_HTTP_FETCH,
+            "SAVE_RAW_HTML": self.SAVE_RAW_HTML,
+            "SCRIPT_TEXT_EXTRACTION": self.SCRIPT_TEXT_EXTRACTION,
+            "USE_SITEMAP_DISCOVERY": self.USE_SITEMAP_DISCOVERY,
+            "USE_WP_REST_API": self.USE_WP_REST_API,
+            "USE_CHAPTER_ARCHIVE": self.USE_CHAPTER_ARCHIVE,
+            "BLOCK_REQUESTS": self.BLOCK_REQUESTS,
+            "BLOCK_STYLESHEETS": self.BLOCK_STYLESHEETS,
+            "PAGE_LOAD_STRATEGY": self.PAGE_LOAD_STRATEGY,
+            "RATE_LIMIT_PER_MINUTE": self.RATE_LIMIT_PER_MINUTE,
+            "RATE_LIMIT_BURST": self.RATE_LIMIT_BURST,
+            "RATE_LIMIT_JITTER": self.RATE_LIMIT_JITTER,
+            "RATE_LIMIT_OVERRIDES": self.RATE_LIMIT_OVERRIDES,
+            "RETRY_MAX_ATTEMPTS": self.RETRY_MAX_ATTEMPTS,
+            "RETRY_BASE_DELAY": self.RETRY_BASE_DELAY,
+            "BREAKER_THRESHOLD": self.BREAKER_THRESHOLD,
+            "BREAKER_COOLDOWN": self.BREAKER_COOLDOWN
         }
         with open(os.path.join(os.path.dirname(__file__), "config.json"), "w") as f:
             json.dump(config, f)
@@ -68,6 +147,29 @@ class AppConfig:
                 self.window_width = config.get("window_width", 800)
                 self.window_height = config.get("window_height", 600)
                 self.theme = config.get("theme", "light")
+                self.DRIVER_POOL_SIZE = config.get("DRIVER_POOL_SIZE", 1)
+                self.DRIVER_MAX_PAGE_LOADS = config.get("DRIVER_MAX_PAGE_LOADS", 50)
+                self.DRIVER_MAX_RSS_MB = config.get("DRIVER_MAX_RSS_MB", 1024)
+                self.DRIVER_FRESH_SESSION = config.get("DRIVER_FRESH_SESSION", True)
+                self.DOWNLOAD_WORKERS = config.get("DOWNLOAD_WORKERS", 1)
+                self.PER_HOST_CONCURRENCY = config.get("PER_HOST_CONCURRENCY", 0)
+                self.USE_HTTP_FETCH = config.get("USE_HTTP_FETCH", True)
+                self.SAVE_RAW_HTML = config.get("SAVE_RAW_HTML", False)
+                self.SCRIPT_TEXT_EXTRACTION = config.get("SCRIPT_TEXT_EXTRACTION", True)
+                self.USE_SITEMAP_DISCOVERY = config.get("USE_SITEMAP_DISCOVERY", True)
+                self.USE_WP_REST_API = config.get("USE_WP_REST_API", True)
+                self.USE_CHAPTER_ARCHIVE = config.get("USE_CHAPTER_ARCHIVE", True)
+                self.BLOCK_REQUESTS = config.get("BLOCK_REQUESTS", True)
+                self.BLOCK_STYLESHEETS = config.get("BLOCK_STYLESHEETS", False)
+                self.PAGE_LOAD_STRATEGY = config.get("PAGE_LOAD_STRATEGY", "eager")
+                self.RATE_LIMIT_PER_MINUTE = config.get("RATE_LIMIT_PER_MINUTE", 30)
+                self.RATE_LIMIT_BURST = config.get("RATE_LIMIT_BURST", 3)
+                self.RATE_LIMIT_JITTER = config.get("RATE_LIMIT_JITTER", 0.5)
+                self.RATE_LIMIT_OVERRIDES = config.get("RATE_LIMIT_OVERRIDES", {})
+                self.RETRY_MAX_ATTEMPTS = config.get("RETRY_MAX_ATTEMPTS", 3)
+                self.RETRY_BASE_DELAY = config.get("RETRY_BASE_DELAY", 5)
+                self.BREAKER_THRESHOLD = config.get("BREAKER_THRESHOLD", 3)
+                self.BREAKER_COOLDOWN = config.get("BREAKER_COOLDOWN", 300)
 
 
 class TextToSpeechEngine:
@@ -239,9 +341,11 @@ class WebDriverManager:
     """Manages the creation and configuration of web drivers"""
     
     @staticmethod
-    def create_driver() -> Optional[webdriver.Chrome]:
+    def create_driver(block_requests: bool = True, block_stylesheets: bool = False,
+                      page_load_strategy: str = "eager") -> Optional[webdriver.Chrome]:
         """Create and configure a Chrome WebDriver"""
         options = Options()
+        options.page_load_strategy = page_load_strategy
         options.add_argument("--headless")
         options.add_argument("--no-sandbox")
         options.add_argument("--disable-blink-features=AutomationControlled")
@@ -260,6 +364,10 @@ class WebDriverManager:
             print("🔧 Setting up Chrome driver...")
             driver = webdriver.Chrome(options=options)
             print("✅ Chrome driver initialized successfully!")
+            if block_requests:
+                enable_request_blocking(driver, block_stylesheets)
+            enable_site_page_loads(driver, page_load_strategy)
+            limit_navigation_rate(driver)
             return driver
         except Exception as e:
             print(f"❌ Failed to start ChromeDriver: {e}")
@@ -269,73 +377,268 @@ class WebDriverManager:
             print("   3. Add chromedriver to your system PATH")
             print("   4. Make sure Chrome browser is installed")
             return None
+    
+    @staticmethod
+    def create_pool(config: AppConfig) -> ChromeDriverPool:
+        """Create a reusable driver pool configured from the app settings"""
+        return ChromeDriverPool(
+            lambda: WebDriverManager.create_driver(config.BLOCK_REQUESTS, config.BLOCK_STYLESHEETS,
+                                                   config.PAGE_LOAD_STRATEGY),
+            size=max(config.DRIVER_POOL_SIZE, config.DOWNLOAD_WORKERS),
+            max_page_loads=config.DRIVER_MAX_PAGE_LOADS,
+            max_rss_mb=config.DRIVER_MAX_RSS_MB,
+            clear_between_leases=config.DRIVER_FRESH_SESSION
+        )
+    
+    @staticmethod
+    def configure_request_pacing(config: AppConfig):
+        """Apply the pacing settings to the limiter and circuit breaker shared by every browser and HTTP session"""
+        get_rate_limiter().configure(config.RATE_LIMIT_PER_MINUTE, config.RATE_LIMIT_BURST,
+                                     config.RATE_LIMIT_JITTER, config.RATE_LIMIT_OVERRIDES)
+        get_circuit_breaker().configure(config.BREAKER_THRESHOLD, config.BREAKER_COOLDOWN)
+    
+    @staticmethod
+    def create_retry_policy(config: AppConfig) -> RetryPolicy:
+        return RetryPolicy(max_attempts=config.RETRY_MAX_ATTEMPTS, base_delay=config.RETRY_BASE_DELAY)
+    
+    @staticmethod
+    def create_http_fetcher(config: AppConfig) -> Optional[HttpChapterFetcher]:
+        """Create the plain HTTP chapter fetcher, or None when disabled or requests/bs4 are missing"""
+        if not config.USE_HTTP_FETCH:
+            return None
+        if not HTTP_FETCH_AVAILABLE:
+            print("⚠️ requests/beautifulsoup4 not installed, all chapters will load in Chrome")
+            return None
+        return HttpChapterFetcher(pool_size=max(config.DOWNLOAD_WORKERS, config.PER_HOST_CONCURRENCY))
 
 
 class NovelScraperBase:
     """Base class for novel scrapers with common functionality"""
     
-    def __init__(self, notification_handler: NotificationHandler):
+    def __init__(self, notification_handler: NotificationHandler, driver_pool: Optional[ChromeDriverPool] = None,
+                 http_fetcher: Optional[HttpChapterFetcher] = None):
         self.notifier = notification_handler
+        self.driver_pool = driver_pool
+        self.http_fetcher = http_fetcher
+        self.save_raw_html = False
+        self.script_extraction = True
+        self.sitemap_discovery = True
+        self.rest_api = True
+        self.chapter_archive = True
+        self.retry_policy = RetryPolicy()
+    
+    def _acquire_driver(self) -> Optional[webdriver.Chrome]:
+        """Lease a driver from the pool, or start a standalone one without a pool"""
+        if self.driver_pool:
+            return self.driver_pool.acquire()
+        return WebDriverManager.create_driver()
+    
+    def _release_driver(self, driver, discard: bool = False):
+        """Return a driver to the pool, or quit it without a pool"""
+        if self.driver_pool:
+            self.driver_pool.release(driver, discard=discard)
+            return
+        try:
+            driver.quit()
+        except:
+            pass
     
-    def _get_chapter_content(self, driver, chapter_num: int) -> Tuple[Optional[str], Optional[str]]:
+    def _fetch_over_http(self, url: str, selectors: List[str]) -> Optional[Tuple[str, str, str, str]]:
+        """Try a plain HTTP fetch of a chapter; None means the browser is needed"""
+        if not self.http_fetcher or not url:
+            return None
+        return self.http_fetcher.fetch(url, selectors)
+    
+    def _store_raw_html(self, output_dir: str, chapter_num: int, url: str, html: str):
+        """Keep the fetched page for offline re-extraction when enabled"""
+        if self.save_raw_html:
+            HtmlStore.for_directory(output_dir).save(chapter_num, url, html)
+    
+    def _discover_from_sitemap(self, series_url: str, output_dir: str) -> Dict[int, Tuple[str, Optional[int]]]:
+        """Seed the chapter index from the site's sitemaps over plain HTTP; returns what was found"""
+        if not self.sitemap_discovery or not self.http_fetcher:
+            return {}
+        print(f"🗺️ Looking for chapters in the {self.SITE.display_name} sitemap...")
+        discovered = discover_from_sitemap(self.http_fetcher, series_url, self.SITE)
+        if discovered:
+            ChapterIndex.for_directory(output_dir).update(discovered)
+        return discovered
+    
+    def _discover_from_archive(self, series_url: str, output_dir: Optional[str] = None,
+                               driver=None) -> Dict[int, Tuple[str, Optional[int]]]:
+        """Read the full chapter list from the site's archive endpoint, over HTTP and then in the browser
+
+        Returns {} when the site has no archive or it fails, so callers fall
+        back to scrolling the chapter list.
+        """
+        if not self.chapter_archive or not self.SITE.chapter_archive_path:
+            return {}
+        print(f"📚 Fetching the {self.SITE.display_name} chapter archive...")
+        discovered = {}
+        if self.http_fetcher:
+            discovered = fetch_chapter_archive(self.http_fetcher, series_url, self.SITE)
+        if not discovered and driver:
+            discovered = archive_via_browser(driver, series_url, self.SITE)
+        if discovered and output_dir:
+            index = ChapterIndex.for_directory(output_dir)
+            index.update(discovered)
+            index.learn_url_template()
+        return discovered
+    
+    def _wordpress_api(self, series_url: str) -> Optional[WordPressApi]:
+        """REST client for WordPress sites when enabled and plain HTTP is available"""
+        if not self.rest_api or not self.http_fetcher or not self.SITE.wordpress_api:
+            return None
+        return WordPressApi(self.http_fetcher, series_url)
+    
+    def _find_content(self, driver, output_dir: Optional[str], min_length: int) -> Optional[Tuple[str, str]]:
+        """Try the content selectors, the ones that worked for this novel before first"""
+        stats = SelectorStats.for_directory(output_dir) if output_dir else None
+        return find_content(driver, self.CONTENT_SELECTORS, min_length, stats, self.SITE.name)
+    
+    def _extract_page_text(self, driver, output_dir: Optional[str],
+                           fallback: bool = False) -> Optional[Tuple[str, Optional[str], str]]:
+        """Read (title, source, text) in one script call; None means use WebElement.text instead"""
+        if not self.script_extraction:
+            return None
+        stats = SelectorStats.for_directory(output_dir) if output_dir else None
+        return extract_page_text(driver, self.CONTENT_SELECTORS, self.SITE.min_content_length, fallback,
+                                 stats, self.SITE.name)
+    
+    def _get_chapter_content(self, driver, chapter_num: int,
+                             output_dir: Optional[str] = None) -> Tuple[Optional[str], Optional[str]]:
         """Extract chapter title and content"""
         raise NotImplementedError
         
-    def scrape_chapters(self, series_url: str, start: int, end: int, output_dir: str) -> int:
-        """Scrape chapters between start and end (inclusive)"""
+    def scrape_chapters(self, series_url: str, start: int, end: int, output_dir: str,
+                        progress_callback: Optional[Callable[[int, str], None]] = None,
+                        should_stop: Optional[Callable[[], bool]] = None) -> int:
+        """Scrape chapters between start and end (inclusive)
+
+        progress_callback is called with (chapter_num, status) where status is
+        "downloading", "completed" or "failed". should_stop is polled before
+        each chapter so callers can interrupt a long batch.
+        """
         raise NotImplementedError
 
 
 class KatReadingCafeScraper(NovelScraperBase):
     """Scraper for KatReadingCafe website"""
     
-    def _get_chapter_content(self, driver, chapter_num: int) -> Tuple[Optional[str], Optional[str]]:
+    SITE = KATREADINGCAFE
+    CONTENT_SELECTORS = KATREADINGCAFE.content_selectors
+    
+    def _get_chapter_content(self, driver, chapter_num: int,
+                             output_dir: Optional[str] = None) -> Tuple[Optional[str], Optional[str]]:
         """Extract chapter title and content from KatReadingCafe"""
+        page = self._extract_page_text(driver, output_dir)
+        if page:
+            title, source, content = page
+            return (title, content) if content else (None, None)
+        
         title = driver.title.strip()
-        content = ""
         
-        # Try different content selectors
-        selectors = ["div.entry-content", ".post-content", ".chapter-content", "article", ".content"]
-        for sel in selectors:
-            try:
-                content = driver.find_element(By.CSS_SELECTOR, sel).text
-                if content.strip():
-                    return title, content
-            except:
-                continue
+        found = self._find_content(driver, output_dir, self.SITE.min_content_length)
+        if found:
+            return title, found[1]
         
         return None, None
     
-    def scrape_chapters(self, series_url: str, start: int, end: int, output_dir: str) -> int:
-        """Scrape chapters from KatReadingCafe with multi-volume support"""
+    def scrape_chapters(self, series_url: str, start: int, end: int, output_dir: str,
+                        progress_callback: Optional[Callable[[int, str], None]] = None,
+                        should_stop: Optional[Callable[[], bool]] = None) -> int:
+        """Scrape chapters from KatReadingCafe with multi-volume support
+
+        Discovery runs once per call, then the whole [start, end] range is
+        downloaded through the same browser session. The browser is only
+        started when discovery or a plain HTTP fetch fallback needs it.
+        """
         print("🔍 KatReadingCafe: Checking available volumes and chapters...")
         
-        driver = WebDriverManager.create_driver()
-        if not driver:
-            return 0
-            
-        wait = WebDriverWait(driver, 30)
+        driver = None
         downloaded = 0
         
         try:
-            # Navigate to series page
-            driver.get(series_url)
-            time.sleep(3)
+            index = ChapterIndex.for_directory(output_dir)
+            if not index.covers(end):
+                self._discover_from_sitemap(series_url, output_dir)
+            api = self._wordpress_api(series_url)
+            if api and not index.covers(end):
+                new_posts = discover_new_posts(api, series_url, self.SITE, index.last_discovered_at())
+                print(f"📦 WordPress API found {len(new_posts)} chapter posts to index")
+                index.update(new_posts)
+            
+            if index.covers(end):
+                print(f"📇 Chapter index already covers up to chapter {index.last_known_chapter()}, skipping discovery")
+            else:
+                driver = self._acquire_driver()
+                if not driver:
+                    return 0
+                
+                # Navigate to series page
+                driver.get(series_url)
+                wait_for_document_ready(driver)
+                
+                # Only expand volumes from the last indexed one onwards
+                discovered = self._discover_chapters(driver, min_volume=index.last_known_volume())
+                new_entries = index.update(discovered)
+                print(f"📇 Chapter index updated with {new_entries} new or changed chapters")
             
-            # Collect all chapters from all necessary volumes
-            all_chapters = self._discover_chapters(driver)
+            all_chapters = index.as_chapter_map()
             sorted_chapters = sorted(all_chapters.keys())
             
             if sorted_chapters:
                 print(f"📊 Total chapters available: {len(sorted_chapters)} (Ch. {sorted_chapters[0]} - Ch. {sorted_chapters[-1]})")
                 
+                wanted = [num for num in sorted_chapters if start <= num <= end]
+                source = None
+                if api:
+                    source = WordPressChapterSource(api, {num: all_chapters[num][0] for num in wanted},
+                                                    title_suffix=self.SITE.page_title_suffix)
+                
+                def fetch(chapter_num: int) -> Optional[Tuple[str, str]]:
+                    def attempt():
+                        nonlocal driver
+                        chapter = source.get(chapter_num) if source else None
+                        if chapter:
+                            print(f"⚡ Got Chapter {chapter_num} from the WordPress API")
+                            return chapter
+                        chapter = self._fetch_over_http_chapter(chapter_num, all_chapters[chapter_num], output_dir)
+                        if chapter:
+                            return chapter
+                        # A 404 or block from the API or HTTP step says nothing about how the browser will do
+                        take_failure()
+                        if driver is None:
+                            driver = self._acquire_driver()
+                            if not driver:
+                                return None
+                        return self._fetch_chapter(driver, chapter_num, all_chapters[chapter_num], output_dir)
+                    
+                    return fetch_with_retry(attempt, all_chapters[chapter_num][0], self.retry_policy, should_stop,
+                                            f"Chapter {chapter_num}")
+                
+                def commit(title: str, content: str, chapter_num: int) -> bool:
+                    return self._save_chapter(title, content, chapter_num, output_dir)
+                
                 # Download the requested chapters
-                for chapter_num in sorted_chapters:
-                    if chapter_num < start or chapter_num > end:
-                        continue
-                        
-                    if self._download_single_chapter(driver, chapter_num, all_chapters[chapter_num], output_dir):
+                for chapter_num in wanted:
+                    if should_stop and should_stop():
+                        print("⏹️ Stop requested, ending KatReadingCafe batch")
+                        break
+                    
+                    if progress_callback:
+                        progress_callback(chapter_num, "downloading")
+                    
+                    chapter = fetch(chapter_num)
+                    if chapter and commit(chapter[0], chapter[1], chapter_num):
                         downloaded += 1
+                        if progress_callback:
+                            progress_callback(chapter_num, "completed")
+                    elif progress_callback:
+                        progress_callback(chapter_num, "failed")
+                
+                if sorted_chapters[-1] < end:
+                    print(f"📝 Requested up to chapter {end}, but the latest available is {sorted_chapters[-1]}")
             
             return downloaded
         
@@ -343,88 +646,55 @@ class KatReadingCafeScraper(NovelScraperBase):
             print(f"❌ Error during KatReadingCafe scraping: {e}")
             return downloaded
         finally:
-            try:
-                driver.quit()
-                print("👋 Browser closed for KatReadingCafe!")
-            except:
-                pass
-    
-    def _discover_chapters(self, driver) -> Dict[int, Tuple[str, int]]:
-        """Discover all available chapters with their URLs and volumes"""
-        all_chapters = {}
-        
-        # Find all available volume buttons and expand them
-        vol_elements = driver.find_elements(By.XPATH, "//span[contains(text(), 'Vol.')]")
-        all_volumes = self._extract_volumes(vol_elements)
-        
-        if all_volumes:
-            print(f"📚 Available volumes: {all_volumes}")
-            
-            for vol_num in all_volumes:
-                all_chapters.update(self._expand_volume(driver, vol_num))
-        
-        return all_chapters
-    
-    def _extract_volumes(self, vol_elements) -> List[int]:
-        """Extract volume numbers from volume elements"""
-        volumes = set()
-        for elem in vol_elements:
-            vol_text = elem.text.strip()
-            vol_match = re.search(r'Vol\.\s*(\d+)', vol_text)
-            if vol_match:
-                volumes.add(int(vol_match.group(1)))
-        return sorted(volumes)
-    
-    def _expand_volume(self, driver, vol_num: int) -> Dict[int, Tuple[str, int]]:
-        """Expand a volume and collect its chapters"""
-        volume_chapters = {}
-        vol_selector = f"//span[text()='Vol. {vol_num}']"
-        
-        try:
-            vol_element = driver.find_element(By.XPATH, vol_selector)
-            print(f"🔍 Expanding Vol. {vol_num}...")
-            driver.execute_script("arguments[0].scrollIntoView(true);", vol_element)
-            time.sleep(1)
-            vol_element.click()
-            time.sleep(3)
-            
-            # Collect chapter links for this volume
-            links = driver.find_elements(By.TAG_NAME, "a")
-            for a in links:
-                txt = a.text.strip()
-                m = re.match(rf'Vol\.\s*{vol_num}\s*Ch\.\s*(\d+)', txt)
-                if m:
-                    chapter_num = int(m.group(1))
-                    chapter_url = a.get_attribute("href")
-                    if chapter_url:
-                        volume_chapters[chapter_num] = (chapter_url, vol_num)
-            
-            print(f"📋 Vol. {vol_num}: Found {len(volume_chapters)} chapters")
-            
-        except Exception as e:
-            print(f"❌ Could not expand Vol. {vol_num}: {e}")
+            if driver is not None:
+                self._release_driver(driver)
+                print("👋 Browser released for KatReadingCafe!")
+    
+    def _discover_chapters(self, driver, min_volume: Optional[int] = None) -> Dict[int, Tuple[str, int]]:
+        """Discover available chapters with their URLs and volumes
+
+        When min_volume is given, volumes before it are assumed to be indexed
+        already and are not expanded.
+        """
+        return expand_all_volumes(driver, min_volume=min_volume)
+    
+    def _fetch_over_http_chapter(self, chapter_num: int, chapter_data: Tuple[str, int],
+                                 output_dir: str) -> Optional[Tuple[str, str]]:
+        """Fetch (title, content) without a browser; None means fall back to Selenium"""
+        chapter_url, volume = chapter_data
+        chapter = self._fetch_over_http(chapter_url, self.CONTENT_SELECTORS)
+        if not chapter:
+            return None
         
-        return volume_chapters
+        title, content, final_url, html = chapter
+        self._store_raw_html(output_dir, chapter_num, final_url, html)
+        print(f"⚡ Fetched Chapter {chapter_num} (Vol. {volume or '?'}) over HTTP")
+        return title, content
     
-    def _download_single_chapter(self, driver, chapter_num: int, chapter_data: Tuple[str, int], output_dir: str) -> bool:
-        """Download and save a single chapter"""
+    def _fetch_chapter(self, driver, chapter_num: int, chapter_data: Tuple[str, int],
+                       output_dir: str) -> Optional[Tuple[str, str]]:
+        """Load a chapter in the browser and extract (title, content)"""
         chapter_url, volume = chapter_data
-        print(f"🌐 Loading Chapter {chapter_num} (Vol. {volume}) -> {chapter_url}")
+        print(f"🌐 Loading Chapter {chapter_num} (Vol. {volume or '?'}) -> {chapter_url}")
         
         try:
             driver.get(chapter_url)
-            time.sleep(2)
+            wait_for_content(driver, self.CONTENT_SELECTORS)
+            if self.save_raw_html:
+                self._store_raw_html(output_dir, chapter_num, driver.current_url, driver.page_source)
             
-            title, content = self._get_chapter_content(driver, chapter_num)
+            title, content = self._get_chapter_content(driver, chapter_num, output_dir)
             if not content:
                 print(f"❌ Could not extract content for chapter {chapter_num}")
-                return False
+                if is_challenge_title(driver.title):
+                    report_failure(BLOCKED)
+                return None
             
-            return self._save_chapter(title, content, chapter_num, output_dir)
+            return title, content
             
         except Exception as e:
             print(f"❌ Error downloading chapter {chapter_num}: {e}")
-            return False
+            return None
     
     def _save_chapter(self, title: str, content: str, chapter_num: int, output_dir: str) -> bool:
         """Save chapter to file"""
@@ -458,25 +728,52 @@ class KatReadingCafeScraper(NovelScraperBase):
 class NovelBinScraper(NovelScraperBase):
     """Scraper for NovelBin website"""
     
-    def scrape_chapters(self, series_url: str, start: int, end: int, output_dir: str) -> int:
+    SITE = NOVELBIN
+    CONTENT_SELECTORS = NOVELBIN.content_selectors
+    
+    def __init__(self, notification_handler: NotificationHandler, driver_pool: Optional[ChromeDriverPool] = None,
+                 download_workers: int = 1, per_host_limit: int = 0,
+                 http_fetcher: Optional[HttpChapterFetcher] = None):
+        super().__init__(notification_handler, driver_pool, http_fetcher)
+        self.download_workers = download_workers
+        self.per_host_limit = per_host_limit
+    
+    def scrape_chapters(self, series_url: str, start: int, end: int, output_dir: str,
+                        progress_callback: Optional[Callable[[int, str], None]] = None,
+                        should_stop: Optional[Callable[[], bool]] = None) -> int:
         """Download multiple chapters from NovelBin with fresh browser for each chapter"""
         print(f"🔍 NovelBin: Will download chapters {start} to {end}...")
         
+        if self.download_workers > 1:
+            return self._scrape_chapters_concurrently(series_url, start, end, output_dir,
+                                                      progress_callback, should_stop)
+        
         downloaded = 0
         current_chapter = start
         consecutive_failures = 0
         max_consecutive_failures = 3
         
         while current_chapter <= end and consecutive_failures < max_consecutive_failures:
-            if self._download_single_chapter(series_url, current_chapter, output_dir):
+            if should_stop and should_stop():
+                print("⏹️ Stop requested, ending NovelBin batch")
+                break
+            
+            if progress_callback:
+                progress_callback(current_chapter, "downloading")
+            
+            if self._download_single_chapter(series_url, current_chapter, output_dir, should_stop):
                 downloaded += 1
                 consecutive_failures = 0
+                if progress_callback:
+                    progress_callback(current_chapter, "completed")
                 
                 # Announce progress every 10 chapters
                 if downloaded % 10 == 0:
                     self.notifier.notify_progress(downloaded)
             else:
                 consecutive_failures += 1
+                if progress_callback:
+                    progress_callback(current_chapter, "failed")
             
             current_chapter += 1
         
@@ -485,106 +782,252 @@ class NovelBinScraper(NovelScraperBase):
         
         return downloaded
     
-    def _download_single_chapter(self, series_url: str, chapter_num: int, output_dir: str) -> bool:
-        """Download a single chapter using a fresh browser instance"""
-        driver = WebDriverManager.create_driver()
-        if not driver:
+    def _scrape_chapters_concurrently(self, series_url: str, start: int, end: int, output_dir: str,
+                                      progress_callback: Optional[Callable[[int, str], None]] = None,
+                                      should_stop: Optional[Callable[[], bool]] = None) -> int:
+        """Fetch several chapters in parallel while saving them in chapter order"""
+        print(f"⚡ Using {self.download_workers} parallel workers (max {self.per_host_limit or self.download_workers} per site)")
+        progress = {"downloaded": 0}
+        
+        def on_chapter(chapter_num: int, status: str):
+            if status == "completed":
+                progress["downloaded"] += 1
+                if progress["downloaded"] % 10 == 0:
+                    self.notifier.notify_progress(progress["downloaded"])
+            if progress_callback:
+                progress_callback(chapter_num, status)
+        
+        downloader = ConcurrentChapterDownloader(
+            max_workers=self.download_workers,
+            per_host_limit=self.per_host_limit,
+            max_consecutive_failures=3
+        )
+        return downloader.run(
+            series_url,
+            range(start, end + 1),
+            fetch=lambda chapter_num: self._fetch_chapter(series_url, chapter_num, output_dir, should_stop),
+            commit=lambda title, content, chapter_num: self._save_chapter(title, content, chapter_num, output_dir),
+            progress_callback=on_chapter,
+            should_stop=should_stop
+        )
+    
+    def _download_single_chapter(self, series_url: str, chapter_num: int, output_dir: str,
+                                 should_stop: Optional[Callable[[], bool]] = None) -> bool:
+        """Download a single chapter using a pooled (or fresh) browser instance"""
+        title, content = self._fetch_chapter(series_url, chapter_num, output_dir, should_stop) or (None, None)
+        if not content:
             return False
+        
+        # Save chapter
+        return self._save_chapter(title, content, chapter_num, output_dir)
+    
+    def _fetch_chapter(self, series_url: str, chapter_num: int, output_dir: str,
+                       should_stop: Optional[Callable[[], bool]] = None) -> Optional[Tuple[str, str]]:
+        """Fetch (title, content) without saving it, retrying transient failures and bot checks
+
+        should_stop ends a circuit-breaker pause or backoff wait early.
+        """
+        return fetch_with_retry(lambda: self._fetch_chapter_once(series_url, chapter_num, output_dir),
+                                series_url, self.retry_policy, should_stop, label=f"Chapter {chapter_num}")
+    
+    def _fetch_chapter_once(self, series_url: str, chapter_num: int, output_dir: str) -> Optional[Tuple[str, str]]:
+        """Navigate to a chapter and extract (title, content) without saving it"""
+        print(f"\n{'='*50}")
+        print(f"📚 Downloading chapter {chapter_num}")
+        print(f"{'='*50}")
+        
+        index = ChapterIndex.for_directory(output_dir)
+        chapter = self._fetch_chapter_over_http(series_url, chapter_num, index)
+        if chapter:
+            return chapter
+        # A 404 or block from the HTTP step says nothing about how the browser will do
+        take_failure()
+        
+        driver = self._acquire_driver()
+        if not driver:
+            return None
             
         try:
-            print(f"\n{'='*50}")
-            print(f"📚 Downloading chapter {chapter_num}")
-            print(f"{'='*50}")
-            
             # Navigate to chapter page
-            if not self._navigate_to_chapter(driver, series_url, chapter_num):
-                return False
+            if not self._navigate_to_chapter(driver, series_url, chapter_num, index):
+                return None
+            if self.save_raw_html:
+                self._store_raw_html(output_dir, chapter_num, driver.current_url, driver.page_source)
             
             # Extract content
-            title, content = self._get_chapter_content(driver, chapter_num)
+            title, content = self._get_chapter_content(driver, chapter_num, output_dir)
             if not content:
-                return False
+                return None
             
-            # Save chapter
-            return self._save_chapter(title, content, chapter_num, output_dir)
+            return title, content
             
         except Exception as e:
             print(f"❌ Error processing chapter {chapter_num}: {e}")
             traceback.print_exc()
-            return False
+            return None
         finally:
-            try:
-                driver.quit()
-            except:
-                pass
+            self._release_driver(driver)
     
-    def _navigate_to_chapter(self, driver, series_url: str, target_chapter: int) -> bool:
-        """Navigate to the target chapter page"""
-        chapters_list_url = series_url.rstrip('/') + "#tab-chapters-title"
-        print(f"📋 Loading chapter list: {chapters_list_url}")
+    def _fetch_chapter_over_http(self, series_url: str, chapter_num: int,
+                                 index: ChapterIndex) -> Optional[Tuple[str, str]]:
+        """Fetch a chapter from its indexed or templated URL without a browser"""
+        if not self.http_fetcher:
+            return None
         
-        # Navigate to chapter list
-        driver.get(chapters_list_url)
-        time.sleep(random.uniform(3, 6))
+        chapter_url = index.get_url(chapter_num) or index.build_url(chapter_num, NOVELBIN.url_template(series_url))
+        chapter = self._fetch_over_http(chapter_url, self.CONTENT_SELECTORS)
+        if not chapter:
+            return None
         
-        # Activate chapter tab if needed
-        self._activate_chapter_tab(driver)
+        title, content, final_url, html = chapter
+        if not self._is_valid_chapter(title, final_url, chapter_num):
+            print(f"⚠️ HTTP response for chapter {chapter_num} is not the right chapter page, using browser")
+            return None
+        self._store_raw_html(index.output_dir, chapter_num, final_url, html)
         
-        # Find target chapter URL
-        chapter_url = self._find_chapter_url(driver, target_chapter)
-        if not chapter_url:
-            print(f"❌ Chapter {target_chapter} URL not found")
-            return False
+        print(f"⚡ Fetched chapter {chapter_num} over HTTP ({len(content)} characters)")
+        index.update({chapter_num: (final_url, None)})
+        return title, content
+    
+    def _navigate_to_chapter(self, driver, series_url: str, target_chapter: int,
+                             index: Optional[ChapterIndex] = None) -> bool:
+        """Navigate to the target chapter page
+
+        Tries the chapter index first, then a URL built from the learned
+        chapter-N template, then the site's chapter archive, and only falls
+        back to scrolling the chapter list when all of them miss.
+        """
+        chapter_url = index.get_url(target_chapter) if index else None
+        
+        if chapter_url:
+            print(f"📇 Chapter {target_chapter} found in chapter index")
+        elif self._try_url_template(driver, series_url, target_chapter, index):
+            return True
+        elif self._find_in_archive(driver, series_url, target_chapter, index):
+            chapter_url = index.get_url(target_chapter)
+        else:
+            chapters_list_url = NOVELBIN.chapter_list_url(series_url)
+            print(f"📋 Loading chapter list: {chapters_list_url}")
+            
+            # Navigate to chapter list
+            driver.get(chapters_list_url)
+            wait_for_document_ready(driver)
+            
+            # Activate chapter tab if needed
+            self._activate_chapter_tab(driver)
+            
+            # Find target chapter URL, remembering every link seen on the way
+            discovered = {}
+            chapter_url = self._find_chapter_url(driver, target_chapter, discovered)
+            if index and discovered:
+                index.update(discovered)
+                index.learn_url_template()
+            
+            if not chapter_url:
+                print(f"❌ Chapter {target_chapter} URL not found")
+                report_failure(NOT_FOUND)
+                return False
         
+        # Misses while looking for the URL (a wrong template guess, a failed archive request) don't describe this load
+        take_failure()
         print(f"🌐 Found Chapter {target_chapter}: {chapter_url}")
         driver.get(chapter_url)
-        time.sleep(random.uniform(3, 6))
+        wait_for_content(driver, self.CONTENT_SELECTORS, min_length=100)
+        
+        return True
+    
+    def _find_in_archive(self, driver, series_url: str, target_chapter: int,
+                         index: Optional[ChapterIndex] = None) -> bool:
+        """Index the whole chapter archive; True if it lists the target chapter"""
+        if not index:
+            return False
+        discovered = self._discover_from_archive(series_url, index.output_dir, driver)
+        return target_chapter in discovered
+    
+    def _try_url_template(self, driver, series_url: str, target_chapter: int,
+                          index: Optional[ChapterIndex] = None) -> bool:
+        """Load the chapter straight from its templated URL; True if the page is valid"""
+        default_template = NOVELBIN.url_template(series_url)
+        if index:
+            chapter_url = index.build_url(target_chapter, default_template)
+        else:
+            chapter_url = default_template.format(n=target_chapter)
+        
+        print(f"🎯 Trying templated URL for chapter {target_chapter}: {chapter_url}")
+        try:
+            driver.get(chapter_url)
+            wait_for_document_ready(driver)
+        except Exception as e:
+            print(f"⚠️ Templated URL failed to load: {e}")
+            return False
         
+        if not self._is_valid_chapter_page(driver, target_chapter):
+            print(f"⚠️ Templated URL did not land on chapter {target_chapter}, falling back to chapter list")
+            return False
+        
+        wait_for_content(driver, self.CONTENT_SELECTORS, min_length=100)
+        
+        # Remember the real (possibly redirected) URL for next time
+        if index:
+            index.update({target_chapter: (driver.current_url, None)})
         return True
     
+    def _is_valid_chapter_page(self, driver, target_chapter: Optional[int] = None) -> bool:
+        """Check the loaded page is a real chapter (not a 404 or a redirect elsewhere)"""
+        try:
+            title = driver.title.strip()
+            current_url = driver.current_url
+        except Exception:
+            return False
+        return self._is_valid_chapter(title, current_url, target_chapter)
+    
+    def _is_valid_chapter(self, title: str, url: str, target_chapter: Optional[int] = None) -> bool:
+        """Check a chapter page's title and final URL (shared by the browser and HTTP paths)"""
+        return is_valid_chapter(title, url, target_chapter)
+    
     def _activate_chapter_tab(self, driver):
         """Activate the chapter tab if not already active"""
         try:
-            chapter_tab = driver.find_element(By.CSS_SELECTOR, "#tab-chapters-title")
-            if not chapter_tab.get_attribute("aria-expanded") == "true":
+            chapter_tab = wait_for_element(driver, "#tab-chapters-title", timeout=10, clickable=True)
+            if chapter_tab and not chapter_tab.get_attribute("aria-expanded") == "true":
                 driver.execute_script("arguments[0].scrollIntoView({behavior: 'smooth'});", chapter_tab)
-                time.sleep(random.uniform(1, 2))
                 chapter_tab.click()
-                time.sleep(random.uniform(2, 4))
+            wait_for_chapter_links(driver, timeout=10)
         except:
             pass
     
-    def _find_chapter_url(self, driver, target_chapter: int) -> Optional[str]:
-        """Find the URL for the target chapter number"""
+    def _find_chapter_url(self, driver, target_chapter: int,
+                          discovered: Optional[Dict[int, Tuple[str, Optional[int]]]] = None) -> Optional[str]:
+        """Find the URL for the target chapter number
+
+        Every chapter link seen along the way is added to `discovered` as
+        {chapter: (url, None)} so it can be stored in the chapter index.
+        """
+        if discovered is None:
+            discovered = {}
+        
         # First try to find directly in loaded links
-        chapter_url = self._find_in_visible_links(driver, target_chapter)
+        chapter_url = self._find_in_visible_links(driver, target_chapter, discovered)
         if chapter_url:
             return chapter_url
             
         # If not found, try systematic loading
-        return self._find_with_scrolling(driver, target_chapter)
+        return self._find_with_scrolling(driver, target_chapter, discovered)
     
-    def _find_in_visible_links(self, driver, target_chapter: int) -> Optional[str]:
+    def _find_in_visible_links(self, driver, target_chapter: int,
+                               discovered: Dict[int, Tuple[str, Optional[int]]]) -> Optional[str]:
         """Check currently visible links for the target chapter"""
-        all_chapter_links = self._get_current_chapter_links(driver)
-        for link in all_chapter_links:
-            try:
-                href = link.get_attribute("href")
-                if not href:
-                    continue
-                    
-                chapter_num = self._extract_chapter_number(href)
-                if chapter_num == target_chapter:
-                    return href
-            except:
-                continue
-        return None
-    
-    def _find_with_scrolling(self, driver, target_chapter: int) -> Optional[str]:
+        current_links = self._get_current_chapter_links(driver)
+        for chapter_num, href in current_links.items():
+            discovered[chapter_num] = (href, None)
+        return current_links.get(target_chapter)
+    
+    def _find_with_scrolling(self, driver, target_chapter: int,
+                             discovered: Dict[int, Tuple[str, Optional[int]]]) -> Optional[str]:
         """Systematically scroll to find the target chapter"""
         print(f"📜 Performing systematic search for chapter {target_chapter}...")
         driver.execute_script("window.scrollTo(0, 0);")
-        time.sleep(2)
+        link_count = count_links(driver)
         
         found_chapters = set()
         last_count = 0
@@ -596,25 +1039,22 @@ class NovelBinScraper(NovelScraperBase):
             # Adaptive scrolling strategy
             scroll_amount = self._calculate_scroll_amount(iteration)
             driver.execute_script(f"window.scrollBy(0, {scroll_amount});")
-            time.sleep(random.uniform(2, 4))
+            link_count = wait_for_more_links(driver, link_count, timeout=4)
             
             # Check current chapters
             current_links = self._get_current_chapter_links(driver)
             current_count = len(current_links)
             
             # Check for our target chapter
-            for link in current_links:
-                href = link.get_attribute("href")
-                if not href:
-                    continue
-                    
-                chapter_num = self._extract_chapter_number(href)
+            for chapter_num, href in current_links.items():
                 if chapter_num:
                     found_chapters.add(chapter_num)
-                    if chapter_num == target_chapter:
-                        chapter_url = href
-                        print(f"✅ Found target chapter {target_chapter}")
-                        return chapter_url
+                    discovered[chapter_num] = (href, None)
+            chapter_url = current_links.get(target_chapter)
+            
+            if chapter_url:
+                print(f"✅ Found target chapter {target_chapter}")
+                return chapter_url
             
             # Stability check
             if current_count == last_count:
@@ -647,68 +1087,44 @@ class NovelBinScraper(NovelScraperBase):
         else:
             return random.randint(1000, 1500)
     
-    def _get_current_chapter_links(self, driver):
-        """Get all currently visible chapter links"""
-        link_selectors = [
-            "//a[contains(@href, '/chapter-')]",
-            "//a[contains(@class, 'chapter')]",
-            ".chapter-item a",
-            ".list-chapter a",
-            "a[href*='chapter']"
-        ]
-        
-        for selector in link_selectors:
-            try:
-                if selector.startswith("//"):
-                    links = driver.find_elements(By.XPATH, selector)
-                else:
-                    links = driver.find_elements(By.CSS_SELECTOR, selector)
-                if links:
-                    return links
-            except:
-                continue
-        return []
+    def _get_current_chapter_links(self, driver) -> Dict[int, str]:
+        """Get {chapter: url} for all currently loaded chapter links in one round trip"""
+        return harvest_chapter_links(driver, NOVELBIN.chapter_url_patterns)
     
     def _extract_chapter_number(self, href: str) -> Optional[int]:
         """Extract chapter number from URL"""
-        patterns = [
-            r'chapter-(\d+)',
-            r'ch-(\d+)',
-            r'chapter/(\d+)',
-            r'c(\d+)',
-            r'chap-(\d+)'
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, href)
-            if match:
-                return int(match.group(1))
-        return None
-    
-    def _get_chapter_content(self, driver, chapter_num: int) -> Tuple[Optional[str], Optional[str]]:
+        return NOVELBIN.extract_chapter_number(href)
+    
+    def _get_chapter_content(self, driver, chapter_num: int,
+                             output_dir: Optional[str] = None) -> Tuple[Optional[str], Optional[str]]:
         """Extract chapter title and content"""
+        page = self._extract_page_text(driver, output_dir, fallback=True)
+        if page:
+            title, source, content = page
+            failure = chapter_failure(title, driver.current_url)
+            if failure:
+                print(f"❌ Chapter page seems invalid (title: {title})")
+                report_failure(failure)
+                return None, None
+            if not content:
+                print(f"❌ Could not extract sufficient content for chapter {chapter_num}")
+                return None, None
+            print(f"✅ Found content using: {source}")
+            return title, content
+        
         title = driver.title.strip()
-        if not title or "404" in title or "not found" in title.lower():
+        failure = chapter_failure(title, driver.current_url)
+        if failure:
             print(f"❌ Chapter page seems invalid (title: {title})")
+            report_failure(failure)
             return None, None
         
-        # Try multiple content selectors
-        content_selectors = [
-            ".chr-c", ".chapter-content", ".content", 
-            "#chr-content", ".reading-content", "article",
-            ".chapter-body", ".chapter-text", ".text-left",
-            "#chapter-content", ".entry-content", ".post-content"
-        ]
-        
-        for sel in content_selectors:
-            try:
-                content_element = driver.find_element(By.CSS_SELECTOR, sel)
-                content = content_element.text.strip()
-                if len(content) > 100:
-                    print(f"✅ Found content using selector: {sel}")
-                    return title, content
-            except:
-                continue
+        # Try content selectors, last chapter's winner first
+        found = self._find_content(driver, output_dir, self.SITE.min_content_length)
+        if found:
+            sel, content = found
+            print(f"✅ Found content using selector: {sel}")
+            return title, content.strip()
         
         # Fallback methods if no selector worked
         return self._fallback_content_extraction(driver, title, chapter_num)
@@ -808,6 +1224,7 @@ class ApplicationWindow(Tk):
         self.current_task = None
         self.current_novel = None
         self.novels = []  # Initialize novels list
+        self.novel_updates = {}  # Series URL -> new chapter numbers from the last feed check
         
         # Initialize notification handler and scrapers
         self.notification_handler = NotificationHandler(
@@ -815,15 +1232,29 @@ class ApplicationWindow(Tk):
             voice_rate=config.VOICE_RATE,
             use_greeting=config.USE_GREETING
         )
+        WebDriverManager.configure_request_pacing(config)
+        self.driver_pool = WebDriverManager.create_pool(config)
+        self.http_fetcher = WebDriverManager.create_http_fetcher(config)
         self.scrapers = {
-            "katreadingcafe": KatReadingCafeScraper(self.notification_handler),
-            "novelbin": NovelBinScraper(self.notification_handler),
-            "other": NovelBinScraper(self.notification_handler)  # Default fallback
+            KATREADINGCAFE.name: KatReadingCafeScraper(self.notification_handler, self.driver_pool, self.http_fetcher),
+            NOVELBIN.name: NovelBinScraper(self.notification_handler, self.driver_pool,
+                                           config.DOWNLOAD_WORKERS, config.PER_HOST_CONCURRENCY, self.http_fetcher)
         }
+        for scraper in self.scrapers.values():
+            scraper.save_raw_html = config.SAVE_RAW_HTML
+            scraper.script_extraction = config.SCRIPT_TEXT_EXTRACTION
+            scraper.sitemap_discovery = config.USE_SITEMAP_DISCOVERY
+            scraper.rest_api = config.USE_WP_REST_API
+            scraper.chapter_archive = config.USE_CHAPTER_ARCHIVE
+            scraper.retry_policy = WebDriverManager.create_retry_policy(config)
         
         # Initialize UI
         self.create_widgets()
-        
+
+    def _scraper_for(self, website_type: str) -> NovelScraperBase:
+        """Scraper for a website type; unregistered types like "other" get the registry's default adapter"""
+        return self.scrapers[get_adapter(website_type).name]
+
     def create_widgets(self):
         """Create and arrange all UI components"""
         # Main frame
@@ -893,6 +1324,8 @@ class ApplicationWindow(Tk):
                bg=self.button_bg).pack(side="left", padx=(0, 5))
         Button(button_frame, text="Check Chapters", command=self.check_chapters, 
                bg=self.button_bg).pack(side="left", padx=(0, 5))
+        Button(button_frame, text="Check Updates", command=self.check_updates, 
+               bg=self.button_bg).pack(side="left", padx=(0, 5))
         Button(button_frame, text="Settings", command=self.open_settings, 
                bg=self.button_bg).pack(side="left", padx=(0, 5))
         Button(button_frame, text="Open Output Folder", command=self.open_output_folder, 
@@ -934,41 +1367,36 @@ class ApplicationWindow(Tk):
                         "output_dir": os.path.join(self.config.BASE_OUTPUT_DIR, self._get_novel_folder_name(url))
                     })
                 
-                self.novel_dropdown["menu"].delete(0, "end")
+                self._refresh_novel_menu()
                 
                 if not self.novels:
                     self.novel_var.set("No novels found")
                     return
                 
-                for novel in self.novels:
-                    self.novel_dropdown["menu"].add_command(
-                        label=novel["name"], 
-                        command=lambda v=novel: self.novel_var.set(v["name"])
-                    )
-                
                 self.novel_var.set(self.novels[0]["name"])
             except Exception as e:
                 self.novels = []  # Initialize empty list on error
                 self.log(f"Error loading novels: {str(e)}")
                 self.novel_var.set("Invalid data")
     
+    def _refresh_novel_menu(self):
+        """Rebuild the novel dropdown, flagging novels the last feed check found new chapters for"""
+        self.novel_dropdown["menu"].delete(0, "end")
+        for novel in self.novels:
+            new_chapters = self.novel_updates.get(novel["url"])
+            label = f"🆕 {novel['name']} (+{len(new_chapters)})" if new_chapters else novel["name"]
+            self.novel_dropdown["menu"].add_command(
+                label=label, 
+                command=lambda v=novel: self.novel_var.set(v["name"])
+            )
+    
     def _detect_website_type(self, url: str) -> str:
         """Detect which website type based on URL"""
-        if "katreadingcafe.com" in url:
-            return "katreadingcafe"
-        elif "novelbin.me" in url:
-            return "novelbin"
-        else:
-            return "other"
+        return detect_website_type(url, default="other")
     
     def _extract_novel_name_from_url(self, url: str) -> str:
         """Extract novel name from URL"""
-        if "katreadingcafe.com" in url:
-            return url.split('/')[-2].replace('-', ' ').title()
-        elif "novelbin.me" in url:
-            return url.split('/')[-1].replace('-', ' ').title()
-        else:
-            return url.split('/')[-1].replace('-', ' ').title()
+        return novel_name_from_url(url)
     
     def _get_novel_folder_name(self, url: str) -> str:
         """Extract novel name from URL and create a safe folder name"""
@@ -1068,6 +1496,51 @@ class ApplicationWindow(Tk):
         dialog = SettingsDialog(self, self.config)
         self.wait_window(dialog)
     
+    def check_updates(self):
+        """Check every followed novel for new chapters through the sites' update feeds"""
+        if not self.novels:
+            messagebox.showerror("Error", "No novels available. Please add novels first.")
+            return
+        if not self.http_fetcher:
+            messagebox.showwarning("Check Updates", "Feed checks need plain HTTP fetching. "
+                                   "Enable it in Settings (requires requests and beautifulsoup4).")
+            return
+        
+        self.log("📰 Checking site feeds for new chapters...")
+        self.set_progress_indeterminate("Checking site feeds...")
+        threading.Thread(target=self._check_updates_thread, daemon=True).start()
+    
+    def _check_updates_thread(self):
+        """Poll each site's feed once and mark the novels that have new chapters"""
+        try:
+            novels = [(novel["url"], self._get_latest_chapter(novel["output_dir"])) for novel in self.novels]
+            updates = FeedWatcher.for_directory(self.config.BASE_OUTPUT_DIR).check(self.http_fetcher, novels)
+            self.novel_updates = {url: chapters for url, chapters in updates.items() if chapters}
+            
+            for novel in self.novels:
+                new_chapters = updates.get(novel["url"])
+                if new_chapters:
+                    self.log(f"🆕 {novel['name']}: {len(new_chapters)} new chapter(s), up to Ch. {new_chapters[-1]}")
+                elif new_chapters is not None:
+                    self.log(f"✅ {novel['name']}: up to date")
+                else:
+                    self.log(f"➖ {novel['name']}: not in the latest feed entries")
+            
+            self.after(0, self._refresh_novel_menu)
+            
+            if self.novel_updates:
+                message = f"{len(self.novel_updates)} of your novels have new chapters."
+            else:
+                message = "No new chapters found in the site feeds."
+            self.log(f"📰 {message}")
+            if self.config.VOICE_ENABLED:
+                self.notification_handler._speak_with_greeting(message)
+        except Exception as e:
+            self.log(f"❌ Error checking feeds: {e}")
+        finally:
+            self.after(0, lambda: self.set_progress_determinate())
+            self.after(0, lambda: self.reset_progress("Feed check completed"))
+    
     def check_chapters(self):
         """Check available chapters on website vs downloaded chapters"""
         if not hasattr(self, 'novels') or not self.novels:
@@ -1102,7 +1575,8 @@ class ApplicationWindow(Tk):
             
             # Get available chapters from website
             website_type = novel.get("type", "other").lower()
-            min_available, max_available, latest_volume = self._get_available_chapters_info(novel['url'], website_type)
+            min_available, max_available, latest_volume = self._get_available_chapters_info(novel['url'], website_type,
+                                                                                           output_dir)
             
             if min_available is not None and max_available is not None:
                 total_available = max_available - min_available + 1
@@ -1190,8 +1664,24 @@ class ApplicationWindow(Tk):
             self.after(0, lambda: self.reset_progress("Error during chapter check"))
             self.after(0, lambda: messagebox.showerror("Check Error", error_message))
     
-    def _get_available_chapters_info(self, series_url: str, website_type: str) -> Tuple[Optional[int], Optional[int], Optional[int]]:
-        """Get information about available chapters from the website using improved discovery logic"""
+    def _get_available_chapters_info(self, series_url: str, website_type: str,
+                                     output_dir: Optional[str] = None) -> Tuple[Optional[int], Optional[int], Optional[int]]:
+        """Get information about available chapters from the website using improved discovery logic
+
+        When output_dir has a chapter index or downloaded chapters, only
+        chapters after the last known one are checked.
+        """
+        if output_dir:
+            from_sitemap = {}
+            if ChapterIndex.for_directory(output_dir).last_known_chapter() is None:
+                from_sitemap = self._scraper_for(website_type)._discover_from_sitemap(series_url, output_dir)
+            
+            update = self._check_for_new_chapters(series_url, website_type, output_dir)
+            if update:
+                return update
+            if from_sitemap:
+                return min(from_sitemap), max(from_sitemap), ChapterIndex.for_directory(output_dir).last_known_volume()
+        
         self.log(f"🔍 Checking available chapters on {website_type}...")
         
         # Voice announcement for chapter discovery
@@ -1199,16 +1689,17 @@ class ApplicationWindow(Tk):
             discovery_message = f"Starting chapter discovery for {website_type} website. This may take a moment."
             self.notification_handler._speak_with_greeting(discovery_message)
         
-        driver = WebDriverManager.create_driver()
+        # Don't wait behind a running download; fall back to a standalone browser
+        driver = self.driver_pool.acquire(timeout=5) or self._create_standalone_driver()
         if not driver:
             self.log("❌ Could not setup browser to check chapters")
             return None, None, None
         
         try:
             if website_type == "katreadingcafe":
-                return self._get_katreadingcafe_chapters_improved(driver, series_url)
+                return self._get_katreadingcafe_chapters_improved(driver, series_url, output_dir)
             elif website_type == "novelbin":
-                return self._get_novelbin_chapters_improved(driver, series_url)
+                return self._get_novelbin_chapters_improved(driver, series_url, output_dir)
             else:
                 self.log(f"❌ Unsupported website type: {website_type}")
                 return None, None, None
@@ -1217,91 +1708,68 @@ class ApplicationWindow(Tk):
             self.log(f"❌ Error checking chapters: {e}")
             return None, None, None
         finally:
-            try:
-                driver.quit()
-            except:
-                pass
-    
-    def _get_katreadingcafe_chapters_improved(self, driver, series_url: str) -> Tuple[Optional[int], Optional[int], Optional[int]]:
-        """Get available chapters from KatReadingCafe using improved logic"""
-        driver.get(series_url)
-        time.sleep(3)
+            self.driver_pool.release(driver)
+    
+    def _create_standalone_driver(self) -> Optional[webdriver.Chrome]:
+        """Start a browser outside the pool, with the same request blocking settings"""
+        return WebDriverManager.create_driver(self.config.BLOCK_REQUESTS, self.config.BLOCK_STYLESHEETS,
+                                              self.config.PAGE_LOAD_STRATEGY)
+    
+    def _check_for_new_chapters(self, series_url: str, website_type: str,
+                                output_dir: str) -> Optional[Tuple[int, int, Optional[int]]]:
+        """Quick update check past the last known chapter; None means a full discovery is needed"""
+        index = ChapterIndex.for_directory(output_dir)
+        last_known = max(index.last_known_chapter() or 0, self._get_latest_chapter(output_dir))
+        if last_known <= 0 or website_type not in ("katreadingcafe", "novelbin"):
+            return None
+        if website_type == "katreadingcafe" and index.last_known_volume() is None:
+            return None
         
-        # First, check what's the latest volume from "New Chapter" element
-        latest_volume_from_new_chapter = None
-        new_chapter_elements = driver.find_elements(By.XPATH, "//*[contains(text(), 'New Chapter')]")
+        self.log(f"⚡ Checking for chapters after chapter {last_known}...")
+        first_known = index.first_known_chapter()
         
-        if new_chapter_elements:
-            self.log(f"Found {len(new_chapter_elements)} 'New Chapter' elements")
-            for elem in new_chapter_elements:
-                try:
-                    next_sibling = driver.execute_script("return arguments[0].nextElementSibling;", elem)
-                    if next_sibling:
-                        sibling_text = next_sibling.text
-                        vol_match = re.search(r'Vol\.\s*(\d+)', sibling_text)
-                        if vol_match:
-                            latest_volume_from_new_chapter = int(vol_match.group(1))
-                            self.log(f"✅ Latest Vol. {latest_volume_from_new_chapter} detected from 'New Chapter' sibling (should be already visible)!")
-                            break
-                except:
-                    continue
+        def get_driver():
+            return self.driver_pool.acquire(timeout=5) or self._create_standalone_driver()
         
-        # Find all available volumes
-        all_volumes = []
-        vol_elements = driver.find_elements(By.XPATH, "//span[contains(text(), 'Vol.')]")
-        for elem in vol_elements:
-            vol_text = elem.text.strip()
-            vol_match = re.search(r'Vol\.\s*(\d+)', vol_text)
-            if vol_match:
-                vol_num = int(vol_match.group(1))
-                all_volumes.append(vol_num)
-        
-        all_volumes = sorted(list(set(all_volumes)))
-        if all_volumes:
-            self.log(f"📚 Available volumes: {all_volumes}")
-            if latest_volume_from_new_chapter:
-                self.log(f"🎯 Vol. {latest_volume_from_new_chapter} is the latest (from 'New Chapter'), should be already visible")
-        
-        # Collect chapters from all volumes
-        available_chapters = []
-        for vol_num in all_volumes:
-            vol_selector = f"//span[text()='Vol. {vol_num}']"
-            
-            # Skip expanding if this is the latest volume (it's always already expanded on page load)
-            if latest_volume_from_new_chapter and vol_num == latest_volume_from_new_chapter:
-                self.log(f"⏩ Skipping Vol. {vol_num} expansion (latest volume, always already expanded on page load)")
+        prober = ChapterProber(series_url, index, self.http_fetcher, get_driver)
+        try:
+            if website_type == "katreadingcafe":
+                # Only the newest volumes can have new chapters
+                prober.driver = get_driver()
+                if not prober.driver:
+                    return None
+                prober.driver.get(series_url)
+                wait_for_document_ready(prober.driver)
+                discovered = self.scrapers["katreadingcafe"]._discover_chapters(
+                    prober.driver, min_volume=index.last_known_volume())
+                index.update(discovered)
+                new_chapters = [num for num in discovered if num > last_known]
             else:
-                # Expand older volumes since they are collapsed by default
-                try:
-                    vol_element = driver.find_element(By.XPATH, vol_selector)
-                    self.log(f"🔍 Expanding Vol. {vol_num} (older volume, needs to be expanded)...")
-                    driver.execute_script("arguments[0].scrollIntoView(true);", vol_element)
-                    time.sleep(1)
-                    vol_element.click()
-                    time.sleep(3)
-                except Exception as e:
-                    self.log(f"❌ Could not expand Vol. {vol_num}: {e}")
-                    continue
-            
-            # Collect chapter links for this volume (whether it was already visible or just expanded)
-            try:
-                links = driver.find_elements(By.TAG_NAME, "a")
-                vol_chapters = 0
-                
-                for a in links:
-                    txt = a.text.strip()
-                    # Match patterns like "Vol. 1 Ch. 1" or "Vol. 2 Ch. 15"
-                    m = re.match(rf'Vol\.\s*{vol_num}\s*Ch\.\s*(\d+)', txt)
-                    if m:
-                        chapter_num = int(m.group(1))
-                        available_chapters.append(chapter_num)
-                        vol_chapters += 1
-                
-                self.log(f"📋 Vol. {vol_num}: Found {vol_chapters} chapters")
-                
-            except Exception as e:
-                self.log(f"❌ Could not collect chapters from Vol. {vol_num}: {e}")
-                continue
+                new_chapters = list(prober.probe_forward(last_known))
+        except Exception as e:
+            self.log(f"⚠️ Quick update check failed, falling back to full discovery: {e}")
+            return None
+        finally:
+            if prober.driver:
+                self.driver_pool.release(prober.driver)
+        
+        latest = max(new_chapters) if new_chapters else last_known
+        self.log(f"📈 {len(new_chapters)} new chapter(s) since chapter {last_known}")
+        return (first_known if first_known is not None else 1), latest, index.last_known_volume()
+    
+    def _get_katreadingcafe_chapters_improved(self, driver, series_url: str,
+                                              output_dir: Optional[str] = None) -> Tuple[Optional[int], Optional[int], Optional[int]]:
+        """Get available chapters from KatReadingCafe using improved logic"""
+        driver.get(series_url)
+        wait_for_document_ready(driver)
+        
+        # Expand every collapsed volume at once and read all chapter links in one pass
+        discovered = self.scrapers["katreadingcafe"]._discover_chapters(driver)
+        available_chapters = list(discovered)
+        latest_volume = max((volume for _, volume in discovered.values()), default=None)
+        if output_dir and discovered:
+            # Lets the next check look at the newest volumes only
+            ChapterIndex.for_directory(output_dir).update(discovered)
         
         # Return chapter range and latest volume
         if available_chapters:
@@ -1315,103 +1783,62 @@ class ApplicationWindow(Tk):
                 result_message = f"Chapter discovery complete. Found {len(available_chapters)} chapters from chapter {min_chapter} to {max_chapter}."
                 self.notification_handler._speak_with_greeting(result_message)
             
-            return min_chapter, max_chapter, latest_volume_from_new_chapter
+            return min_chapter, max_chapter, latest_volume
         else:
             self.log("❌ No chapters found")
             if self.config.VOICE_ENABLED:
                 self.notification_handler._speak_with_greeting("Chapter discovery failed. No chapters were found on this website.")
             return None, None, None
     
-    def _get_novelbin_chapters_improved(self, driver, series_url: str) -> Tuple[Optional[int], Optional[int], Optional[int]]:
+    def _get_novelbin_chapters_improved(self, driver, series_url: str,
+                                        output_dir: Optional[str] = None) -> Tuple[Optional[int], Optional[int], Optional[int]]:
         """Get available chapters from NovelBin using comprehensive discovery logic"""
+        # One request for the whole list; the lazy-loading chapter tab is only scrolled when it fails
+        archived = self.scrapers["novelbin"]._discover_from_archive(series_url, output_dir, driver)
+        if archived:
+            min_found, max_found = min(archived), max(archived)
+            self.log(f"✅ Found {len(archived)} chapters (Ch. {min_found} - Ch. {max_found})")
+            if self.config.VOICE_ENABLED:
+                result_message = f"Chapter discovery complete. Found {len(archived)} chapters from chapter {min_found} to {max_found}."
+                self.notification_handler._speak_with_greeting(result_message)
+            return min_found, max_found, None
+        
         # Create the chapter list URL
-        chapters_list_url = series_url.rstrip('/') + "#tab-chapters-title"
+        chapters_list_url = NOVELBIN.chapter_list_url(series_url)
         driver.get(chapters_list_url)
-        time.sleep(random.uniform(3, 6))
+        wait_for_document_ready(driver)
         
         # Activate chapter tab if needed
         try:
             chapter_tab = driver.find_element(By.CSS_SELECTOR, "#tab-chapters-title")
             if not chapter_tab.get_attribute("aria-expanded") == "true":
                 driver.execute_script("arguments[0].scrollIntoView({behavior: 'smooth'});", chapter_tab)
-                time.sleep(random.uniform(1, 2))
                 chapter_tab.click()
-                time.sleep(random.uniform(2, 4))
+                wait_for_chapter_links(driver, timeout=10)
         except:
             pass
         
         # Advanced chapter loading strategy for NovelBin
         self.log("📜 Loading all available chapters systematically...")
         
+        found_links = {}
+        
         def get_all_chapter_links():
-            """Get all chapter links currently loaded on the page with multiple selectors"""
-            chapters = set()
-            
-            # Try multiple selectors for maximum coverage
-            selectors = [
-                "//a[contains(@href, '/chapter-')]",
-                "//a[contains(@href, 'chapter')]",
-                ".chapter-item a",
-                ".list-chapter a", 
-                "a[href*='chapter']",
-                ".chapter-list a",
-                ".chapter-number",
-                "[data-chapter]"
-            ]
-            
-            for selector in selectors:
-                try:
-                    if selector.startswith("//"):
-                        elements = driver.find_elements(By.XPATH, selector)
-                    else:
-                        elements = driver.find_elements(By.CSS_SELECTOR, selector)
-                    
-                    for element in elements:
-                        href = element.get_attribute("href")
-                        if href and 'chapter' in href.lower():
-                            # Try multiple patterns for chapter numbers
-                            patterns = [
-                                r'chapter-(\d+)',
-                                r'ch-(\d+)',
-                                r'chapter/(\d+)',
-                                r'c(\d+)',
-                                r'chap-(\d+)',
-                                r'chapter(\d+)',
-                                r'/(\d+)/?$'  # Numbers at end of URL
-                            ]
-                            
-                            for pattern in patterns:
-                                match = re.search(pattern, href)
-                                if match:
-                                    chapters.add(int(match.group(1)))
-                                    break
-                except:
-                    continue
-            
-            return chapters
+            """Get all chapter numbers currently loaded on the page in one round trip, remembering their URLs"""
+            links = harvest_chapter_links(driver, NOVELBIN.discovery_url_patterns, require_chapter_in_href=True)
+            found_links.update(links)
+            return set(links)
         
         # CRITICAL FIX: Try to navigate to chapter 0 and 1 first to force loading from beginning
         self.log("🎯 Attempting to force load early chapters by navigating to chapter 0 and 1...")
         chapter_0_or_1_found = False
         try:
             # Try common chapter 0 and 1 URL patterns (many novels start with chapter 0)
-            base_url = series_url.rstrip('/')
-            early_chapter_patterns = [
-                f"{base_url}/chapter-0",    # Try chapter 0 first
-                f"{base_url}/ch-0", 
-                f"{base_url}/c0",
-                f"{base_url}/chapter/0",
-                f"{base_url}/chapter-1",    # Then try chapter 1
-                f"{base_url}/ch-1", 
-                f"{base_url}/c1",
-                f"{base_url}/chapter/1"
-            ]
-            
-            for pattern in early_chapter_patterns:
+            for chapter_num, pattern in NOVELBIN.early_chapter_urls(series_url):
                 try:
                     self.log(f"   Trying: {pattern}")
                     driver.get(pattern)
-                    time.sleep(3)
+                    wait_for_document_ready(driver)
                     
                     # Check if we got a valid chapter page
                     current_title = driver.title.lower()
@@ -1419,20 +1846,19 @@ class ApplicationWindow(Tk):
                     
                     if ("chapter" in current_title and "404" not in current_title and 
                         "not found" not in current_title and "chapter" in current_url):
-                        chapter_num = "0" if "/chapter-0" in pattern or "/ch-0" in pattern or "/c0" in pattern or "/chapter/0" in pattern else "1"
                         self.log(f"✅ Successfully accessed chapter {chapter_num} via: {pattern}")
                         chapter_0_or_1_found = True
                         
                         # Now go back to chapter list with early chapters likely cached
                         driver.get(chapters_list_url)
-                        time.sleep(4)
+                        wait_for_document_ready(driver)
                         
                         # Reactivate chapter tab
                         try:
                             chapter_tab = driver.find_element(By.CSS_SELECTOR, "#tab-chapters-title")
                             if not chapter_tab.get_attribute("aria-expanded") == "true":
                                 chapter_tab.click()
-                                time.sleep(3)
+                                wait_for_chapter_links(driver, timeout=10)
                         except:
                             pass
                         break
@@ -1446,18 +1872,18 @@ class ApplicationWindow(Tk):
                 self.log("⚠️ Could not pre-load chapter 0 or 1, proceeding with standard discovery")
                 # Go back to chapter list URL
                 driver.get(chapters_list_url)
-                time.sleep(3)
+                wait_for_document_ready(driver)
                 
         except Exception as e:
             self.log(f"⚠️ Error during chapter 1 pre-load: {e}")
             # Ensure we're back on the chapter list page
             driver.get(chapters_list_url)
-            time.sleep(3)
+            wait_for_document_ready(driver)
         
         # Start from the very top AFTER trying to load early chapters
         self.log("📍 Starting systematic chapter discovery from top...")
         driver.execute_script("window.scrollTo(0, 0);")
-        time.sleep(3)
+        link_count = wait_for_chapter_links(driver, timeout=10)
         
         # Track chapters found during scrolling
         all_found_chapters = set()
@@ -1493,7 +1919,7 @@ class ApplicationWindow(Tk):
                 scroll_amount = random.randint(1000, 1500)
             
             driver.execute_script(f"window.scrollBy(0, {scroll_amount});")
-            time.sleep(random.uniform(2.5, 4))  # Adequate wait for lazy loading
+            link_count = wait_for_more_links(driver, link_count, timeout=4)  # Returns as soon as lazy loading adds links
             
             # Get current chapters
             current_chapters = get_all_chapter_links()
@@ -1524,11 +1950,26 @@ class ApplicationWindow(Tk):
             if current_scroll + window_height >= scroll_height - 100:
                 self.log("📝 Reached bottom of page")
                 # Final wait and check
-                time.sleep(3)
+                wait_for_more_links(driver, link_count, timeout=3)
                 final_chapters = get_all_chapter_links()
                 all_found_chapters.update(final_chapters)
                 break
         
+        # The list can stop lazy-loading early, so confirm the newest chapter by probing chapter-N URLs
+        prober = ChapterProber(series_url, http_fetcher=self.http_fetcher, get_driver=lambda: driver)
+        latest_probed = prober.find_latest(max(all_found_chapters) if all_found_chapters else None)
+        if latest_probed is not None and latest_probed not in all_found_chapters:
+            self.log(f"🔎 Chapter list stopped early, URL probing found chapters up to {latest_probed}")
+            all_found_chapters.add(latest_probed)
+        if prober.first_chapter is not None and prober.first_chapter not in all_found_chapters:
+            # Nothing came from the list, so the range starts at the chapter probing verified
+            all_found_chapters.add(prober.first_chapter)
+        
+        if output_dir and found_links:
+            index = ChapterIndex.for_directory(output_dir)
+            index.update({num: (url, None) for num, url in found_links.items()})
+            index.learn_url_template()
+        
         self.log(f"🎯 Total unique chapters discovered: {len(all_found_chapters)}")
         if all_found_chapters:
             min_found = min(all_found_chapters)
@@ -1569,17 +2010,20 @@ class ApplicationWindow(Tk):
             chapter_tab = driver.find_element(By.CSS_SELECTOR, "#tab-chapters-title")
             if not chapter_tab.get_attribute("aria-expanded") == "true":
                 driver.execute_script("arguments[0].scrollIntoView({behavior: 'smooth'});", chapter_tab)
-                time.sleep(random.uniform(1, 2))
                 chapter_tab.click()
-                time.sleep(random.uniform(2, 4))
+                wait_for_chapter_links(driver, timeout=10)
         except:
             pass
     
     def _discover_novelbin_chapters(self, driver, series_url: str) -> Set[int]:
-        """Discover all available chapters through systematic scrolling"""
+        """Discover all available chapters from the chapter archive, scrolling the list only if it fails"""
+        archived = self.scrapers["novelbin"]._discover_from_archive(series_url, driver=driver)
+        if archived:
+            return set(archived)
+        
         # Start from top
         driver.execute_script("window.scrollTo(0, 0);")
-        time.sleep(3)
+        link_count = count_links(driver)
         
         found_chapters = set()
         last_count = 0
@@ -1592,7 +2036,7 @@ class ApplicationWindow(Tk):
             # Adaptive scrolling
             scroll_amount = self._calculate_scroll_amount(iteration)
             driver.execute_script(f"window.scrollBy(0, {scroll_amount});")
-            time.sleep(random.uniform(2, 4))
+            link_count = wait_for_more_links(driver, link_count, timeout=4)
             
             # Get current chapters
             current_chapters = self._get_current_novelbin_chapters(driver, series_url)
@@ -1633,38 +2077,8 @@ class ApplicationWindow(Tk):
             return random.randint(1000, 1500)
     
     def _get_current_novelbin_chapters(self, driver, base_url: str) -> Set[int]:
-        """Get chapter numbers from currently visible links"""
-        all_chapters = set()
-        
-        # Try multiple selectors for chapter links
-        link_selector_patterns = [
-            ("//a[contains(@href, '/chapter-')]", r'chapter-(\d+)'),
-            ("//a[contains(@href, '/ch-')]", r'ch-(\d+)'),
-            ("//a[contains(@href, 'chapter')]", r'chapter/(\d+)'),
-            ("//a[contains(@href, 'chapter')]", r'c(\d+)'),
-            (".chapter-item a", r'chapter-(\d+)'),
-            (".chapter-number", r'(\d+)')
-        ]
-        
-        for selector, pattern in link_selector_patterns:
-            try:
-                if selector.startswith("//"):
-                    elements = driver.find_elements(By.XPATH, selector)
-                else:
-                    elements = driver.find_elements(By.CSS_SELECTOR, selector)
-                
-                for element in elements:
-                    href = element.get_attribute("href")
-                    if not href:
-                        continue
-                    
-                    match = re.search(pattern, href)
-                    if match:
-                        all_chapters.add(int(match.group(1)))
-            except:
-                continue
-        
-        return all_chapters
+        """Get chapter numbers from currently loaded links in one round trip"""
+        return set(harvest_chapter_links(driver))
     
     def _get_latest_chapter(self, output_dir: str) -> int:
         """Get the latest chapter number from downloaded files"""
@@ -1750,12 +2164,23 @@ class ApplicationWindow(Tk):
             # Calculate start and end chapters
             start_chapter = latest_downloaded + 1
             end_chapter = start_chapter + chapters - 1
+            website_type = novel.get("type", "other").lower()
+            
+            # NovelBin only notices the end after failed browser launches, so clamp to what the site has
+            if website_type == "novelbin":
+                _, max_available, _ = self._get_available_chapters_info(novel['url'], website_type, output_dir)
+                if max_available is not None and end_chapter > max_available:
+                    if start_chapter > max_available:
+                        self._announce_caught_up(max_available)
+                        return
+                    end_chapter = max_available
+                    chapters = end_chapter - start_chapter + 1
+                    self.log(f"📝 Only {chapters} chapter(s) available, stopping at chapter {end_chapter}")
             
             self.log(f"Will download chapters {start_chapter} to {end_chapter}")
             
             # Get the appropriate scraper
-            website_type = novel.get("type", "other").lower()
-            scraper = self.scrapers.get(website_type, self.scrapers["other"])
+            scraper = self._scraper_for(website_type)
             
             self.log(f"Using {website_type} scraper")
             
@@ -1768,48 +2193,19 @@ class ApplicationWindow(Tk):
             start_time = time.time()
             
             # Start scraping
-            downloaded = 0
-            for i in range(start_chapter, end_chapter + 1):
-                if not self.scraping:
-                    break
-                    
-                self.log(f"Attempting to download chapter {i}...")
-                
-                # Update progress with current status and time estimation
-                self.after(0, lambda curr=downloaded, tot=chapters, ch=i, st=start_time: 
-                          self.update_progress(curr, tot, f"Downloading Chapter {ch}", "Downloading", st))
-                
-                # Try to download single chapter
-                if website_type == "katreadingcafe":
-                    # For KatReadingCafe, we need to discover chapters first
-                    chapter_downloaded = scraper.scrape_chapters(novel['url'], i, i, output_dir)
-                else:
-                    # For NovelBin and others, download individual chapters
-                    chapter_downloaded = scraper._download_single_chapter(novel['url'], i, output_dir)
-                    chapter_downloaded = 1 if chapter_downloaded else 0
-                
-                if chapter_downloaded > 0:
-                    downloaded += chapter_downloaded
-                    self.log(f"✅ Successfully downloaded chapter {i}")
-                    
-                    # Update progress with success status and time estimation
-                    self.after(0, lambda curr=downloaded, tot=chapters, ch=i, st=start_time: 
-                              self.update_progress(curr, tot, f"Chapter {ch} completed", "Downloading", st))
-                    
-                    # Announce progress every 10 chapters
-                    if downloaded % 10 == 0:
-                        self.notification_handler.notify_progress(downloaded)
-                else:
-                    self.log(f"❌ Failed to download chapter {i}")
-                    # Update progress showing failure with time estimation
-                    self.after(0, lambda curr=downloaded, tot=chapters, ch=i, st=start_time: 
-                              self.update_progress(curr, tot, f"Chapter {ch} failed", "Downloading", st))
-                
-                # Add delay between chapters
-                time.sleep(random.uniform(2, 4))
+            if website_type == "katreadingcafe" or self.config.DOWNLOAD_WORKERS > 1:
+                # KatReadingCafe: discover once, then stream the whole range through one browser.
+                # NovelBin with parallel workers: let the scraper's concurrent engine run the range.
+                downloaded = self._run_batched_scraper(scraper, novel, start_chapter, end_chapter,
+                                                       chapters, output_dir, start_time)
+            else:
+                downloaded = self._run_per_chapter_scraper(scraper, novel, start_chapter, end_chapter,
+                                                           chapters, output_dir, start_time)
                 
             if self.scraping:
                 self.log(f"✅ Download completed! Successfully downloaded {downloaded} chapters.")
+                if downloaded and self.novel_updates.pop(novel["url"], None):
+                    self.after(0, self._refresh_novel_menu)
                 self.notification_handler.notify_completion(downloaded, chapters, success=downloaded > 0)
                 # Final progress update
                 self.after(0, lambda: self.update_progress(downloaded, chapters, "Download completed!"))
@@ -1836,9 +2232,84 @@ class ApplicationWindow(Tk):
             self.after(0, lambda: self.reset_progress("Error occurred during download"))
         
         finally:
+            SelectorStats.flush_all()
             self.scraping = False
             self.after(0, lambda: self.reset_progress("Ready to start..."))
     
+    def _announce_caught_up(self, latest_available: int):
+        """Report that the site has nothing past the downloaded chapters"""
+        message = f"You're caught up. There are no new chapters after chapter {latest_available} yet."
+        self.log(f"✅ Caught up: no chapters after chapter {latest_available} yet")
+        if self.config.VOICE_ENABLED:
+            self.notification_handler._speak_with_greeting(message)
+        self.after(0, lambda: messagebox.showinfo("Up to Date", message))
+    
+    def _run_per_chapter_scraper(self, scraper: NovelScraperBase, novel: dict, start_chapter: int,
+                                 end_chapter: int, chapters: int, output_dir: str, start_time: float) -> int:
+        """Download chapters one at a time, each through the scraper's single-chapter path"""
+        downloaded = 0
+        for i in range(start_chapter, end_chapter + 1):
+            if not self.scraping:
+                break
+                
+            self.log(f"Attempting to download chapter {i}...")
+            
+            # Update progress with current status and time estimation
+            self.after(0, lambda curr=downloaded, tot=chapters, ch=i, st=start_time: 
+                      self.update_progress(curr, tot, f"Downloading Chapter {ch}", "Downloading", st))
+            
+            # For NovelBin and others, download individual chapters
+            chapter_downloaded = scraper._download_single_chapter(novel['url'], i, output_dir,
+                                                                  should_stop=lambda: not self.scraping)
+            chapter_downloaded = 1 if chapter_downloaded else 0
+            
+            if chapter_downloaded > 0:
+                downloaded += chapter_downloaded
+                self.log(f"✅ Successfully downloaded chapter {i}")
+                
+                # Update progress with success status and time estimation
+                self.after(0, lambda curr=downloaded, tot=chapters, ch=i, st=start_time: 
+                          self.update_progress(curr, tot, f"Chapter {ch} completed", "Downloading", st))
+                
+                # Announce progress every 10 chapters
+                if downloaded % 10 == 0:
+                    self.notification_handler.notify_progress(downloaded)
+            else:
+                self.log(f"❌ Failed to download chapter {i}")
+                # Update progress showing failure with time estimation
+                self.after(0, lambda curr=downloaded, tot=chapters, ch=i, st=start_time: 
+                          self.update_progress(curr, tot, f"Chapter {ch} failed", "Downloading", st))
+        
+        return downloaded
+    
+    def _run_batched_scraper(self, scraper: NovelScraperBase, novel: dict, start_chapter: int,
+                             end_chapter: int, chapters: int, output_dir: str, start_time: float) -> int:
+        """Download the whole range in one scraper call, reporting progress per chapter"""
+        progress = {"downloaded": 0}
+        
+        def on_chapter(chapter_num: int, status: str):
+            if status == "downloading":
+                self.log(f"Attempting to download chapter {chapter_num}...")
+                label = f"Downloading Chapter {chapter_num}"
+            elif status == "completed":
+                progress["downloaded"] += 1
+                self.log(f"✅ Successfully downloaded chapter {chapter_num}")
+                label = f"Chapter {chapter_num} completed"
+                
+                # Announce progress every 10 chapters
+                if progress["downloaded"] % 10 == 0:
+                    self.notification_handler.notify_progress(progress["downloaded"])
+            else:
+                self.log(f"❌ Failed to download chapter {chapter_num}")
+                label = f"Chapter {chapter_num} failed"
+            
+            self.after(0, lambda curr=progress["downloaded"], tot=chapters, text=label, st=start_time:
+                      self.update_progress(curr, tot, text, "Downloading", st))
+        
+        return scraper.scrape_chapters(novel['url'], start_chapter, end_chapter, output_dir,
+                                       progress_callback=on_chapter,
+                                       should_stop=lambda: not self.scraping)
+    
     def _get_latest_chapter(self, output_dir: str) -> int:
         """Get the latest chapter number from the output directory"""
         if not os.path.exists(output_dir):
@@ -1940,8 +2411,14 @@ class ApplicationWindow(Tk):
         if self.scraping:
             if messagebox.askokcancel("Quit", "Scraping in progress. Are you sure you want to quit?"):
                 self.scraping = False
+                self.driver_pool.close_all()
+                if self.http_fetcher:
+                    self.http_fetcher.close()
                 self.destroy()
         else:
+            self.driver_pool.close_all()
+            if self.http_fetcher:
+                self.http_fetcher.close()
             self.destroy()
 
 
@@ -2031,7 +2508,7 @@ class NovelManager(Tk):
         
         Label(form_frame, text="Type:").grid(row=2, column=0, sticky="e", padx=(0, 5))
         self.type_var = StringVar(value="katreadingcafe")
-        self.type_dropdown = OptionMenu(form_frame, self.type_var, "katreadingcafe", "novelbin", "other")
+        self.type_dropdown = OptionMenu(form_frame, self.type_var, *registered_types(), "other")
         self.type_dropdown.grid(row=2, column=1, sticky="we")
         
         form_frame.columnconfigure(1, weight=1)
@@ -2145,7 +2622,7 @@ class SettingsDialog(Tk):
         self.parent = parent
         self.config = config
         self.title("Settings")
-        self.geometry("400x300")
+        self.geometry("400x785")
         
         self.create_widgets()
     
@@ -2183,6 +2660,62 @@ class SettingsDialog(Tk):
         Entry(chrome_frame, textvariable=self.chrome_var).pack(fill="x")
         Button(chrome_frame, text="Browse", command=self.select_chrome_profile).pack(anchor="e")
         
+        Label(chrome_frame, text="Reusable Browsers:").pack(anchor="w", pady=(5, 0))
+        self.pool_size_var = StringVar(value=str(self.config.DRIVER_POOL_SIZE))
+        Spinbox(chrome_frame, from_=1, to=8, textvariable=self.pool_size_var).pack(anchor="w")
+        
+        self.fresh_session_var = BooleanVar(value=self.config.DRIVER_FRESH_SESSION)
+        Checkbutton(chrome_frame, text="Clear cookies and cache between chapters", 
+                    variable=self.fresh_session_var).pack(anchor="w")
+        
+        Label(chrome_frame, text="Parallel Downloads:").pack(anchor="w", pady=(5, 0))
+        self.workers_var = StringVar(value=str(self.config.DOWNLOAD_WORKERS))
+        Spinbox(chrome_frame, from_=1, to=8, textvariable=self.workers_var).pack(anchor="w")
+        
+        self.http_fetch_var = BooleanVar(value=self.config.USE_HTTP_FETCH)
+        Checkbutton(chrome_frame, text="Fetch chapters over plain HTTP when possible", 
+                    variable=self.http_fetch_var).pack(anchor="w")
+        
+        self.raw_html_var = BooleanVar(value=self.config.SAVE_RAW_HTML)
+        Checkbutton(chrome_frame, text="Keep raw chapter HTML for offline re-extraction", 
+                    variable=self.raw_html_var).pack(anchor="w")
+        
+        self.script_text_var = BooleanVar(value=self.config.SCRIPT_TEXT_EXTRACTION)
+        Checkbutton(chrome_frame, text="Read chapter text in a single script call (faster)", 
+                    variable=self.script_text_var).pack(anchor="w")
+        
+        self.sitemap_var = BooleanVar(value=self.config.USE_SITEMAP_DISCOVERY)
+        Checkbutton(chrome_frame, text="Discover chapters from the site's sitemap", 
+                    variable=self.sitemap_var).pack(anchor="w")
+        
+        self.rest_api_var = BooleanVar(value=self.config.USE_WP_REST_API)
+        Checkbutton(chrome_frame, text="Download WordPress chapters in bulk through its API", 
+                    variable=self.rest_api_var).pack(anchor="w")
+        
+        self.chapter_archive_var = BooleanVar(value=self.config.USE_CHAPTER_ARCHIVE)
+        Checkbutton(chrome_frame, text="Read the full chapter list in one request (NovelBin)", 
+                    variable=self.chapter_archive_var).pack(anchor="w")
+        
+        self.block_requests_var = BooleanVar(value=self.config.BLOCK_REQUESTS)
+        Checkbutton(chrome_frame, text="Block ads, trackers, fonts and media", 
+                    variable=self.block_requests_var).pack(anchor="w")
+        
+        self.block_css_var = BooleanVar(value=self.config.BLOCK_STYLESHEETS)
+        Checkbutton(chrome_frame, text="Also block stylesheets where the site allows it", 
+                    variable=self.block_css_var).pack(anchor="w")
+        
+        Label(chrome_frame, text="Page Load Strategy:").pack(anchor="w", pady=(5, 0))
+        self.page_load_var = StringVar(value=self.config.PAGE_LOAD_STRATEGY)
+        OptionMenu(chrome_frame, self.page_load_var, *PAGE_LOAD_STRATEGIES).pack(anchor="w")
+        
+        Label(chrome_frame, text="Requests per Minute per Site (0 = unlimited):").pack(anchor="w", pady=(5, 0))
+        self.rate_limit_var = StringVar(value=str(self.config.RATE_LIMIT_PER_MINUTE))
+        Spinbox(chrome_frame, from_=0, to=600, textvariable=self.rate_limit_var).pack(anchor="w")
+        
+        Label(chrome_frame, text="Attempts per Chapter:").pack(anchor="w", pady=(5, 0))
+        self.retry_var = StringVar(value=str(self.config.RETRY_MAX_ATTEMPTS))
+        Spinbox(chrome_frame, from_=1, to=10, textvariable=self.retry_var).pack(anchor="w")
+        
         # Theme selection
         theme_frame = Frame(main_frame)
         theme_frame.pack(fill="x", pady=(0, 10))
@@ -2216,6 +2749,20 @@ class SettingsDialog(Tk):
         self.config.VOICE_ENABLED = self.voice_var.get()
         self.config.VOICE_RATE = int(self.rate_var.get())
         self.config.CHROME_PROFILE_PATH = self.chrome_var.get() or None
+        self.config.DRIVER_POOL_SIZE = max(1, int(self.pool_size_var.get()))
+        self.config.DRIVER_FRESH_SESSION = self.fresh_session_var.get()
+        self.config.DOWNLOAD_WORKERS = max(1, int(self.workers_var.get()))
+        self.config.USE_HTTP_FETCH = self.http_fetch_var.get()
+        self.config.SAVE_RAW_HTML = self.raw_html_var.get()
+        self.config.SCRIPT_TEXT_EXTRACTION = self.script_text_var.get()
+        self.config.USE_SITEMAP_DISCOVERY = self.sitemap_var.get()
+        self.config.USE_WP_REST_API = self.rest_api_var.get()
+        self.config.USE_CHAPTER_ARCHIVE = self.chapter_archive_var.get()
+        self.config.BLOCK_REQUESTS = self.block_requests_var.get()
+        self.config.BLOCK_STYLESHEETS = self.block_css_var.get()
+        self.config.PAGE_LOAD_STRATEGY = self.page_load_var.get()
+        self.config.RATE_LIMIT_PER_MINUTE = max(0, int(self.rate_limit_var.get()))
+        self.config.RETRY_MAX_ATTEMPTS = max(1, int(self.retry_var.get()))
         self.config.theme = self.theme_var.get()
         
         # Update notification handler if parent has one
@@ -2223,6 +2770,30 @@ class SettingsDialog(Tk):
             self.parent.notification_handler.voice_enabled = self.config.VOICE_ENABLED
             self.parent.notification_handler.voice_rate = self.config.VOICE_RATE
         
+        # Pool settings apply to browsers started after this point
+        if hasattr(self.parent, 'driver_pool'):
+            self.parent.driver_pool.size = max(self.config.DRIVER_POOL_SIZE, self.config.DOWNLOAD_WORKERS)
+            self.parent.driver_pool.clear_between_leases = self.config.DRIVER_FRESH_SESSION
+        
+        WebDriverManager.configure_request_pacing(self.config)
+        
+        if hasattr(self.parent, 'http_fetcher'):
+            if self.config.USE_HTTP_FETCH and not self.parent.http_fetcher:
+                self.parent.http_fetcher = WebDriverManager.create_http_fetcher(self.config)
+        
+        if hasattr(self.parent, 'scrapers'):
+            for scraper in self.parent.scrapers.values():
+                scraper.http_fetcher = self.parent.http_fetcher if self.config.USE_HTTP_FETCH else None
+                scraper.save_raw_html = self.config.SAVE_RAW_HTML
+                scraper.script_extraction = self.config.SCRIPT_TEXT_EXTRACTION
+                scraper.sitemap_discovery = self.config.USE_SITEMAP_DISCOVERY
+                scraper.rest_api = self.config.USE_WP_REST_API
+                scraper.chapter_archive = self.config.USE_CHAPTER_ARCHIVE
+                scraper.retry_policy = WebDriverManager.create_retry_policy(self.config)
+                if isinstance(scraper, NovelBinScraper):
+                    scraper.download_workers = self.config.DOWNLOAD_WORKERS
+                    scraper.per_host_limit = self.config.PER_HOST_CONCURRENCY
+        
         self.config.save()
         messagebox.showinfo("Info", "Settings saved successfully")
         self.destroy()
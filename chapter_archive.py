@@ -0,0 +1,112 @@
+"""
+Chapter-archive discovery for sites whose chapter list lazy-loads from an AJAX endpoint
+Reads the novel id off the series page and fetches the whole archive in one request, so discovery no longer scrolls
+"""
+
+import html as html_lib
+import re
+from typing import Dict, Optional, Tuple
+from urllib.parse import urljoin, urlparse
+
+from http_fetch import HttpChapterFetcher
+from rate_limit import get_rate_limiter
+from sitemap_discovery import novel_slug, url_matches_novel
+from site_adapters import SiteAdapter
+
+_NOVEL_ID_PATTERNS = [
+    re.compile(r'data-novel-id=["\']([^"\']+)["\']', re.IGNORECASE),
+    re.compile(r'\bnovelId\s*[=:]\s*["\']([^"\']+)["\']')
+]
+_ANCHOR_PATTERN = re.compile(r'<a\s([^>]*)>(.*?)</a>', re.IGNORECASE | re.DOTALL)
+_HREF_PATTERN = re.compile(r'href=["\']([^"\']+)["\']', re.IGNORECASE)
+_TITLE_ATTR_PATTERN = re.compile(r'title=["\']([^"\']*)["\']', re.IGNORECASE)
+_TAG_PATTERN = re.compile(r'<[^>]+>')
+_TITLE_CHAPTER_PATTERN = re.compile(r'\bChapter\s*(\d+)', re.IGNORECASE)
+
+# Same-origin fetch from the loaded series page, for when plain HTTP gets a bot check
+_FETCH_SCRIPT = """
+const done = arguments[arguments.length - 1];
+fetch(arguments[0], {credentials: 'same-origin', headers: {'X-Requested-With': 'XMLHttpRequest'}})
+    .then(response => response.ok ? response.text() : null)
+    .then(done, () => done(null));
+"""
+
+
+def find_novel_id(html: str) -> Optional[str]:
+    """The id the series page passes to its chapter-archive request, if present"""
+    for pattern in _NOVEL_ID_PATTERNS:
+        match = pattern.search(html)
+        if match:
+            return html_lib.unescape(match.group(1)).strip()
+    return None
+
+
+def archive_url(series_url: str, adapter: SiteAdapter, novel_id: Optional[str] = None) -> str:
+    """URL of the full chapter archive; the series slug stands in for a missing id"""
+    return urljoin(series_url, adapter.chapter_archive_path.format(novel_id=novel_id or novel_slug(series_url)))
+
+
+def parse_archive(html: str, series_url: str, adapter: SiteAdapter) -> Dict[int, Tuple[str, Optional[int]]]:
+    """Return {chapter_num: (url, None)} for the novel's chapter links in the archive HTML"""
+    slug = novel_slug(series_url)
+    series = series_url.split('#')[0].rstrip('/')
+    chapters: Dict[int, Tuple[str, Optional[int]]] = {}
+    for attributes, text in _ANCHOR_PATTERN.findall(html):
+        href = _HREF_PATTERN.search(attributes)
+        if not href:
+            continue
+        url = urljoin(series_url, html_lib.unescape(href.group(1)))
+        if not url_matches_novel(url, slug) or url.rstrip('/') == series:
+            continue
+
+        chapter_num = adapter.extract_chapter_number(urlparse(url).path)
+        if chapter_num is None:
+            title = _TITLE_ATTR_PATTERN.search(attributes)
+            label = html_lib.unescape(title.group(1) if title else _TAG_PATTERN.sub("", text))
+            match = _TITLE_CHAPTER_PATTERN.search(label)
+            chapter_num = int(match.group(1)) if match else None
+        if chapter_num is not None:
+            chapters.setdefault(chapter_num, (url, None))
+    return dict(sorted(chapters.items()))
+
+
+def _report(chapters: Dict[int, Tuple[str, Optional[int]]], how: str) -> Dict[int, Tuple[str, Optional[int]]]:
+    if chapters:
+        print(f"📚 Chapter archive lists {len(chapters)} chapters (Ch. {min(chapters)} - Ch. {max(chapters)}) {how}")
+    return chapters
+
+
+def fetch_chapter_archive(fetcher: HttpChapterFetcher, series_url: str,
+                          adapter: SiteAdapter) -> Dict[int, Tuple[str, Optional[int]]]:
+    """Series page plus one archive request over plain HTTP; {} when either fails"""
+    if not adapter.chapter_archive_path:
+        return {}
+    page = fetcher.get_html(series_url.split('#')[0])
+    if not page:
+        return {}
+    archive = fetcher.get_html(archive_url(series_url, adapter, find_novel_id(page[0])))
+    if not archive:
+        return {}
+    return _report(parse_archive(archive[0], series_url, adapter), "over HTTP")
+
+
+def archive_via_browser(driver, series_url: str, adapter: SiteAdapter) -> Dict[int, Tuple[str, Optional[int]]]:
+    """Same lookup from inside the browser, reusing its cookies once a bot check has been passed
+
+    Loads the series page only when the driver isn't already on it.
+    """
+    if not adapter.chapter_archive_path:
+        return {}
+    series = series_url.split('#')[0].rstrip('/')
+    try:
+        if driver.current_url.split('#')[0].rstrip('/') != series:
+            driver.get(series_url)
+        url = archive_url(series_url, adapter, find_novel_id(driver.page_source))
+        get_rate_limiter().wait(url)
+        html = driver.execute_async_script(_FETCH_SCRIPT, url)
+    except Exception as e:
+        print(f"⚠️ Chapter archive request failed in the browser: {e}")
+        return {}
+    if not html:
+        return {}
+    return _report(parse_archive(html, series_url, adapter), "in the browser")
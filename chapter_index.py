@@ -0,0 +1,194 @@
+"""
+On-disk chapter URL index per novel
+Stores chapter number -> URL/volume in chapters/<novel>/.index.json so runs can skip re-discovery
+"""
+
+import datetime
+import json
+import os
+import re
+import threading
+from typing import Dict, Iterable, Optional, Tuple
+
+# Chapter number patterns that can be turned into a URL template (last match wins)
+TEMPLATE_PATTERNS = [
+    re.compile(r'chapter-(\d+)'),
+    re.compile(r'ch-(\d+)'),
+    re.compile(r'chapter/(\d+)'),
+    re.compile(r'chap-(\d+)')
+]
+
+
+def infer_url_template(urls: Iterable[str]) -> Optional[str]:
+    """Learn a chapter URL template containing '{n}' from sample chapter URLs
+
+    The part after the number is kept only when every sample shares it;
+    per-chapter title slugs ("chapter-12-the-duel") are dropped.
+    """
+    parts = []
+    for url in urls:
+        for pattern in TEMPLATE_PATTERNS:
+            matches = list(pattern.finditer(url))
+            if matches:
+                m = matches[-1]
+                parts.append((url[:m.start(1)], url[m.end(1):]))
+                break
+
+    if not parts:
+        return None
+
+    prefix, suffix = parts[0]
+    if any(p != prefix for p, _ in parts):
+        return None
+
+    if len(parts) > 1:
+        keep_suffix = all(s == suffix for _, s in parts)
+    else:
+        keep_suffix = not suffix.startswith("-")
+
+    return prefix + "{n}" + (suffix if keep_suffix else "")
+
+
+class ChapterIndex:
+    """Persistent chapter number -> URL map for one novel folder"""
+
+    INDEX_FILENAME = ".index.json"
+    VERSION = 1
+
+    _instances: Dict[str, "ChapterIndex"] = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, output_dir: str):
+        self.output_dir = output_dir
+        self.path = os.path.join(output_dir, self.INDEX_FILENAME)
+        self.chapters: Dict[int, dict] = {}
+        self.url_template: Optional[str] = None
+        self._lock = threading.RLock()
+        self.load()
+
+    @classmethod
+    def for_directory(cls, output_dir: str) -> "ChapterIndex":
+        """Return the shared index for a novel folder so threads never write over each other"""
+        key = os.path.abspath(output_dir)
+        with cls._instances_lock:
+            if key not in cls._instances:
+                cls._instances[key] = cls(output_dir)
+            return cls._instances[key]
+
+    def load(self):
+        """Load the index from disk, starting empty if it is missing or unreadable"""
+        with self._lock:
+            self.chapters = {}
+            self.url_template = None
+            if not os.path.exists(self.path):
+                return
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                self.url_template = data.get("url_template")
+                for chapter_num, entry in data.get("chapters", {}).items():
+                    if entry.get("url"):
+                        self.chapters[int(chapter_num)] = entry
+            except (OSError, ValueError) as e:
+                print(f"⚠️ Ignoring unreadable chapter index {self.path}: {e}")
+                self.chapters = {}
+
+    def save(self):
+        """Write the index atomically so an interrupted run never leaves a broken file"""
+        with self._lock:
+            os.makedirs(self.output_dir, exist_ok=True)
+            data = {
+                "version": self.VERSION,
+                "updated_at": datetime.datetime.now().isoformat(timespec="seconds"),
+                "url_template": self.url_template,
+                "chapters": {str(num): self.chapters[num] for num in sorted(self.chapters)}
+            }
+            tmp_path = self.path + ".tmp"
+            try:
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump(data, f, indent=1)
+                os.replace(tmp_path, self.path)
+            except OSError as e:
+                print(f"⚠️ Could not save chapter index: {e}")
+
+    def update(self, discovered: Dict[int, Tuple[str, Optional[int]]]) -> int:
+        """Merge newly discovered {chapter: (url, volume)} entries and save; returns how many changed"""
+        changed = 0
+        now = datetime.datetime.now().isoformat(timespec="seconds")
+        with self._lock:
+            for chapter_num, (url, volume) in discovered.items():
+                if not url:
+                    continue
+                existing = self.chapters.get(chapter_num)
+                if existing and existing.get("url") == url and (volume is None or existing.get("volume") == volume):
+                    continue
+                self.chapters[chapter_num] = {
+                    "url": url,
+                    "volume": volume if volume is not None else (existing or {}).get("volume"),
+                    "discovered_at": now
+                }
+                changed += 1
+            if changed:
+                self.save()
+        return changed
+
+    def remove(self, chapter_num: int):
+        """Drop a stale entry (e.g. a URL that now 404s)"""
+        with self._lock:
+            if self.chapters.pop(chapter_num, None) is not None:
+                self.save()
+
+    def learn_url_template(self) -> Optional[str]:
+        """Infer the chapter URL template from the highest indexed chapters and remember it"""
+        with self._lock:
+            samples = [self.chapters[num]["url"] for num in sorted(self.chapters)[-2:]]
+            template = infer_url_template(samples)
+            if template and template != self.url_template:
+                self.url_template = template
+                self.save()
+            return self.url_template
+
+    def set_url_template(self, template: str):
+        with self._lock:
+            if template != self.url_template:
+                self.url_template = template
+                self.save()
+
+    def build_url(self, chapter_num: int, default_template: Optional[str] = None) -> Optional[str]:
+        """Build a chapter URL from the learned template (or the given default)"""
+        template = self.url_template or self.learn_url_template() or default_template
+        return template.format(n=chapter_num) if template else None
+
+    def get_url(self, chapter_num: int) -> Optional[str]:
+        with self._lock:
+            entry = self.chapters.get(chapter_num)
+            return entry["url"] if entry else None
+
+    def last_known_chapter(self) -> Optional[int]:
+        with self._lock:
+            return max(self.chapters) if self.chapters else None
+
+    def first_known_chapter(self) -> Optional[int]:
+        with self._lock:
+            return min(self.chapters) if self.chapters else None
+
+    def last_known_volume(self) -> Optional[int]:
+        with self._lock:
+            volumes = [entry["volume"] for entry in self.chapters.values() if entry.get("volume") is not None]
+            return max(volumes) if volumes else None
+
+    def last_discovered_at(self) -> Optional[datetime.datetime]:
+        """When the most recent entry was added, for incremental syncs"""
+        with self._lock:
+            stamps = [entry["discovered_at"] for entry in self.chapters.values() if entry.get("discovered_at")]
+            return datetime.datetime.fromisoformat(max(stamps)) if stamps else None
+
+    def covers(self, end: int) -> bool:
+        """True when everything up to `end` has already been discovered"""
+        last_known = self.last_known_chapter()
+        return last_known is not None and end <= last_known
+
+    def as_chapter_map(self) -> Dict[int, Tuple[str, Optional[int]]]:
+        """Return the index in the {chapter: (url, volume)} shape the scrapers use"""
+        with self._lock:
+            return {num: (entry["url"], entry.get("volume")) for num, entry in self.chapters.items()}
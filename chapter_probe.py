@@ -0,0 +1,155 @@
+"""
+Chapter existence probing by URL
+Checks whether chapter N exists by loading its chapter-N URL (plain HTTP first, browser as fallback)
+"""
+
+from typing import Callable, Dict, Optional
+
+from chapter_index import ChapterIndex
+from http_fetch import is_challenge_title
+from link_harvest import extract_chapter_number
+from page_waits import wait_for_document_ready
+from retry_policy import BLOCKED, NOT_FOUND
+from site_adapters import NOVELBIN
+
+MAX_FORWARD_PROBES = 50  # Most chapters a single update check will walk forward
+MAX_CHAPTER_SEARCH = 20000  # Upper bound for the latest-chapter search
+
+
+def chapter_failure(title: str, url: str, target_chapter: Optional[int] = None) -> Optional[str]:
+    """Why a loaded page isn't the chapter (BLOCKED or NOT_FOUND), or None when it is
+
+    Only download paths should pass this to report_failure(); probes and
+    URL guesses are expected to miss.
+    """
+    if is_challenge_title(title):
+        return BLOCKED
+    if not title or "404" in title or "not found" in title.lower():
+        return NOT_FOUND
+
+    # When probing a guessed URL, also make sure we weren't redirected elsewhere
+    if target_chapter is not None:
+        if "chapter" not in url.lower() or extract_chapter_number(url) != target_chapter:
+            return NOT_FOUND
+    return None
+
+
+def is_valid_chapter(title: str, url: str, target_chapter: Optional[int] = None) -> bool:
+    """Check a chapter page's title and final URL (not a 404, a bot check or a redirect elsewhere)"""
+    return chapter_failure(title, url, target_chapter) is None
+
+
+class ChapterProber:
+    """Answers "does chapter N exist?" with as few page loads as possible
+
+    get_driver is only called when plain HTTP can't give an answer (missing
+    requests/bs4, a bot check, a network error). The caller owns any driver it
+    hands out and should release `prober.driver` when done.
+    """
+
+    def __init__(self, series_url: str, index: Optional[ChapterIndex] = None, http_fetcher=None,
+                 get_driver: Optional[Callable[[], object]] = None):
+        self.default_template = NOVELBIN.url_template(series_url)
+        self.index = index
+        self.http_fetcher = http_fetcher
+        self.get_driver = get_driver
+        self.driver = None
+        self.requests = 0
+        self.first_chapter: Optional[int] = None  # Chapter 0 or 1, once find_latest has verified it
+
+    def chapter_url(self, chapter_num: int) -> str:
+        if self.index:
+            return self.index.get_url(chapter_num) or self.index.build_url(chapter_num, self.default_template)
+        return self.default_template.format(n=chapter_num)
+
+    def exists(self, chapter_num: int) -> Optional[str]:
+        """Return the chapter's final URL if it exists, otherwise None"""
+        url = self.chapter_url(chapter_num)
+        self.requests += 1
+
+        if self.http_fetcher:
+            result = self.http_fetcher.probe(url)
+            if result is not None:
+                status, title, final_url = result
+                if status == 200 and is_valid_chapter(title, final_url, chapter_num):
+                    return final_url
+                return None
+
+        if self.driver is None and self.get_driver:
+            self.driver = self.get_driver()
+        if not self.driver:
+            return None
+
+        try:
+            self.driver.get(url)
+            wait_for_document_ready(self.driver)
+            title = self.driver.title.strip()
+            final_url = self.driver.current_url
+        except Exception as e:
+            print(f"⚠️ Could not load chapter {chapter_num} for probing: {e}")
+            return None
+        return final_url if is_valid_chapter(title, final_url, chapter_num) else None
+
+    def probe_forward(self, last_known: int, max_probes: int = MAX_FORWARD_PROBES) -> Dict[int, str]:
+        """Probe last_known+1, +2, ... and stop at the first missing chapter; returns {chapter: url}"""
+        found = {}
+        for chapter_num in range(last_known + 1, last_known + 1 + max_probes):
+            url = self.exists(chapter_num)
+            if not url:
+                break
+            found[chapter_num] = url
+            print(f"🆕 Chapter {chapter_num} is available")
+        else:
+            print(f"📝 Stopped after {max_probes} new chapters, more may be available")
+
+        if self.index and found:
+            self.index.update({num: (url, None) for num, url in found.items()})
+        return found
+
+    def find_latest(self, known_good: Optional[int] = None, max_chapter: int = MAX_CHAPTER_SEARCH) -> Optional[int]:
+        """Find the newest chapter with an exponential then binary search over chapter URLs
+
+        known_good is a chapter already known to exist (e.g. the highest one
+        seen in the chapter list); without it the search starts at chapter 1
+        (or 0), and the one that exists is kept in first_chapter.
+        Assumes chapters are numbered without gaps, so a missing chapter in
+        the middle of a novel can make it stop early.
+        Costs about 2 * log2(distance) requests: searching a 3000-chapter novel
+        from chapter 1 takes 23 probes after the chapter 1 check, starting a
+        hundred chapters short of the end takes 13.
+        """
+        start_requests = self.requests
+        low = known_good
+        if low is None:
+            if self.exists(1):
+                low = 1
+            elif self.exists(0):
+                low = 0
+            else:
+                print("❌ Neither chapter 0 nor chapter 1 could be loaded")
+                return None
+            self.first_chapter = low
+
+        # Exponential phase: double the step until a chapter is missing
+        step = 1
+        high = None
+        while low + step <= max_chapter:
+            if self.exists(low + step):
+                low += step
+                step *= 2
+            else:
+                high = low + step
+                break
+        if high is None:
+            high = max_chapter + 1
+
+        # Binary phase: low always exists, high never does
+        while high - low > 1:
+            mid = (low + high) // 2
+            if self.exists(mid):
+                low = mid
+            else:
+                high = mid
+
+        print(f"🔎 Latest chapter by URL probing: {low} ({self.requests - start_requests} requests)")
+        return low
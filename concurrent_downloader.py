@@ -0,0 +1,114 @@
+"""
+Concurrent chapter download engine
+Fetches several chapters in parallel (bounded per host) but saves them strictly in chapter order
+"""
+
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, Optional, Tuple
+from urllib.parse import urlparse
+
+from retry_policy import release_while_waiting
+
+# One semaphore per (host, limit), shared by every downloader in the process using that limit
+_host_semaphores: Dict[Tuple[str, int], threading.BoundedSemaphore] = {}
+_host_semaphores_lock = threading.Lock()
+
+
+def get_host_semaphore(url: str, limit: int) -> threading.BoundedSemaphore:
+    """Return the shared in-flight limiter for the URL's host
+
+    Keyed on the limit as well, so a changed per-host setting takes effect
+    on the next run instead of reusing the first run's semaphore.
+    """
+    key = (urlparse(url).netloc.lower() or url, max(1, limit))
+    with _host_semaphores_lock:
+        if key not in _host_semaphores:
+            _host_semaphores[key] = threading.BoundedSemaphore(key[1])
+        return _host_semaphores[key]
+
+
+class ConcurrentChapterDownloader:
+    """Runs chapter fetches on a thread pool and commits results in order
+
+    fetch(chapter_num) returns (title, content) or None and must be safe to
+    call from several threads. commit(title, content, chapter_num) saves a
+    chapter and is only ever called from the calling thread, in ascending
+    chapter order, so "latest saved chapter" resume logic stays correct even
+    if the run is interrupted.
+
+    At most min(max_workers, per_host_limit) chapters are in flight, since
+    every chapter of a run comes from the same site; a per_host_limit of 0
+    follows max_workers. A fetch gives up its host slot while fetch_with_retry
+    is backing off, so a retrying chapter doesn't stall the others.
+    """
+
+    def __init__(self, max_workers: int = 4, per_host_limit: int = 0, max_consecutive_failures: int = 3):
+        self.max_workers = max(1, max_workers)
+        self.per_host_limit = max(1, per_host_limit or self.max_workers)
+        self.max_consecutive_failures = max_consecutive_failures
+
+    def run(self, host_url: str, chapters: Iterable[int],
+            fetch: Callable[[int], Optional[Tuple[str, str]]],
+            commit: Callable[[str, str, int], bool],
+            progress_callback: Optional[Callable[[int, str], None]] = None,
+            should_stop: Optional[Callable[[], bool]] = None) -> int:
+        """Download the given chapters; returns how many were committed"""
+        semaphore = get_host_semaphore(host_url, self.per_host_limit)
+        pending_chapters = deque(chapters)
+        in_flight = deque()
+        downloaded = 0
+        consecutive_failures = 0
+
+        def limited_fetch(chapter_num: int):
+            with semaphore, release_while_waiting(semaphore):
+                if should_stop and should_stop():
+                    return None
+                return fetch(chapter_num)
+
+        executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="chapter")
+        try:
+            # Keep only a small window submitted so a stop doesn't waste many fetches
+            def fill_window():
+                while pending_chapters and len(in_flight) < self.max_workers * 2:
+                    chapter_num = pending_chapters.popleft()
+                    in_flight.append((chapter_num, executor.submit(limited_fetch, chapter_num)))
+
+            fill_window()
+            while in_flight:
+                if should_stop and should_stop():
+                    print("⏹️ Stop requested, discarding chapters still in flight")
+                    break
+
+                chapter_num, future = in_flight.popleft()
+                if progress_callback:
+                    progress_callback(chapter_num, "downloading")
+
+                try:
+                    result = future.result()
+                except Exception as e:
+                    print(f"❌ Error fetching chapter {chapter_num}: {e}")
+                    result = None
+
+                title, content = result if result else (None, None)
+                if content and commit(title, content, chapter_num):
+                    downloaded += 1
+                    consecutive_failures = 0
+                    if progress_callback:
+                        progress_callback(chapter_num, "completed")
+                else:
+                    consecutive_failures += 1
+                    if progress_callback:
+                        progress_callback(chapter_num, "failed")
+
+                    if self.max_consecutive_failures and consecutive_failures >= self.max_consecutive_failures:
+                        print(f"🛑 Stopping after {self.max_consecutive_failures} consecutive failures")
+                        break
+
+                fill_window()
+        finally:
+            # Later chapters that were already fetched are dropped, never saved out of order
+            executor.shutdown(wait=True, cancel_futures=True)
+
+        return downloaded
@@ -0,0 +1,220 @@
+"""
+Reusable Chrome driver pool shared by the CLI and GUI scrapers
+Keeps browsers alive between chapters and recycles them when they get heavy
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Optional
+
+# psutil is optional: without it, memory-based recycling is skipped
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
+
+class PooledDriver:
+    """Bookkeeping for one browser owned by the pool"""
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.page_loads = 0
+        self.leases = 0
+        self.created_at = time.time()
+        self.raw_get = driver.get
+
+        # Count every navigation so the pool knows when to recycle the browser
+        def counted_get(url):
+            self.page_loads += 1
+            return self.raw_get(url)
+
+        driver.get = counted_get
+
+
+class ChromeDriverPool:
+    """Hands out Chrome drivers on lease instead of starting a new browser per chapter"""
+
+    def __init__(self, driver_factory: Callable[[], Optional[object]], size: int = 1,
+                 max_page_loads: int = 50, max_rss_mb: int = 1024, clear_between_leases: bool = True):
+        self.driver_factory = driver_factory
+        self.size = max(1, size)
+        self.max_page_loads = max_page_loads
+        self.max_rss_mb = max_rss_mb
+        self.clear_between_leases = clear_between_leases
+
+        self._condition = threading.Condition()
+        self._idle: List[PooledDriver] = []
+        self._leased: Dict[int, PooledDriver] = {}
+        self._total = 0
+        self._closed = False
+
+    def acquire(self, timeout: Optional[float] = None):
+        """Lease a healthy driver, starting a new one if the pool has room"""
+        with self._condition:
+            while True:
+                if self._closed:
+                    return None
+                if self._idle:
+                    entry = self._idle.pop()
+                    break
+                if self._total < self.size:
+                    self._total += 1
+                    entry = None
+                    break
+                if not self._condition.wait(timeout):
+                    print("⚠️ Timed out waiting for a free browser")
+                    return None
+
+        # Idle browsers can die (crash, killed by the OS) while waiting for a lease
+        if entry is not None and not self._is_healthy(entry):
+            print("♻️ Pooled browser failed health check, starting a new one")
+            self._quit(entry.driver)
+            entry = None
+
+        if entry is None:
+            driver = self.driver_factory()
+            if not driver:
+                with self._condition:
+                    self._total -= 1
+                    self._condition.notify()
+                return None
+            entry = PooledDriver(driver)
+
+        entry.leases += 1
+        with self._condition:
+            self._leased[id(entry.driver)] = entry
+        return entry.driver
+
+    def release(self, driver, discard: bool = False):
+        """Return a driver to the pool, recycling it if it is broken or worn out"""
+        if driver is None:
+            return
+
+        with self._condition:
+            entry = self._leased.pop(id(driver), None)
+
+        if entry is None:
+            # Not ours, just close it
+            self._quit(driver)
+            return
+
+        reason = None
+        if discard:
+            reason = "discarded by caller"
+        elif self._closed:
+            reason = "pool closed"
+        elif not self._is_healthy(entry):
+            reason = "failed health check"
+        else:
+            reason = self._recycle_reason(entry)
+
+        if reason is None and self.clear_between_leases and not self._reset_session(entry):
+            reason = "could not clear session"
+
+        if reason:
+            print(f"♻️ Recycling browser ({reason})")
+            self._quit(entry.driver)
+            with self._condition:
+                self._total -= 1
+                self._condition.notify()
+            return
+
+        with self._condition:
+            self._idle.append(entry)
+            self._condition.notify()
+
+    @contextmanager
+    def lease(self, timeout: Optional[float] = None):
+        """Context manager wrapper around acquire/release"""
+        driver = self.acquire(timeout)
+        try:
+            yield driver
+        finally:
+            if driver is not None:
+                self.release(driver)
+
+    def close_all(self):
+        """Quit every browser owned by the pool"""
+        with self._condition:
+            self._closed = True
+            entries = self._idle + list(self._leased.values())
+            self._idle = []
+            self._leased = {}
+            self._total = 0
+            self._condition.notify_all()
+
+        for entry in entries:
+            self._quit(entry.driver)
+        if entries:
+            print(f"👋 Closed {len(entries)} pooled browser(s)")
+
+    def _is_healthy(self, entry: PooledDriver) -> bool:
+        """Check that the browser still answers commands"""
+        try:
+            return entry.driver.execute_script("return 1;") == 1 and bool(entry.driver.window_handles)
+        except Exception:
+            return False
+
+    def _recycle_reason(self, entry: PooledDriver) -> Optional[str]:
+        """Return why the browser should be replaced, or None to keep it"""
+        if self.max_page_loads and entry.page_loads >= self.max_page_loads:
+            return f"{entry.page_loads} page loads"
+
+        rss_mb = self._get_rss_mb(entry.driver)
+        if self.max_rss_mb and rss_mb is not None and rss_mb >= self.max_rss_mb:
+            return f"{rss_mb:.0f} MB memory"
+
+        return None
+
+    def _get_rss_mb(self, driver) -> Optional[float]:
+        """Resident memory of chromedriver plus all Chrome processes it spawned"""
+        if not PSUTIL_AVAILABLE:
+            return None
+        try:
+            root = psutil.Process(driver.service.process.pid)
+            processes = [root] + root.children(recursive=True)
+            total = 0
+            for process in processes:
+                try:
+                    total += process.memory_info().rss
+                except psutil.Error:
+                    continue
+            return total / (1024 * 1024)
+        except Exception:
+            return None
+
+    def _reset_session(self, entry: PooledDriver) -> bool:
+        """Clear cookies, cache and extra tabs so the next lease looks like a fresh browser"""
+        driver = entry.driver
+        try:
+            handles = driver.window_handles
+            for handle in handles[1:]:
+                driver.switch_to.window(handle)
+                driver.close()
+            driver.switch_to.window(handles[0])
+
+            try:
+                driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+                driver.execute_cdp_cmd("Network.clearBrowserCache", {})
+            except Exception:
+                driver.delete_all_cookies()
+
+            try:
+                driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+            except Exception:
+                pass
+
+            # Navigate away without counting it as a page load
+            entry.raw_get("about:blank")
+            return True
+        except Exception:
+            return False
+
+    def _quit(self, driver):
+        try:
+            driver.quit()
+        except Exception:
+            pass
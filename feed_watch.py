@@ -0,0 +1,183 @@
+"""
+Feed-driven update detection for followed novels
+Polls each site's feed or latest-updates page once with a conditional GET and matches the entries to the novels being followed
+"""
+
+import datetime
+import html as html_lib
+import json
+import os
+import re
+import threading
+import xml.etree.ElementTree as ET
+from typing import Dict, List, Optional, Sequence, Tuple
+from urllib.parse import urljoin, urlparse
+
+from http_fetch import HttpChapterFetcher
+from link_harvest import VOLUME_CHAPTER_PATTERN
+from site_adapters import ADAPTERS, SiteAdapter, adapter_for_url
+from sitemap_discovery import novel_slug, title_matches_novel, url_matches_novel
+
+_ANCHOR_PATTERN = re.compile(r'<a\s[^>]*href=["\']([^"\']+)["\'][^>]*>(.*?)</a>', re.IGNORECASE | re.DOTALL)
+_TAG_PATTERN = re.compile(r'<[^>]+>')
+_TITLE_CHAPTER_PATTERN = re.compile(r'\bCh(?:apter|\.)?\s*(\d+)', re.IGNORECASE)
+
+
+def _local_name(tag: str) -> str:
+    return tag.rsplit('}', 1)[-1]
+
+
+def parse_feed(body: str, base_url: str) -> List[Tuple[str, str]]:
+    """Return (link, title) entries from RSS, Atom or an HTML listing page"""
+    head = body.lstrip()[:500].lower()
+    if head.startswith("<?xml") or "<rss" in head or "<feed" in head:
+        try:
+            root = ET.fromstring(body.encode("utf-8"))
+        except ET.ParseError as e:
+            print(f"⚠️ Could not parse feed {base_url}: {e}")
+            return []
+        entries = []
+        for elem in root.iter():
+            if _local_name(elem.tag) not in ("item", "entry"):
+                continue
+            link = title = ""
+            for child in elem:
+                name = _local_name(child.tag)
+                if name == "link":
+                    link = (child.text or child.get("href") or "").strip()
+                elif name == "title":
+                    title = (child.text or "").strip()
+            if link:
+                entries.append((link, title))
+        return entries
+
+    return [(urljoin(base_url, html_lib.unescape(href)), html_lib.unescape(_TAG_PATTERN.sub("", text)).strip())
+            for href, text in _ANCHOR_PATTERN.findall(body)]
+
+
+def entry_chapter(adapter: SiteAdapter, link: str, title: str) -> Optional[int]:
+    """Chapter number of a feed entry, from "Vol. N Ch. M" or "Chapter M" titles or the chapter URL"""
+    match = VOLUME_CHAPTER_PATTERN.search(title)
+    if match:
+        return int(match.group(2))
+    chapter_num = adapter.extract_chapter_number(urlparse(link).path)
+    if chapter_num is not None:
+        return chapter_num
+    match = _TITLE_CHAPTER_PATTERN.search(title)
+    return int(match.group(1)) if match else None
+
+
+class FeedWatcher:
+    """Conditional-GET feed poller with its validators and last entries kept in .feeds.json
+
+    An unchanged feed (HTTP 304) costs one tiny request and reuses the
+    entries stored from the last time it did change.
+    """
+
+    STATE_FILENAME = ".feeds.json"
+
+    _instances: Dict[str, "FeedWatcher"] = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, state_dir: str):
+        self.state_dir = state_dir
+        self.path = os.path.join(state_dir, self.STATE_FILENAME)
+        self.feeds: Dict[str, dict] = {}
+        self._lock = threading.Lock()
+        self.load()
+
+    @classmethod
+    def for_directory(cls, state_dir: str) -> "FeedWatcher":
+        """Return the shared watcher for an output folder so threads never write over each other"""
+        key = os.path.abspath(state_dir)
+        with cls._instances_lock:
+            if key not in cls._instances:
+                cls._instances[key] = cls(state_dir)
+            return cls._instances[key]
+
+    def load(self):
+        """Load the feed state from disk, starting empty if it is missing or unreadable"""
+        with self._lock:
+            self.feeds = {}
+            if not os.path.exists(self.path):
+                return
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    self.feeds = json.load(f).get("feeds", {})
+            except (OSError, ValueError) as e:
+                print(f"⚠️ Ignoring unreadable feed state {self.path}: {e}")
+
+    def _save(self):
+        data = {
+            "updated_at": datetime.datetime.now().isoformat(timespec="seconds"),
+            "feeds": self.feeds
+        }
+        tmp_path = self.path + ".tmp"
+        try:
+            os.makedirs(self.state_dir, exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=1)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"⚠️ Could not save feed state: {e}")
+
+    def entries(self, fetcher: HttpChapterFetcher, feed_url: str) -> List[Tuple[str, str]]:
+        """Current (link, title) entries of a feed, re-downloaded only when it changed"""
+        with self._lock:
+            state = dict(self.feeds.get(feed_url, {}))
+        result = fetcher.conditional_get(feed_url, state.get("etag"), state.get("last_modified"))
+        if result is None:
+            return [tuple(entry) for entry in state.get("entries", [])]
+
+        body, etag, last_modified = result
+        if body is None:
+            print(f"📭 {feed_url} unchanged since the last check")
+            return [tuple(entry) for entry in state.get("entries", [])]
+
+        entries = parse_feed(body, feed_url)
+        with self._lock:
+            self.feeds[feed_url] = {
+                "etag": etag,
+                "last_modified": last_modified,
+                "checked_at": datetime.datetime.now().isoformat(timespec="seconds"),
+                "entries": entries
+            }
+            self._save()
+        return entries
+
+    def check(self, fetcher: HttpChapterFetcher,
+              novels: Sequence[Tuple[str, int]]) -> Dict[str, List[int]]:
+        """Map each followed series URL to the new chapter numbers its site's feeds mention
+
+        novels holds (series_url, latest downloaded chapter). A novel the
+        feeds mention with nothing past its latest chapter maps to []; one
+        they don't mention at all gets no entry.
+        """
+        followed: Dict[str, List[Tuple[str, int]]] = {}
+        for series_url, latest in novels:
+            adapter = adapter_for_url(series_url)
+            if adapter and adapter.update_feeds:
+                followed.setdefault(adapter.name, []).append((series_url, latest))
+
+        updates: Dict[str, List[int]] = {}
+        for site, site_novels in followed.items():
+            adapter = ADAPTERS[site]
+            site_root = urljoin(site_novels[0][0], "/")
+            entries = []
+            for path in adapter.update_feeds:
+                entries += self.entries(fetcher, urljoin(site_root, path))
+
+            for series_url, latest in site_novels:
+                series = series_url.split('#')[0].rstrip('/')
+                slug = novel_slug(series_url)
+                name = slug.replace("-", " ")
+                mentioned = set()
+                for link, title in entries:
+                    if link.rstrip('/') == series or not (url_matches_novel(link, slug) or title_matches_novel(title, name)):
+                        continue
+                    chapter_num = entry_chapter(adapter, link, title)
+                    if chapter_num is not None:
+                        mentioned.add(chapter_num)
+                if mentioned:
+                    updates[series_url] = sorted(num for num in mentioned if num > latest)
+        return updates
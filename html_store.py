@@ -0,0 +1,97 @@
+"""
+Raw chapter HTML store
+Keeps gzip-compressed, content-addressed copies of fetched chapter pages in chapters/<novel>/.html/ for offline re-extraction
+"""
+
+import datetime
+import gzip
+import hashlib
+import json
+import os
+import threading
+from typing import Dict, Optional
+
+
+class HtmlStore:
+    """Content-addressed page store for one novel folder
+
+    Pages live in objects/<sha[:2]>/<sha>.html.gz so identical re-fetches
+    cost nothing; manifest.jsonl records every (chapter, url, fetched_at, sha)
+    so the newest capture of each chapter can be found again.
+    """
+
+    STORE_DIRNAME = ".html"
+    MANIFEST_FILENAME = "manifest.jsonl"
+
+    _instances: Dict[str, "HtmlStore"] = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, output_dir: str):
+        self.output_dir = output_dir
+        self.root = os.path.join(output_dir, self.STORE_DIRNAME)
+        self.manifest_path = os.path.join(self.root, self.MANIFEST_FILENAME)
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_directory(cls, output_dir: str) -> "HtmlStore":
+        """Return the shared store for a novel folder so threads never interleave manifest lines"""
+        key = os.path.abspath(output_dir)
+        with cls._instances_lock:
+            if key not in cls._instances:
+                cls._instances[key] = cls(output_dir)
+            return cls._instances[key]
+
+    def _object_path(self, sha: str) -> str:
+        return os.path.join(self.root, "objects", sha[:2], sha + ".html.gz")
+
+    def save(self, chapter_num: int, url: str, html: str) -> Optional[str]:
+        """Store a fetched page and record it in the manifest; returns its hash"""
+        if not html:
+            return None
+        data = html.encode("utf-8")
+        sha = hashlib.sha256(data).hexdigest()
+        path = self._object_path(sha)
+        entry = {
+            "chapter": chapter_num,
+            "url": url,
+            "fetched_at": datetime.datetime.now().isoformat(timespec="seconds"),
+            "sha256": sha
+        }
+
+        with self._lock:
+            try:
+                if not os.path.exists(path):
+                    os.makedirs(os.path.dirname(path), exist_ok=True)
+                    tmp_path = path + ".tmp"
+                    with gzip.open(tmp_path, "wb") as f:
+                        f.write(data)
+                    os.replace(tmp_path, path)
+                with open(self.manifest_path, "a", encoding="utf-8") as f:
+                    f.write(json.dumps(entry) + "\n")
+            except OSError as e:
+                print(f"⚠️ Could not store raw HTML for chapter {chapter_num}: {e}")
+                return None
+        return sha
+
+    def load(self, sha: str) -> Optional[str]:
+        """Return a stored page by hash"""
+        try:
+            with gzip.open(self._object_path(sha), "rb") as f:
+                return f.read().decode("utf-8")
+        except OSError:
+            return None
+
+    def latest_entries(self) -> Dict[int, dict]:
+        """Return the newest manifest entry for every stored chapter"""
+        entries = {}
+        if not os.path.exists(self.manifest_path):
+            return entries
+        with self._lock:
+            with open(self.manifest_path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue  # Skip a line cut short by an interrupted run
+                    entries[int(entry["chapter"])] = entry
+        return entries
@@ -0,0 +1,287 @@
+"""
+Lightweight HTTP chapter fetcher
+Downloads server-rendered chapter pages over a pooled keep-alive session and parses them without a browser
+"""
+
+import html as html_lib
+import re
+import threading
+from typing import List, Optional, Sequence, Tuple
+
+from rate_limit import get_rate_limiter
+from retry_policy import BLOCKED, NOT_FOUND, TRANSIENT, report_failure
+
+# requests and BeautifulSoup are optional: without them every chapter goes through Selenium
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+    REQUESTS_AVAILABLE = True
+except ImportError:
+    REQUESTS_AVAILABLE = False
+
+try:
+    from bs4 import BeautifulSoup, NavigableString, Tag
+    BS4_AVAILABLE = True
+except ImportError:
+    BS4_AVAILABLE = False
+
+# lxml is much faster than the built-in parser when it is installed
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
+HTTP_FETCH_AVAILABLE = REQUESTS_AVAILABLE and BS4_AVAILABLE
+
+DEFAULT_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.9"
+}
+
+# Anti-bot interstitials that only a real browser can get through
+CHALLENGE_STATUS_CODES = {403, 429, 503}
+CHALLENGE_MARKERS = [
+    "cf-browser-verification",
+    "challenge-platform",
+    "cf-chl-",
+    "<title>Just a moment...</title>",
+    "Attention Required! | Cloudflare"
+]
+CHALLENGE_TITLES = ("Just a moment...", "Attention Required! | Cloudflare")
+NOT_FOUND_STATUS_CODES = {404, 410}
+
+MIN_CONTENT_LENGTH = 100  # Same threshold the Selenium extractors use
+
+_TITLE_PATTERN = re.compile(r'<title[^>]*>(.*?)</title>', re.IGNORECASE | re.DOTALL)
+_WHITESPACE_PATTERN = re.compile(r'\s+')
+_DISPLAY_NONE_PATTERN = re.compile(r'display\s*:\s*none', re.IGNORECASE)
+
+# Same rules as page_text.py's walker: inline text joins up, block elements and <br> end a line
+SKIP_TAGS = {"script", "style", "noscript", "template", "iframe", "svg"}
+BLOCK_TAGS = {"p", "div", "li", "ul", "ol", "blockquote", "pre", "section", "article", "main",
+              "h1", "h2", "h3", "h4", "h5", "h6", "table", "tr", "hr", "header", "footer"}
+
+
+def is_challenge_page(status_code: int, html: str) -> bool:
+    """True when the response is a bot check rather than the real page"""
+    if status_code in CHALLENGE_STATUS_CODES:
+        return True
+    head = html[:20000]
+    return any(marker in head for marker in CHALLENGE_MARKERS)
+
+
+def is_challenge_title(title: str) -> bool:
+    """True when a loaded page's title belongs to a bot check"""
+    return any(marker in (title or "") for marker in CHALLENGE_TITLES)
+
+
+def text_lines(element) -> List[str]:
+    """Text of a parsed element, one line per block element or <br>, like the browser-side extractor"""
+    lines = []
+    line = []
+
+    def flush():
+        text = _WHITESPACE_PATTERN.sub(" ", "".join(line)).strip()
+        if text:
+            lines.append(text)
+        line.clear()
+
+    def walk(node):
+        for child in node.children:
+            if isinstance(child, NavigableString):
+                if type(child) is NavigableString:  # Comments, doctypes and CDATA carry no chapter text
+                    line.append(str(child))
+                continue
+            if not isinstance(child, Tag) or child.name in SKIP_TAGS:
+                continue
+            if child.has_attr("hidden") or _DISPLAY_NONE_PATTERN.search(child.get("style", "")):
+                continue
+            if child.name == "br":
+                flush()
+                continue
+            block = child.name in BLOCK_TAGS
+            if block:
+                flush()
+            walk(child)
+            if block:
+                flush()
+
+    walk(element)
+    flush()
+    return lines
+
+
+def element_text(element, separator: str = "\n") -> str:
+    """text_lines joined into one string"""
+    return separator.join(text_lines(element))
+
+
+def extract_chapter(html: str, selectors: Sequence[str], min_length: int = MIN_CONTENT_LENGTH,
+                    fallback: bool = False) -> Optional[Tuple[str, str]]:
+    """Parse (title, content) from chapter HTML using the first selector with enough text
+
+    With fallback, long paragraphs and then <main> are tried as well, the
+    same way the Selenium scrapers fall back when no selector matches.
+    """
+    soup = BeautifulSoup(html, HTML_PARSER)
+    title = soup.title.get_text(strip=True) if soup.title else ""
+    for tag in soup.find_all(["script", "style", "noscript"]):
+        tag.decompose()
+
+    for sel in selectors:
+        element = soup.select_one(sel)
+        if element is None:
+            continue
+        content = element_text(element)
+        if len(content) >= min_length:
+            return title, content
+
+    if fallback:
+        paragraph_texts = [element_text(p, " ") for p in soup.find_all("p")]
+        paragraph_texts = [text for text in paragraph_texts if len(text) > 50]
+        if paragraph_texts:
+            return title, "\n\n".join(paragraph_texts)
+
+        main = soup.find("main")
+        content = element_text(main) if main else ""
+        if len(content) > 100:
+            return title, content
+    return None
+
+
+class HttpChapterFetcher:
+    """Fetches chapter pages with plain HTTP GETs, one keep-alive session per thread"""
+
+    def __init__(self, timeout: float = 20, pool_size: int = 4, min_length: int = MIN_CONTENT_LENGTH):
+        self.timeout = timeout
+        self.pool_size = pool_size
+        self.min_length = min_length
+        self._local = threading.local()
+        self._sessions: List["requests.Session"] = []
+        self._sessions_lock = threading.Lock()
+
+    def _session(self) -> "requests.Session":
+        """Return this thread's session, creating it on first use"""
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=self.pool_size, pool_maxsize=self.pool_size)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            session.headers.update(DEFAULT_HEADERS)
+            self._local.session = session
+            with self._sessions_lock:
+                self._sessions.append(session)
+        return session
+
+    def get_html(self, url: str) -> Optional[Tuple[str, str]]:
+        """GET a page; returns (html, final_url) or None on errors and challenge pages"""
+        get_rate_limiter().wait(url)
+        try:
+            response = self._session().get(url, timeout=self.timeout)
+        except requests.RequestException as e:
+            print(f"⚠️ HTTP fetch failed for {url}: {e}")
+            report_failure(TRANSIENT)
+            return None
+
+        html = response.text
+        if is_challenge_page(response.status_code, html):
+            print(f"🛡️ Bot check on {url} (HTTP {response.status_code}), needs a browser")
+            report_failure(BLOCKED)
+            return None
+        if response.status_code != 200:
+            print(f"⚠️ HTTP {response.status_code} for {url}")
+            report_failure(NOT_FOUND if response.status_code in NOT_FOUND_STATUS_CODES else TRANSIENT)
+            return None
+        return html, response.url
+
+    def probe(self, url: str) -> Optional[Tuple[int, str, str]]:
+        """GET a page for an existence check; returns (status, title, final_url), or None when it can't tell"""
+        if not HTTP_FETCH_AVAILABLE:
+            return None
+        get_rate_limiter().wait(url)
+        try:
+            response = self._session().get(url, timeout=self.timeout)
+        except requests.RequestException as e:
+            print(f"⚠️ HTTP probe failed for {url}: {e}")
+            return None
+
+        html = response.text
+        if is_challenge_page(response.status_code, html):
+            return None
+        match = _TITLE_PATTERN.search(html)
+        title = html_lib.unescape(match.group(1)).strip() if match else ""
+        return response.status_code, title, response.url
+
+    def conditional_get(self, url: str, etag: Optional[str] = None,
+                        last_modified: Optional[str] = None) -> Optional[Tuple[Optional[str], Optional[str], Optional[str]]]:
+        """GET with If-None-Match/If-Modified-Since; returns (body, etag, last_modified), body None when unchanged
+
+        Returns None on errors and challenge pages.
+        """
+        if not REQUESTS_AVAILABLE:
+            return None
+        headers = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        get_rate_limiter().wait(url)
+        try:
+            response = self._session().get(url, timeout=self.timeout, headers=headers)
+        except requests.RequestException as e:
+            print(f"⚠️ HTTP fetch failed for {url}: {e}")
+            return None
+
+        if response.status_code == 304:
+            return None, etag, last_modified
+        if response.status_code != 200 or is_challenge_page(response.status_code, response.text):
+            print(f"⚠️ HTTP {response.status_code} for {url}")
+            return None
+        return response.text, response.headers.get("ETag"), response.headers.get("Last-Modified")
+
+    def stream(self, url: str) -> Optional["requests.Response"]:
+        """GET a large document (a sitemap) without reading it into memory; the caller closes the response"""
+        if not REQUESTS_AVAILABLE:
+            return None
+        get_rate_limiter().wait(url)
+        try:
+            response = self._session().get(url, timeout=self.timeout, stream=True)
+        except requests.RequestException as e:
+            print(f"⚠️ HTTP fetch failed for {url}: {e}")
+            return None
+
+        if response.status_code != 200:
+            if response.status_code in CHALLENGE_STATUS_CODES:
+                print(f"🛡️ Bot check on {url} (HTTP {response.status_code})")
+            response.close()
+            return None
+        return response
+
+    def fetch(self, url: str, selectors: Sequence[str]) -> Optional[Tuple[str, str, str, str]]:
+        """Fetch a chapter page; returns (title, content, final_url, html) or None to fall back to Selenium"""
+        if not HTTP_FETCH_AVAILABLE:
+            return None
+
+        page = self.get_html(url)
+        if not page:
+            return None
+        html, final_url = page
+
+        chapter = extract_chapter(html, selectors, self.min_length)
+        if not chapter:
+            print(f"⚠️ No content over {self.min_length} characters in HTTP response, needs a browser")
+            return None
+        title, content = chapter
+        return title, content, final_url, html
+
+    def close(self):
+        """Close every pooled connection"""
+        with self._sessions_lock:
+            sessions = self._sessions
+            self._sessions = []
+            self._local = threading.local()
+        for session in sessions:
+            session.close()
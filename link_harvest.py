@@ -0,0 +1,150 @@
+"""
+One-round-trip chapter link harvesting
+Pulls every matching anchor's href and text with a single execute_script call and parses them in Python
+"""
+
+import re
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.common.by import By
+
+from page_waits import DEFAULT_TIMEOUT, missing_volume_links, wait_for_volume_links
+
+# Union of the selectors the scrapers used to query one by one
+CHAPTER_ANCHOR_CSS = "a[href*='chapter'], a[class*='chapter'], .chapter-item a, .list-chapter a, .chapter-list a"
+
+# Chapter number patterns for chapter URLs, most specific first
+CHAPTER_URL_PATTERNS = [
+    re.compile(r'chapter-(\d+)'),
+    re.compile(r'ch-(\d+)'),
+    re.compile(r'chapter/(\d+)'),
+    re.compile(r'c(\d+)'),
+    re.compile(r'chap-(\d+)')
+]
+
+# Looser patterns for full chapter discovery (only applied to hrefs containing "chapter")
+DISCOVERY_URL_PATTERNS = CHAPTER_URL_PATTERNS + [
+    re.compile(r'chapter(\d+)'),
+    re.compile(r'/(\d+)/?$')  # Numbers at end of URL
+]
+
+# KatReadingCafe link text like "Vol. 2 Ch. 15"
+VOLUME_CHAPTER_PATTERN = re.compile(r'Vol\.\s*(\d+)\s*Ch\.\s*(\d+)')
+
+_HARVEST_SCRIPT = """
+const seen = new Set(), out = [];
+for (const a of document.querySelectorAll(arguments[0])) {
+    const href = a.href;
+    if (!href || seen.has(href)) continue;
+    seen.add(href);
+    out.push([href, (a.textContent || '').trim()]);
+}
+return out;
+"""
+
+
+# Lists every "Vol. N" toggle (from min_volume on) and clicks the ones whose
+# chapter links aren't in the page yet; the newest volume is usually open already
+_EXPAND_VOLUMES_SCRIPT = """
+const minVolume = arguments[0];
+const loaded = new Set();
+for (const a of document.getElementsByTagName('a')) {
+    const m = /^\\s*Vol\\.\\s*(\\d+)\\s*Ch\\./.exec(a.textContent || '');
+    if (m) loaded.add(Number(m[1]));
+}
+const volumes = [], clicked = [];
+for (const span of document.getElementsByTagName('span')) {
+    const m = /^\\s*Vol\\.\\s*(\\d+)\\s*$/.exec(span.textContent || '');
+    if (!m) continue;
+    const vol = Number(m[1]);
+    if ((minVolume !== null && vol < minVolume) || volumes.includes(vol)) continue;
+    volumes.push(vol);
+    if (!loaded.has(vol)) {
+        span.click();
+        clicked.push(vol);
+    }
+}
+return [volumes.sort((a, b) => a - b), clicked];
+"""
+
+
+def harvest_links(driver, css: str = CHAPTER_ANCHOR_CSS) -> List[Tuple[str, str]]:
+    """Return (href, text) for every anchor matching css, deduplicated by href"""
+    try:
+        return [(href, text) for href, text in driver.execute_script(_HARVEST_SCRIPT, css) or []]
+    except WebDriverException:
+        return []
+
+
+def extract_chapter_number(href: str, patterns: Sequence[re.Pattern] = CHAPTER_URL_PATTERNS) -> Optional[int]:
+    """Extract chapter number from a chapter URL"""
+    for pattern in patterns:
+        match = pattern.search(href)
+        if match:
+            return int(match.group(1))
+    return None
+
+
+def harvest_chapter_links(driver, patterns: Sequence[re.Pattern] = CHAPTER_URL_PATTERNS,
+                          css: str = CHAPTER_ANCHOR_CSS, require_chapter_in_href: bool = False) -> Dict[int, str]:
+    """Return {chapter_num: url} for every chapter link currently in the page
+
+    Pass require_chapter_in_href with loose patterns such as
+    DISCOVERY_URL_PATTERNS, whose bare-number rules would otherwise match
+    navigation, pagination and asset links.
+    """
+    chapters = {}
+    for href, _ in harvest_links(driver, css):
+        if require_chapter_in_href and 'chapter' not in href.lower():
+            continue
+        chapter_num = extract_chapter_number(href, patterns)
+        if chapter_num is not None:
+            chapters[chapter_num] = href
+    return chapters
+
+
+def harvest_volume_chapters(driver, vol_num: Optional[int] = None) -> Dict[int, Tuple[str, int]]:
+    """Return {chapter_num: (url, volume)} from "Vol. N Ch. M" links, optionally for one volume"""
+    chapters = {}
+    for href, text in harvest_links(driver, "a"):
+        m = VOLUME_CHAPTER_PATTERN.match(text)
+        if m and (vol_num is None or int(m.group(1)) == vol_num):
+            chapters[int(m.group(2))] = (href, int(m.group(1)))
+    return chapters
+
+
+def expand_all_volumes(driver, min_volume: Optional[int] = None,
+                       timeout: float = DEFAULT_TIMEOUT) -> Dict[int, Tuple[str, int]]:
+    """Open every collapsed volume at once and return {chapter_num: (url, volume)}
+
+    One script call clicks all the toggles, one wait covers every volume and
+    one harvest reads all "Vol. N Ch. M" links. Volumes that still show no
+    links are retried one by one with a real click.
+    """
+    try:
+        volumes, clicked = driver.execute_script(_EXPAND_VOLUMES_SCRIPT, min_volume)
+    except WebDriverException as e:
+        print(f"❌ Could not expand volumes: {e}")
+        return {}
+
+    if volumes:
+        print(f"📚 Available volumes: {volumes}")
+    if clicked:
+        print(f"🔍 Expanding {len(clicked)} volume(s) at once...")
+        wait_for_volume_links(driver, clicked, timeout)
+
+    for vol_num in missing_volume_links(driver, clicked):
+        try:
+            vol_element = driver.find_element(By.XPATH, f"//span[text()='Vol. {vol_num}']")
+            driver.execute_script("arguments[0].scrollIntoView(true);", vol_element)
+            vol_element.click()
+            if not wait_for_volume_links(driver, [vol_num], timeout=10):
+                print(f"⚠️ Vol. {vol_num} links did not appear in time")
+        except WebDriverException as e:
+            print(f"❌ Could not expand Vol. {vol_num}: {e}")
+
+    chapters = {num: (url, vol) for num, (url, vol) in harvest_volume_chapters(driver).items()
+                if min_volume is None or vol >= min_volume}
+    print(f"📋 Found {len(chapters)} chapters in {len(volumes)} volume(s)")
+    return chapters
@@ -0,0 +1,64 @@
+"""
+Per-site page load strategies
+Chrome takes a single pageLoadStrategy per browser, so the browser starts with the configured default; driver.get waits longer for sites that want more and starts navigation from script for sites that want less
+"""
+
+from typing import Optional
+
+from page_waits import mark_document, wait_for_document_ready, wait_for_new_document
+from site_adapters import adapter_for_url
+
+# From most to least waiting: full load event, DOMContentLoaded, navigation started
+PAGE_LOAD_STRATEGIES = ("normal", "eager", "none")
+
+
+def _patience(strategy: str) -> int:
+    return PAGE_LOAD_STRATEGIES.index(strategy)
+
+
+def site_strategy(url: str, default: str) -> str:
+    adapter = adapter_for_url(url)
+    if adapter and adapter.page_load_strategy:
+        return adapter.page_load_strategy
+    return default
+
+
+def _same_document(driver, url: str) -> bool:
+    """True when only the #fragment changes, which Chrome handles without loading a new document"""
+    if "#" not in url:
+        return False
+    try:
+        return driver.current_url.split("#")[0] == url.split("#")[0]
+    except Exception:
+        return False
+
+
+def enable_site_page_loads(driver, browser: str, default: Optional[str] = None):
+    """Wrap driver.get so each site gets its own strategy on a browser started with `browser`
+
+    A site that wants less waiting than the browser gets its navigation
+    started from script, which returns at once like "none". Either way the
+    old document is flagged first and get only returns once it has been
+    replaced; later readiness checks can't read a stale page.
+    """
+    default = default or browser
+    raw_get = driver.get
+
+    def site_get(url):
+        wanted = site_strategy(url, default)
+        from_script = _patience(wanted) > _patience(browser)
+        new_document = (browser == "none" or from_script) and not _same_document(driver, url)
+        if new_document:
+            mark_document(driver)
+
+        if from_script and new_document:
+            driver.execute_script("window.location.href = arguments[0];", url)
+        else:
+            raw_get(url)
+
+        if new_document and not wait_for_new_document(driver):
+            print(f"⚠️ Page did not start loading in time: {url}")
+        if _patience(wanted) < _patience(browser):
+            wait_for_document_ready(driver, interactive_ok=(wanted == "eager"))
+
+    driver.get = site_get
@@ -0,0 +1,95 @@
+"""
+Single-call chapter text extraction
+Reads the page title and the chosen container's text through one execute_script call, using textContent instead of WebElement.text
+"""
+
+from typing import Optional, Sequence, Tuple
+
+from selenium.common.exceptions import WebDriverException
+
+from selector_stats import SelectorStats
+
+# Walks the container once and emits one line per block element or <br>, so
+# paragraph boundaries survive without asking Chrome for rendered text layout
+_EXTRACT_SCRIPT = """
+const selectors = arguments[0], minLength = arguments[1], fallback = arguments[2];
+const SKIP = new Set(['SCRIPT', 'STYLE', 'NOSCRIPT', 'TEMPLATE', 'IFRAME', 'svg']);
+const BLOCK = new Set(['P', 'DIV', 'LI', 'UL', 'OL', 'BLOCKQUOTE', 'PRE', 'SECTION', 'ARTICLE', 'MAIN',
+                       'H1', 'H2', 'H3', 'H4', 'H5', 'H6', 'TABLE', 'TR', 'HR', 'HEADER', 'FOOTER']);
+
+function linesOf(root) {
+    const lines = [];
+    let line = '';
+    const flush = () => {
+        const text = line.replace(/\\s+/g, ' ').trim();
+        if (text) lines.push(text);
+        line = '';
+    };
+    const walk = (node) => {
+        for (const child of node.childNodes) {
+            if (child.nodeType === 3) { line += child.nodeValue; continue; }
+            if (child.nodeType !== 1 || SKIP.has(child.tagName)) continue;
+            if (child.hidden || (child.style && child.style.display === 'none')) continue;
+            if (child.tagName === 'BR') { flush(); continue; }
+            const block = BLOCK.has(child.tagName);
+            if (block) flush();
+            walk(child);
+            if (block) flush();
+        }
+    };
+    walk(root);
+    flush();
+    return lines;
+}
+
+const title = document.title.trim();
+for (let i = 0; i < selectors.length; i++) {
+    const el = document.querySelector(selectors[i]);
+    if (!el) continue;
+    const text = linesOf(el).join('\\n');
+    if (text.length >= minLength) return [title, i, text];
+}
+
+if (fallback) {
+    const paragraphs = [];
+    for (const p of document.getElementsByTagName('p')) {
+        const text = linesOf(p).join(' ');
+        if (text.length > 50) paragraphs.push(text);
+    }
+    if (paragraphs.length) return [title, 'paragraphs', paragraphs.join('\\n\\n')];
+
+    const main = document.querySelector('main');
+    const text = main ? linesOf(main).join('\\n') : '';
+    if (text.length > 100) return [title, 'main', text];
+}
+return [title, null, ''];
+"""
+
+
+def extract_page_text(driver, selectors: Sequence[str], min_length: int = 1, fallback: bool = False,
+                      stats: Optional[SelectorStats] = None,
+                      site: Optional[str] = None) -> Optional[Tuple[str, Optional[str], str]]:
+    """Return (title, source, text) from one execute_script call, or None if the script fails
+
+    source is the winning selector, "paragraphs" or "main" for the fallbacks,
+    or None with empty text when nothing had enough content. Text keeps one
+    line per paragraph, like WebElement.text.
+    """
+    if stats and site:
+        selectors = stats.ordered(site, selectors)
+    else:
+        selectors = list(selectors)
+
+    try:
+        title, source, text = driver.execute_script(_EXTRACT_SCRIPT, selectors, min_length, fallback)
+    except (WebDriverException, TypeError, ValueError) as e:
+        print(f"⚠️ Script text extraction failed, using element text: {e}")
+        return None
+
+    if isinstance(source, int):
+        if stats and site:
+            for sel in selectors[:source]:
+                stats.record(site, sel, False)
+            stats.record(site, selectors[source], True)
+        source = selectors[source]
+    return title, source, text
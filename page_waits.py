@@ -0,0 +1,119 @@
+"""
+Event-driven page waits built on WebDriverWait
+Return as soon as the page is ready instead of sleeping a fixed time; request pacing lives in rate_limit.py
+"""
+
+from typing import List, Optional, Sequence
+
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+DEFAULT_TIMEOUT = 15  # Upper bound for any single readiness wait
+POLL_INTERVAL = 0.25
+
+CHAPTER_LINK_CSS = "a[href*='chapter']"
+
+_FIRST_CONTENT_SCRIPT = """
+const selectors = arguments[0], minLength = arguments[1];
+for (const sel of selectors) {
+    const el = document.querySelector(sel);
+    if (el && (el.textContent || '').trim().length >= minLength) return sel;
+}
+return null;
+"""
+
+_COUNT_SCRIPT = "return document.querySelectorAll(arguments[0]).length;"
+
+# A flag on the current window object; a freshly loaded document won't have it
+_MARK_DOCUMENT_SCRIPT = "window.__scraperOldDocument = true;"
+_NEW_DOCUMENT_SCRIPT = "return window.__scraperOldDocument !== true;"
+
+_VOLUME_LINK_SCRIPT = """
+const missing = new Set(arguments[0]);
+for (const a of document.getElementsByTagName('a')) {
+    const m = /^\\s*Vol\\.\\s*(\\d+)\\s*Ch\\./.exec(a.textContent || '');
+    if (m) missing.delete(Number(m[1]));
+}
+return Array.from(missing);
+"""
+
+
+def _wait(driver, condition, timeout: float):
+    """Run a WebDriverWait and return its value, or None on timeout"""
+    try:
+        return WebDriverWait(driver, timeout, poll_frequency=POLL_INTERVAL,
+                             ignored_exceptions=(WebDriverException,)).until(condition)
+    except TimeoutException:
+        return None
+
+
+def wait_for_document_ready(driver, timeout: float = DEFAULT_TIMEOUT, interactive_ok: bool = True) -> bool:
+    """Wait until the DOM is parsed (interactive) or fully loaded (complete)"""
+    states = ("interactive", "complete") if interactive_ok else ("complete",)
+    return bool(_wait(driver, lambda d: d.execute_script("return document.readyState;") in states, timeout))
+
+
+def mark_document(driver):
+    """Flag the current document so wait_for_new_document can tell when navigation replaced it"""
+    try:
+        driver.execute_script(_MARK_DOCUMENT_SCRIPT)
+    except WebDriverException:
+        pass
+
+
+def wait_for_new_document(driver, timeout: float = DEFAULT_TIMEOUT) -> bool:
+    """Wait until the document flagged by mark_document has been replaced"""
+    return bool(_wait(driver, lambda d: d.execute_script(_NEW_DOCUMENT_SCRIPT), timeout))
+
+
+def wait_for_content(driver, selectors: Sequence[str], timeout: float = DEFAULT_TIMEOUT,
+                     min_length: int = 1) -> Optional[str]:
+    """Wait until one of the CSS selectors holds at least min_length characters; returns that selector"""
+    return _wait(driver, lambda d: d.execute_script(_FIRST_CONTENT_SCRIPT, list(selectors), min_length) or False,
+                 timeout)
+
+
+def wait_for_element(driver, css: str, timeout: float = DEFAULT_TIMEOUT, clickable: bool = False):
+    """Wait for an element to be present (or clickable); returns it or None"""
+    locator = (By.CSS_SELECTOR, css)
+    condition = EC.element_to_be_clickable(locator) if clickable else EC.presence_of_element_located(locator)
+    return _wait(driver, condition, timeout)
+
+
+def count_links(driver, css: str = CHAPTER_LINK_CSS) -> int:
+    try:
+        return driver.execute_script(_COUNT_SCRIPT, css) or 0
+    except WebDriverException:
+        return 0
+
+
+def wait_for_chapter_links(driver, timeout: float = DEFAULT_TIMEOUT, min_count: int = 1,
+                           css: str = CHAPTER_LINK_CSS) -> int:
+    """Wait until at least min_count chapter anchors exist; returns the current count"""
+    _wait(driver, lambda d: count_links(d, css) >= min_count, timeout)
+    return count_links(driver, css)
+
+
+def wait_for_more_links(driver, previous_count: int, timeout: float = DEFAULT_TIMEOUT,
+                        css: str = CHAPTER_LINK_CSS) -> int:
+    """Wait for lazy loading to add anchors beyond previous_count; returns the new count
+
+    Times out quietly (returning the unchanged count) when nothing more loads.
+    """
+    _wait(driver, lambda d: count_links(d, css) > previous_count, timeout)
+    return count_links(driver, css)
+
+
+def missing_volume_links(driver, vol_nums: Sequence[int]) -> List[int]:
+    """Volumes from vol_nums that have no 'Vol. N Ch. M' anchors in the page yet"""
+    try:
+        return driver.execute_script(_VOLUME_LINK_SCRIPT, list(vol_nums)) or []
+    except WebDriverException:
+        return list(vol_nums)
+
+
+def wait_for_volume_links(driver, vol_nums: Sequence[int], timeout: float = DEFAULT_TIMEOUT) -> bool:
+    """Wait until every listed volume's 'Vol. N Ch. M' anchors appear"""
+    return bool(_wait(driver, lambda d: not missing_volume_links(d, vol_nums), timeout))
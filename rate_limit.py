@@ -0,0 +1,107 @@
+"""
+Per-domain request rate limiting
+One token bucket per website, shared by every browser, HTTP session and worker thread in the process
+"""
+
+import random
+import threading
+import time
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+DEFAULT_PER_MINUTE = 30  # Sustained requests per minute to one website
+DEFAULT_BURST = 3  # Requests allowed back to back before pacing starts
+DEFAULT_JITTER = 0.5  # Extra random delay (seconds) so request timing doesn't look robotic
+
+
+def domain_of(url: str) -> Optional[str]:
+    """Bucket key for a URL (host without www.), or None for about:blank, data: and the like"""
+    host = urlparse(url).netloc.lower()
+    if not host:
+        return None
+    return host[4:] if host.startswith("www.") else host
+
+
+class TokenBucket:
+    """Token bucket that hands out reservations, so waiting threads queue fairly without holding the lock"""
+
+    def __init__(self, per_minute: float, burst: int):
+        self.rate = per_minute / 60.0
+        self.capacity = max(1, burst)
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take a token and return how many seconds to wait before using it"""
+        if self.rate <= 0:
+            return 0.0
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            if self.tokens >= 0:
+                return 0.0
+            return -self.tokens / self.rate
+
+
+class RateLimiter:
+    """Per-domain token buckets with jitter
+
+    per_minute <= 0 disables limiting. overrides maps a domain
+    ("novelbin.me") to its own requests-per-minute rate.
+    """
+
+    def __init__(self, per_minute: float = DEFAULT_PER_MINUTE, burst: int = DEFAULT_BURST,
+                 jitter: float = DEFAULT_JITTER, overrides: Optional[Dict[str, float]] = None):
+        self._lock = threading.Lock()
+        self.configure(per_minute, burst, jitter, overrides)
+
+    def configure(self, per_minute: float = DEFAULT_PER_MINUTE, burst: int = DEFAULT_BURST,
+                  jitter: float = DEFAULT_JITTER, overrides: Optional[Dict[str, float]] = None):
+        """Change the limits; buckets start over with the new rates"""
+        with self._lock:
+            self.per_minute = per_minute
+            self.burst = burst
+            self.jitter = max(0.0, jitter)
+            self.overrides = dict(overrides or {})
+            self._buckets: Dict[str, TokenBucket] = {}
+
+    def _bucket(self, domain: str) -> TokenBucket:
+        with self._lock:
+            if domain not in self._buckets:
+                self._buckets[domain] = TokenBucket(self.overrides.get(domain, self.per_minute), self.burst)
+            return self._buckets[domain]
+
+    def wait(self, url: str) -> float:
+        """Block until a request to the URL's website is allowed; returns the time waited"""
+        domain = domain_of(url)
+        if domain is None:
+            return 0.0
+        bucket = self._bucket(domain)
+        if bucket.rate <= 0:
+            return 0.0
+        delay = bucket.reserve() + random.uniform(0, self.jitter)
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+
+_rate_limiter = RateLimiter()
+
+
+def get_rate_limiter() -> RateLimiter:
+    """Return the process-wide limiter so concurrent workers share one budget per website"""
+    return _rate_limiter
+
+
+def limit_navigation_rate(driver):
+    """Wrap driver.get so every page load waits for the shared limiter"""
+    raw_get = driver.get
+
+    def limited_get(url):
+        _rate_limiter.wait(url)
+        return raw_get(url)
+
+    driver.get = limited_get
@@ -0,0 +1,141 @@
+"""
+Offline chapter re-extraction
+Re-runs content extraction over the raw HTML kept by SAVE_RAW_HTML, with no network access
+
+run using this command:
+python reextract_chapters.py
+"""
+
+import glob
+import os
+import re
+import time
+
+from html_store import HtmlStore
+from http_fetch import BS4_AVAILABLE, extract_chapter
+from scrape_novel import BASE_OUTPUT_DIR, save_chapter
+from site_adapters import NOVELBIN, adapter_for_url
+
+
+def find_stored_novels(chapters_dir):
+    """Return novel folders that have stored chapter HTML"""
+    if not os.path.exists(chapters_dir):
+        return []
+    novels = []
+    for name in sorted(os.listdir(chapters_dir)):
+        manifest = os.path.join(chapters_dir, name, HtmlStore.STORE_DIRNAME, HtmlStore.MANIFEST_FILENAME)
+        if os.path.exists(manifest):
+            novels.append(name)
+    return novels
+
+
+def extract_stored_page(html, url):
+    """Run the same selector lists (and NovelBin's fallbacks) the scrapers use"""
+    adapter = adapter_for_url(url, NOVELBIN)
+    return extract_chapter(html, adapter.content_selectors, min_length=adapter.min_content_length,
+                           fallback=adapter is NOVELBIN)
+
+
+def read_existing_chapter(output_dir, chapter_num):
+    """Return (paths, text) of the chapter file(s) currently saved for a chapter number"""
+    paths = glob.glob(os.path.join(output_dir, f"{chapter_num:03d}_*.txt"))
+    text = None
+    if paths:
+        try:
+            with open(paths[0], "r", encoding="utf-8") as f:
+                text = f.read()
+        except OSError:
+            pass
+    return paths, text
+
+
+def normalized_lines(text):
+    """Non-empty lines with collapsed whitespace, so browser and HTML extractions of the same text compare equal"""
+    lines = (re.sub(r'\s+', ' ', line).strip() for line in text.splitlines())
+    return [line for line in lines if line]
+
+
+def reextract_novel(output_dir):
+    """Re-extract every stored chapter of one novel; returns (updated, unchanged, failed)"""
+    store = HtmlStore.for_directory(output_dir)
+    entries = store.latest_entries()
+    updated = unchanged = failed = 0
+
+    for chapter_num in sorted(entries):
+        entry = entries[chapter_num]
+        html = store.load(entry["sha256"])
+        if html is None:
+            print(f"⚠️ Chapter {chapter_num}: stored page {entry['sha256'][:12]} is missing")
+            failed += 1
+            continue
+
+        chapter = extract_stored_page(html, entry["url"])
+        if not chapter:
+            print(f"❌ Chapter {chapter_num}: no content found in stored page")
+            failed += 1
+            continue
+
+        title, content = chapter
+        old_paths, old_text = read_existing_chapter(output_dir, chapter_num)
+        if old_text is not None and normalized_lines(old_text) == normalized_lines(title + "\n\n" + content):
+            unchanged += 1
+            continue
+
+        # Save first so a failed write never loses the chapter, then drop files left under an old title
+        if not save_chapter(title, content, chapter_num, output_dir):
+            failed += 1
+            continue
+        saved_paths = glob.glob(os.path.join(output_dir, f"{chapter_num:03d}_*.txt"))
+        written = max(saved_paths, key=os.path.getmtime)
+        for path in old_paths:
+            if path != written and os.path.exists(path):
+                os.remove(path)
+        updated += 1
+
+    return updated, unchanged, failed
+
+
+def main():
+    """Main execution function"""
+    print("🔁 Offline Chapter Re-extraction")
+    print("=" * 40)
+
+    if not BS4_AVAILABLE:
+        print("❌ beautifulsoup4 is required: pip install beautifulsoup4")
+        return
+
+    novels = find_stored_novels(BASE_OUTPUT_DIR)
+    if not novels:
+        print("❌ No stored chapter HTML found")
+        print("💡 Set SAVE_RAW_HTML = True (or enable it in the GUI settings) and download some chapters first")
+        return
+
+    print("\n📖 Novels with stored HTML:")
+    for i, name in enumerate(novels, 1):
+        stored = len(HtmlStore.for_directory(os.path.join(BASE_OUTPUT_DIR, name)).latest_entries())
+        print(f"   {i}. {name.replace('-', ' ').title()} ({stored} chapters)")
+
+    while True:
+        try:
+            choice = input(f"\n🔢 Select novel (1-{len(novels)}): ").strip()
+            choice_num = int(choice)
+            if 1 <= choice_num <= len(novels):
+                selected = novels[choice_num - 1]
+                break
+            print(f"❌ Please enter a number between 1 and {len(novels)}")
+        except ValueError:
+            print("❌ Please enter a valid number")
+        except KeyboardInterrupt:
+            print("\n👋 Goodbye!")
+            return
+
+    output_dir = os.path.join(BASE_OUTPUT_DIR, selected)
+    start_time = time.time()
+    updated, unchanged, failed = reextract_novel(output_dir)
+    elapsed = time.time() - start_time
+
+    print(f"\n🎉 Done in {elapsed:.1f}s: {updated} updated, {unchanged} unchanged, {failed} failed")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Network request blocking through the Chrome DevTools Protocol
+Stops ads, trackers, fonts, media and (optionally) stylesheets from loading; each site can allowlist what it needs
+"""
+
+from typing import List, Optional, Sequence
+
+from selenium.common.exceptions import WebDriverException
+
+from site_adapters import SiteAdapter, adapter_for_url
+
+
+def _extension_patterns(extensions: Sequence[str]) -> List[str]:
+    """URL patterns for file extensions, with and without a query string"""
+    patterns = []
+    for ext in extensions:
+        patterns += [f"*.{ext}", f"*.{ext}?*"]
+    return patterns
+
+
+# Third-party ad, analytics and widget hosts; chapter text never comes from these
+BLOCKED_DOMAINS = [
+    "*doubleclick.net*",
+    "*googlesyndication.com*",
+    "*googleadservices.com*",
+    "*google-analytics.com*",
+    "*googletagmanager.com*",
+    "*googletagservices.com*",
+    "*adservice.google.*",
+    "*amazon-adsystem.com*",
+    "*facebook.net*",
+    "*connect.facebook.*",
+    "*scorecardresearch.com*",
+    "*quantserve.com*",
+    "*cloudflareinsights.com*",
+    "*hotjar.com*",
+    "*taboola.com*",
+    "*outbrain.com*",
+    "*mgid.com*",
+    "*pubmatic.com*",
+    "*adnxs.com*",
+    "*criteo.*",
+    "*histats.com*",
+    "*disqus.com*",
+    "*fonts.googleapis.com*",
+    "*fonts.gstatic.com*"
+]
+
+FONT_PATTERNS = _extension_patterns(["woff", "woff2", "ttf", "otf", "eot"])
+MEDIA_PATTERNS = _extension_patterns(["mp4", "webm", "mp3", "ogg", "wav", "m3u8"])
+STYLESHEET_PATTERNS = _extension_patterns(["css"])
+
+
+def blocked_url_patterns(adapter: Optional[SiteAdapter] = None, block_stylesheets: bool = False) -> List[str]:
+    """Return the URL patterns to block on a site, minus anything it allowlists"""
+    patterns = BLOCKED_DOMAINS + FONT_PATTERNS + MEDIA_PATTERNS
+    if block_stylesheets:
+        patterns = patterns + STYLESHEET_PATTERNS
+    if adapter:
+        allowed = set(adapter.request_allowlist)
+        patterns = [pattern for pattern in patterns if pattern not in allowed]
+    return patterns
+
+
+def enable_request_blocking(driver, block_stylesheets: bool = False) -> bool:
+    """Block requests through CDP, switching to each site's list before navigating there
+
+    Wraps driver.get, so every caller (and the driver pool) gets the blocking
+    without passing the site around. The list is only re-sent when the
+    target site changes.
+    """
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+    except (WebDriverException, AttributeError) as e:
+        print(f"⚠️ Request blocking unavailable: {e}")
+        return False
+
+    raw_get = driver.get
+    applied = {"patterns": None}
+
+    def blocking_get(url):
+        patterns = blocked_url_patterns(adapter_for_url(url), block_stylesheets)
+        if patterns != applied["patterns"]:
+            try:
+                driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns})
+                applied["patterns"] = patterns
+            except WebDriverException as e:
+                print(f"⚠️ Could not update blocked URLs: {e}")
+        return raw_get(url)
+
+    driver.get = blocking_get
+    return True
@@ -0,0 +1,192 @@
+"""
+Chapter fetch retries with exponential backoff and a per-site circuit breaker
+Failures are classified as transient (retry), not found (give up at once) or blocked (back off and count toward pausing the site)
+"""
+
+import random
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Optional, TypeVar
+
+from rate_limit import domain_of
+
+TRANSIENT = "transient"  # Timeouts, network errors, pages that didn't render: worth retrying
+NOT_FOUND = "not_found"  # 404s, missing chapter URLs, redirects away from the chapter: retrying won't help
+BLOCKED = "blocked"  # Bot checks and 403/429/503 responses: retry later, pause the site if it keeps happening
+
+T = TypeVar("T")
+
+_failure = threading.local()
+_waiting = threading.local()
+
+
+def report_failure(kind: str):
+    """Record why the current thread's fetch failed; the most recent report wins"""
+    _failure.kind = kind
+
+
+def take_failure() -> str:
+    """Return and clear the current thread's failure kind (TRANSIENT when nothing was reported)"""
+    kind = getattr(_failure, "kind", None) or TRANSIENT
+    _failure.kind = None
+    return kind
+
+
+@contextmanager
+def release_while_waiting(slot):
+    """Hand `slot` (a semaphore the caller holds around a fetch) back during this thread's retry waits"""
+    previous = getattr(_waiting, "slot", None)
+    _waiting.slot = slot
+    try:
+        yield
+    finally:
+        _waiting.slot = previous
+
+
+@contextmanager
+def _slot_released():
+    slot = getattr(_waiting, "slot", None)
+    if slot is None:
+        yield
+        return
+    slot.release()
+    try:
+        yield
+    finally:
+        slot.acquire()
+
+
+class RetryPolicy:
+    """How often and how patiently to retry one chapter"""
+
+    def __init__(self, max_attempts: int = 3, base_delay: float = 5.0, max_delay: float = 120.0,
+                 jitter: float = 0.3):
+        self.max_attempts = max(1, max_attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.jitter = jitter
+
+    def backoff(self, attempt: int, kind: str = TRANSIENT) -> float:
+        """Delay before the next attempt; blocked responses wait twice as long"""
+        delay = self.base_delay * (2 ** (attempt - 1)) * (2 if kind == BLOCKED else 1)
+        delay = min(self.max_delay, delay)
+        return delay * random.uniform(1 - self.jitter, 1 + self.jitter)
+
+
+class CircuitBreaker:
+    """Pauses all requests to a site after repeated block signals
+
+    After `threshold` blocks in a row the site is paused for `cooldown`
+    seconds, doubling on every consecutive trip up to `max_cooldown`. After a
+    pause one request is let through; a single further block pauses again.
+    """
+
+    def __init__(self, threshold: int = 3, cooldown: float = 300.0, max_cooldown: float = 3600.0):
+        self._lock = threading.Lock()
+        self.configure(threshold, cooldown, max_cooldown)
+
+    def configure(self, threshold: int = 3, cooldown: float = 300.0, max_cooldown: float = 3600.0):
+        with self._lock:
+            self.threshold = max(1, threshold)
+            self.cooldown = cooldown
+            self.max_cooldown = max_cooldown
+            self._blocks: Dict[str, int] = {}
+            self._trips: Dict[str, int] = {}
+            self._open_until: Dict[str, float] = {}
+
+    def record_block(self, url: str):
+        domain = domain_of(url) or url
+        with self._lock:
+            self._blocks[domain] = self._blocks.get(domain, 0) + 1
+            if self._blocks[domain] < self.threshold:
+                return
+            trips = self._trips.get(domain, 0) + 1
+            self._trips[domain] = trips
+            pause = min(self.max_cooldown, self.cooldown * 2 ** (trips - 1))
+            self._open_until[domain] = time.monotonic() + pause
+            # Half-open afterwards: the next block trips the breaker again straight away
+            self._blocks[domain] = self.threshold - 1
+        print(f"🚧 {domain} keeps blocking requests, pausing it for {pause / 60:.0f} min")
+
+    def record_success(self, url: str):
+        domain = domain_of(url) or url
+        with self._lock:
+            self._blocks.pop(domain, None)
+            self._trips.pop(domain, None)
+            self._open_until.pop(domain, None)
+
+    def remaining(self, url: str) -> float:
+        """Seconds until the site may be contacted again (0 when it isn't paused)"""
+        domain = domain_of(url) or url
+        with self._lock:
+            return max(0.0, self._open_until.get(domain, 0) - time.monotonic())
+
+    def wait_until_closed(self, url: str, should_stop: Optional[Callable[[], bool]] = None) -> bool:
+        """Sleep while the site is paused; False if should_stop asked to give up"""
+        while True:
+            remaining = self.remaining(url)
+            if remaining <= 0:
+                return True
+            if should_stop and should_stop():
+                return False
+            time.sleep(min(remaining, 1.0))
+
+
+_circuit_breaker = CircuitBreaker()
+
+
+def get_circuit_breaker() -> CircuitBreaker:
+    """Return the process-wide breaker so every worker sees the same pause"""
+    return _circuit_breaker
+
+
+def _sleep(seconds: float, should_stop: Optional[Callable[[], bool]] = None) -> bool:
+    """Sleep in short steps; False as soon as should_stop asks to give up"""
+    deadline = time.monotonic() + seconds
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return True
+        if should_stop and should_stop():
+            return False
+        time.sleep(min(remaining, 1.0))
+
+
+def fetch_with_retry(fetch: Callable[[], T], url: str, policy: Optional[RetryPolicy] = None,
+                     should_stop: Optional[Callable[[], bool]] = None, label: str = "chapter") -> Optional[T]:
+    """Call fetch() until it returns something truthy, backing off between attempts
+
+    fetch reports why it failed through report_failure(); NOT_FOUND gives up
+    immediately, BLOCKED also feeds the site's circuit breaker. A slot set with
+    release_while_waiting() is only held during attempts, not while waiting.
+    """
+    policy = policy or RetryPolicy()
+    breaker = _circuit_breaker
+
+    for attempt in range(1, policy.max_attempts + 1):
+        with _slot_released():
+            if not breaker.wait_until_closed(url, should_stop):
+                return None
+        take_failure()
+
+        result = fetch()
+        if result:
+            breaker.record_success(url)
+            return result
+
+        kind = take_failure()
+        if kind == BLOCKED:
+            breaker.record_block(url)
+        if kind == NOT_FOUND:
+            print(f"📭 {label} not found, not retrying")
+            return result
+        if attempt == policy.max_attempts or (should_stop and should_stop()):
+            return result
+
+        delay = policy.backoff(attempt, kind)
+        print(f"🔁 {label} failed ({kind}), retrying in {delay:.0f}s (attempt {attempt + 1}/{policy.max_attempts})")
+        with _slot_released():
+            if not _sleep(delay, should_stop):
+                return result
+    return None
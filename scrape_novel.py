@@ -9,13 +9,34 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-import time
 import os
 import re
 import glob
 import random
 import traceback
 import winsound  # For Windows notification sound
+from driver_pool import ChromeDriverPool
+from chapter_index import ChapterIndex
+from concurrent_downloader import ConcurrentChapterDownloader
+from page_waits import (wait_for_document_ready, wait_for_content,
+                        wait_for_chapter_links, wait_for_more_links, count_links)
+from link_harvest import expand_all_volumes, harvest_chapter_links
+from http_fetch import HTTP_FETCH_AVAILABLE, HttpChapterFetcher, is_challenge_title
+from chapter_probe import ChapterProber, chapter_failure, is_valid_chapter
+from html_store import HtmlStore
+from selector_stats import SelectorStats, find_content
+from page_text import extract_page_text
+from request_blocking import enable_request_blocking
+from page_load import enable_site_page_loads
+from rate_limit import get_rate_limiter, limit_navigation_rate
+from retry_policy import (BLOCKED, NOT_FOUND, RetryPolicy, fetch_with_retry, get_circuit_breaker, report_failure,
+                          take_failure)
+from sitemap_discovery import discover_from_sitemap
+from chapter_archive import archive_via_browser, fetch_chapter_archive
+from feed_watch import FeedWatcher
+from wp_rest import WordPressApi, WordPressChapterSource, discover_new_posts
+from site_adapters import KATREADINGCAFE, NOVELBIN, adapter_for_url, get_adapter, novel_name_from_url
+import site_adapters
 
 # Try to import text-to-speech modules
 try:
@@ -37,6 +58,49 @@ VOICE_ENABLED = True  # Set to False to disable voice notifications
 VOICE_RATE = 180  # Speech rate (words per minute)
 USE_GREETING = True  # Include time-based greeting (Good morning, etc.)
 
+# Browser reuse settings
+DRIVER_POOL_SIZE = 1
+DRIVER_MAX_PAGE_LOADS = 50  # Recycle a browser after this many page loads
+DRIVER_MAX_RSS_MB = 1024  # Recycle a browser once it uses this much memory
+DRIVER_FRESH_SESSION = True  # Clear cookies and cache between chapters
+
+# Concurrent download settings (NovelBin)
+DOWNLOAD_WORKERS = 1  # Chapters fetched in parallel (1 = one at a time)
+PER_HOST_CONCURRENCY = 0  # Max chapters in flight per website (caps DOWNLOAD_WORKERS); 0 follows DOWNLOAD_WORKERS
+
+# Chapter fetch settings
+USE_HTTP_FETCH = True  # Try a plain HTTP GET before loading a chapter in Chrome
+SAVE_RAW_HTML = False  # Keep compressed chapter HTML for offline re-extraction (see reextract_chapters.py)
+USE_SCRIPT_EXTRACTION = True  # Read chapter text with one script call instead of WebElement.text
+USE_SITEMAP_DISCOVERY = True  # Build the chapter index from the site's XML sitemaps before driving a browser
+USE_CHAPTER_ARCHIVE = True  # NovelBin: read the whole chapter list from its archive endpoint instead of scrolling
+USE_WP_REST_API = True  # KatReadingCafe: pull chapter posts in bulk through the WordPress wp-json API
+CHECK_UPDATE_FEEDS = True  # Mark novels with new chapters from each site's feed before asking which to download
+
+# Network request blocking through Chrome DevTools
+BLOCK_REQUESTS = True  # Block ads, trackers, fonts and media
+BLOCK_STYLESHEETS = False  # Also block CSS on sites that don't allowlist it
+
+# "normal" waits for the load event, "eager" for DOMContentLoaded, "none" returns once navigation starts;
+# sites can override this in site_adapters.py
+PAGE_LOAD_STRATEGY = "eager"
+
+# Request pacing, shared by every browser and HTTP session per website
+RATE_LIMIT_PER_MINUTE = 30  # Sustained requests per minute to one site (0 = unlimited)
+RATE_LIMIT_BURST = 3  # Requests allowed back to back before pacing starts
+RATE_LIMIT_JITTER = 0.5  # Extra random delay in seconds
+RATE_LIMIT_OVERRIDES = {}  # {"novelbin.me": 20} for sites that need a different rate
+
+# Failure handling
+RETRY_MAX_ATTEMPTS = 3  # Tries per chapter before counting it as failed
+RETRY_BASE_DELAY = 5  # Seconds before the first retry, doubling each time
+BREAKER_THRESHOLD = 3  # Block signals in a row before a site is paused
+BREAKER_COOLDOWN = 300  # Seconds a blocking site is paused (doubles if it keeps blocking)
+
+_http_fetcher = None
+
+_driver_pool = None
+
 def play_notification_sound(success=True, message=None):
     """Play notification sound and speak message when process finishes"""
     try:
@@ -138,6 +202,12 @@ def speak_message(message):
         print(f"🔊 Could not speak message: {e}")
         print(f"💬 Message was: {message}")
 
+def announce_caught_up(latest_available):
+    """Tell the user there is nothing new to download"""
+    print(f"\n✅ Caught up: no chapters after chapter {latest_available} yet")
+    if VOICE_ENABLED:
+        speak_message(f"You're caught up. There are no new chapters after chapter {latest_available} yet.")
+
 def announce_completion(downloaded, requested, success=True):
     """Create and announce completion message"""
     if success and downloaded > 0:
@@ -170,8 +240,93 @@ def announce_completion(downloaded, requested, success=True):
     print(f"\n🎙️ Voice announcement: {full_message}")
     play_notification_sound(success=success, message=full_message)
 
-def get_available_chapters_info(series_url, website_type):
-    """Get information about available chapters from the website"""
+def discover_chapters_from_sitemap(series_url, website_type, output_dir):
+    """Seed the chapter index from the site's sitemaps over plain HTTP; returns what was found"""
+    fetcher = get_http_fetcher()
+    adapter = get_adapter(website_type, None)
+    if not USE_SITEMAP_DISCOVERY or not fetcher or not adapter:
+        return {}
+    
+    print(f"\n🗺️ Looking for chapters in the {adapter.display_name} sitemap...")
+    discovered = discover_from_sitemap(fetcher, series_url, adapter)
+    if discovered:
+        ChapterIndex.for_directory(output_dir).update(discovered)
+    return discovered
+
+def discover_chapters_from_archive(series_url, website_type, output_dir=None, driver=None):
+    """Read the full chapter list from the site's archive endpoint, over HTTP and then in the browser
+
+    Returns {chapter: (url, None)}, or {} so callers fall back to scrolling the chapter list.
+    """
+    adapter = get_adapter(website_type, None)
+    if not USE_CHAPTER_ARCHIVE or not adapter or not adapter.chapter_archive_path:
+        return {}
+    
+    print(f"\n📚 Fetching the {adapter.display_name} chapter archive...")
+    discovered = {}
+    fetcher = get_http_fetcher()
+    if fetcher:
+        discovered = fetch_chapter_archive(fetcher, series_url, adapter)
+    if not discovered and driver:
+        discovered = archive_via_browser(driver, series_url, adapter)
+    if discovered and output_dir:
+        index = ChapterIndex.for_directory(output_dir)
+        index.update(discovered)
+        index.learn_url_template()
+    return discovered
+
+def check_for_new_chapters(series_url, website_type, output_dir):
+    """Quick update check past the last known chapter; None means a full discovery is needed"""
+    index = ChapterIndex.for_directory(output_dir)
+    last_known = max(index.last_known_chapter() or 0, get_latest_chapter(output_dir))
+    if last_known <= 0 or website_type not in ("katreadingcafe", "novelbin"):
+        return None
+    if website_type == "katreadingcafe" and index.last_known_volume() is None:
+        return None
+    
+    print(f"\n⚡ Checking for chapters after chapter {last_known}...")
+    first_known = index.first_known_chapter()
+    
+    prober = ChapterProber(series_url, index, get_http_fetcher(), get_driver_pool().acquire)
+    try:
+        if website_type == "katreadingcafe":
+            # Only the newest volumes can have new chapters
+            prober.driver = get_driver_pool().acquire()
+            if not prober.driver:
+                return None
+            discovered = discover_katreadingcafe_chapters(prober.driver, series_url, min_volume=index.last_known_volume())
+            index.update(discovered)
+            new_chapters = [num for num in discovered if num > last_known]
+        else:
+            new_chapters = list(prober.probe_forward(last_known))
+    except Exception as e:
+        print(f"⚠️ Quick update check failed, falling back to full discovery: {e}")
+        return None
+    finally:
+        if prober.driver:
+            get_driver_pool().release(prober.driver)
+    
+    latest = max(new_chapters) if new_chapters else last_known
+    print(f"📈 {len(new_chapters)} new chapter(s) since chapter {last_known}")
+    return (first_known if first_known is not None else 1), latest, index.last_known_volume()
+
+def get_available_chapters_info(series_url, website_type, output_dir=None):
+    """Get information about available chapters from the website
+
+    When output_dir has a chapter index or downloaded chapters, only chapters
+    after the last known one are checked.
+    """
+    if output_dir:
+        from_sitemap = {}
+        if ChapterIndex.for_directory(output_dir).last_known_chapter() is None:
+            from_sitemap = discover_chapters_from_sitemap(series_url, website_type, output_dir)
+        
+        update = check_for_new_chapters(series_url, website_type, output_dir)
+        if update:
+            return update
+        if from_sitemap:
+            return min(from_sitemap), max(from_sitemap), ChapterIndex.for_directory(output_dir).last_known_volume()
+    
     print(f"\n🔍 Checking available chapters on {website_type}...")
     
     # Voice announcement for chapter discovery
@@ -179,182 +334,66 @@ def get_available_chapters_info(series_url, website_type):
         discovery_message = f"Starting chapter discovery for {website_type} website. This may take a moment."
         speak_message(discovery_message)
     
-    driver = setup_chrome_driver()
+    driver = get_driver_pool().acquire()
     if not driver:
         print("❌ Could not setup browser to check chapters")
         return None, None, None
     
     wait = WebDriverWait(driver, 30)
     available_chapters = []
-    latest_volume = 1  # Default to 1, will be updated from "New Chapter" element
+    latest_volume = 1  # Default to 1, updated from the discovered volumes
     
     try:
         if website_type == "katreadingcafe":
-            # Navigate to series page
-            driver.get(series_url)
-            time.sleep(3)
-            
-            # First, check what's the latest volume from "New Chapter" element
-            new_chapter_elements = driver.find_elements(By.XPATH, "//*[contains(text(), 'New Chapter')]")
-            if new_chapter_elements:
-                for elem in new_chapter_elements:
-                    try:
-                        next_sibling = driver.execute_script("return arguments[0].nextElementSibling;", elem)
-                        if next_sibling:
-                            sibling_text = next_sibling.text
-                            vol_match = re.search(r'Vol\.\s*(\d+)', sibling_text)
-                            if vol_match:
-                                latest_volume = int(vol_match.group(1))
-                                print(f"🆕 Latest volume detected from 'New Chapter': Vol. {latest_volume}")
-                                break
-                    except:
-                        continue
-            
-            # Find all available volumes
-            all_volumes = []
-            vol_elements = driver.find_elements(By.XPATH, "//span[contains(text(), 'Vol.')]")
-            for elem in vol_elements:
-                vol_text = elem.text.strip()
-                vol_match = re.search(r'Vol\.\s*(\d+)', vol_text)
-                if vol_match:
-                    vol_num = int(vol_match.group(1))
-                    all_volumes.append(vol_num)
-            
-            all_volumes = sorted(list(set(all_volumes)))
-            if all_volumes:
-                print(f"📚 Found volumes: {all_volumes}")
-            
-            # Expand volumes (skip the latest volume as it's already expanded)
-            for vol_num in all_volumes:
-                # Skip expanding the latest volume since it's already expanded
-                if vol_num == latest_volume:
-                    print(f"⏩ Skipping Vol. {vol_num} expansion (latest volume, already expanded)")
-                    
-                    # Just collect chapters from already visible latest volume
-                    links = driver.find_elements(By.TAG_NAME, "a")
-                    for a in links:
-                        txt = a.text.strip()
-                        # Match patterns like "Vol. 1 Ch. 1" or "Vol. 2 Ch. 15"  
-                        m = re.match(rf'Vol\.\s*{vol_num}\s*Ch\.\s*(\d+)', txt)
-                        if m:
-                            chapter_num = int(m.group(1))
-                            available_chapters.append(chapter_num)
-                    
-                    print(f"✅ Collected chapters from Vol. {vol_num} (already expanded)")
-                else:
-                    # Expand older volumes
-                    try:
-                        vol_selector = f"//span[text()='Vol. {vol_num}']"
-                        vol_element = driver.find_element(By.XPATH, vol_selector)
-                        driver.execute_script("arguments[0].scrollIntoView(true);", vol_element)
-                        time.sleep(1)
-                        vol_element.click()
-                        time.sleep(3)
-                        
-                        # Collect chapter links for this volume
-                        links = driver.find_elements(By.TAG_NAME, "a")
-                        for a in links:
-                            txt = a.text.strip()
-                            # Match patterns like "Vol. 1 Ch. 1" or "Vol. 2 Ch. 15"  
-                            m = re.match(rf'Vol\.\s*{vol_num}\s*Ch\.\s*(\d+)', txt)
-                            if m:
-                                chapter_num = int(m.group(1))
-                                available_chapters.append(chapter_num)
-                        
-                        print(f"✅ Expanded Vol. {vol_num}")
-                    except Exception as e:
-                        print(f"❌ Could not expand Vol. {vol_num}: {e}")
-                        continue
+            discovered = discover_katreadingcafe_chapters(driver, series_url)
+            available_chapters.extend(discovered)
+            if discovered:
+                latest_volume = max(volume for _, volume in discovered.values())
+                if output_dir:
+                    # Lets the next check look at the newest volumes only
+                    ChapterIndex.for_directory(output_dir).update(discovered)
             
         elif website_type == "novelbin":
+            # One request for the whole list; the lazy-loading chapter tab is only scrolled when it fails
+            available_chapters.extend(discover_chapters_from_archive(series_url, website_type, output_dir, driver))
+        
+        if website_type == "novelbin" and not available_chapters:
             # Create the chapter list URL
-            chapters_list_url = series_url.rstrip('/') + "#tab-chapters-title"
+            chapters_list_url = NOVELBIN.chapter_list_url(series_url)
             driver.get(chapters_list_url)
-            time.sleep(random.uniform(3, 6))
+            wait_for_document_ready(driver)
             
             # Activate chapter tab if needed
             try:
                 chapter_tab = driver.find_element(By.CSS_SELECTOR, "#tab-chapters-title")
                 if not chapter_tab.get_attribute("aria-expanded") == "true":
                     driver.execute_script("arguments[0].scrollIntoView({behavior: 'smooth'});", chapter_tab)
-                    time.sleep(random.uniform(1, 2))
                     chapter_tab.click()
-                    time.sleep(random.uniform(2, 4))
+                    wait_for_chapter_links(driver, timeout=10)
             except:
                 pass
             
             # Advanced chapter loading strategy for NovelBin
             print("📜 Loading all available chapters systematically...")
             
+            found_links = {}
+            
             def get_all_chapter_links():
-                """Get all chapter links currently loaded on the page with multiple selectors"""
-                chapters = set()
-                
-                # Try multiple selectors for maximum coverage
-                selectors = [
-                    "//a[contains(@href, '/chapter-')]",
-                    "//a[contains(@href, 'chapter')]",
-                    ".chapter-item a",
-                    ".list-chapter a", 
-                    "a[href*='chapter']",
-                    ".chapter-list a",
-                    ".chapter-number",
-                    "[data-chapter]"
-                ]
-                
-                for selector in selectors:
-                    try:
-                        if selector.startswith("//"):
-                            elements = driver.find_elements(By.XPATH, selector)
-                        else:
-                            elements = driver.find_elements(By.CSS_SELECTOR, selector)
-                        
-                        for element in elements:
-                            href = element.get_attribute("href")
-                            if href and 'chapter' in href.lower():
-                                # Try multiple patterns for chapter numbers
-                                patterns = [
-                                    r'chapter-(\d+)',
-                                    r'ch-(\d+)',
-                                    r'chapter/(\d+)',
-                                    r'c(\d+)',
-                                    r'chap-(\d+)',
-                                    r'chapter(\d+)',
-                                    r'/(\d+)/?$'  # Numbers at end of URL
-                                ]
-                                
-                                for pattern in patterns:
-                                    match = re.search(pattern, href)
-                                    if match:
-                                        chapters.add(int(match.group(1)))
-                                        break
-                    except:
-                        continue
-                
-                return chapters
+                """Get all chapter numbers currently loaded on the page in one round trip, remembering their URLs"""
+                links = harvest_chapter_links(driver, NOVELBIN.discovery_url_patterns, require_chapter_in_href=True)
+                found_links.update(links)
+                return set(links)
             
             # CRITICAL FIX: Try to navigate to chapter 0 and 1 first to force loading from beginning
             print("🎯 Attempting to force load early chapters by navigating to chapter 0 and 1...")
             chapter_0_or_1_found = False
             try:
                 # Try common chapter 0 and 1 URL patterns (many novels start with chapter 0)
-                base_url = series_url.rstrip('/')
-                early_chapter_patterns = [
-                    f"{base_url}/chapter-0",    # Try chapter 0 first
-                    f"{base_url}/ch-0", 
-                    f"{base_url}/c0",
-                    f"{base_url}/chapter/0",
-                    f"{base_url}/chapter-1",    # Then try chapter 1
-                    f"{base_url}/ch-1", 
-                    f"{base_url}/c1",
-                    f"{base_url}/chapter/1"
-                ]
-                
-                for pattern in early_chapter_patterns:
+                for chapter_num, pattern in NOVELBIN.early_chapter_urls(series_url):
                     try:
                         print(f"   Trying: {pattern}")
                         driver.get(pattern)
-                        time.sleep(3)
+                        wait_for_document_ready(driver)
                         
                         # Check if we got a valid chapter page
                         current_title = driver.title.lower()
@@ -362,20 +401,19 @@ def get_available_chapters_info(series_url, website_type):
                         
                         if ("chapter" in current_title and "404" not in current_title and 
                             "not found" not in current_title and "chapter" in current_url):
-                            chapter_num = "0" if "/chapter-0" in pattern or "/ch-0" in pattern or "/c0" in pattern or "/chapter/0" in pattern else "1"
                             print(f"✅ Successfully accessed chapter {chapter_num} via: {pattern}")
                             chapter_0_or_1_found = True
                             
                             # Now go back to chapter list with early chapters likely cached
                             driver.get(chapters_list_url)
-                            time.sleep(4)
+                            wait_for_document_ready(driver)
                             
                             # Reactivate chapter tab
                             try:
                                 chapter_tab = driver.find_element(By.CSS_SELECTOR, "#tab-chapters-title")
                                 if not chapter_tab.get_attribute("aria-expanded") == "true":
                                     chapter_tab.click()
-                                    time.sleep(3)
+                                    wait_for_chapter_links(driver, timeout=10)
                             except:
                                 pass
                             break
@@ -389,18 +427,18 @@ def get_available_chapters_info(series_url, website_type):
                     print("⚠️ Could not pre-load chapter 0 or 1, proceeding with standard discovery")
                     # Go back to chapter list URL
                     driver.get(chapters_list_url)
-                    time.sleep(3)
+                    wait_for_document_ready(driver)
                     
             except Exception as e:
                 print(f"⚠️ Error during chapter 1 pre-load: {e}")
                 # Ensure we're back on the chapter list page
                 driver.get(chapters_list_url)
-                time.sleep(3)
+                wait_for_document_ready(driver)
             
             # Start from the very top AFTER trying to load early chapters
             print("📍 Starting systematic chapter discovery from top...")
             driver.execute_script("window.scrollTo(0, 0);")
-            time.sleep(3)
+            link_count = wait_for_chapter_links(driver, timeout=10)
             
             # Track chapters found during scrolling
             all_found_chapters = set()
@@ -436,7 +474,7 @@ def get_available_chapters_info(series_url, website_type):
                     scroll_amount = random.randint(1000, 1500)
                 
                 driver.execute_script(f"window.scrollBy(0, {scroll_amount});")
-                time.sleep(random.uniform(2.5, 4))  # Adequate wait for lazy loading
+                link_count = wait_for_more_links(driver, link_count, timeout=4)  # Returns as soon as lazy loading adds links
                 
                 # Get current chapters
                 current_chapters = get_all_chapter_links()
@@ -467,11 +505,26 @@ def get_available_chapters_info(series_url, website_type):
                 if current_scroll + window_height >= scroll_height - 100:
                     print("📝 Reached bottom of page")
                     # Final wait and check
-                    time.sleep(3)
+                    wait_for_more_links(driver, link_count, timeout=3)
                     final_chapters = get_all_chapter_links()
                     all_found_chapters.update(final_chapters)
                     break
             
+            # The list can stop lazy-loading early, so confirm the newest chapter by probing chapter-N URLs
+            prober = ChapterProber(series_url, http_fetcher=get_http_fetcher(), get_driver=lambda: driver)
+            latest_probed = prober.find_latest(max(all_found_chapters) if all_found_chapters else None)
+            if latest_probed is not None and latest_probed not in all_found_chapters:
+                print(f"🔎 Chapter list stopped early, URL probing found chapters up to {latest_probed}")
+                all_found_chapters.add(latest_probed)
+            if prober.first_chapter is not None and prober.first_chapter not in all_found_chapters:
+                # Nothing came from the list, so the range starts at the chapter probing verified
+                all_found_chapters.add(prober.first_chapter)
+            
+            if output_dir and found_links:
+                index = ChapterIndex.for_directory(output_dir)
+                index.update({num: (url, None) for num, url in found_links.items()})
+                index.learn_url_template()
+            
             # Convert to list and add to available_chapters
             for chapter_num in all_found_chapters:
                 available_chapters.append(chapter_num)
@@ -530,10 +583,7 @@ def get_available_chapters_info(series_url, website_type):
         print(f"❌ Error checking chapters: {e}")
         return None, None, None
     finally:
-        try:
-            driver.quit()
-        except:
-            pass
+        get_driver_pool().release(driver)
 
 def ask_chapters_to_download(latest_downloaded, min_available=None, max_available=None, latest_volume=None):
     """Ask user how many chapters to download with context about available chapters"""
@@ -626,31 +676,33 @@ def get_novel_folder_name(url):
 
 def detect_website_type(url):
     """Detect which website type based on URL"""
-    if "katreadingcafe.com" in url:
-        return "katreadingcafe"
-    elif "novelbin.me" in url:
-        return "novelbin"
-    else:
-        return "unknown"
+    return site_adapters.detect_website_type(url)
+
+def check_feeds_for_updates(urls):
+    """Poll each site's update feed once; returns {url: new chapter numbers} for novels the feeds mention"""
+    fetcher = get_http_fetcher()
+    if not CHECK_UPDATE_FEEDS or not fetcher:
+        return {}
+    
+    print("\n📰 Checking site feeds for new chapters...")
+    novels = [(url, get_latest_chapter(os.path.join(BASE_OUTPUT_DIR, get_novel_folder_name(url)))) for url in urls]
+    return FeedWatcher.for_directory(BASE_OUTPUT_DIR).check(fetcher, novels)
 
-def select_url(urls):
+def select_url(urls, updates=None):
     """Let user select which URL to scrape"""
     if not urls:
         return None, None, None
     
+    updates = updates or {}
     print("\n📚 Available novels:")
     for i, url in enumerate(urls, 1):
-        if "katreadingcafe.com" in url:
-            novel_name = url.split('/')[-2].replace('-', ' ').title()
-            website = "KatReadingCafe"
-        elif "novelbin.me" in url:
-            novel_name = url.split('/')[-1].replace('-', ' ').title()
-            website = "NovelBin"
-        else:
-            novel_name = url.split('/')[-1].replace('-', ' ').title()
-            website = "Unknown"
+        adapter = adapter_for_url(url)
+        novel_name = novel_name_from_url(url)
+        website = adapter.display_name if adapter else "Unknown"
         
-        print(f"   {i}. {novel_name} ({website})")
+        new_chapters = updates.get(url)
+        marker = f" 🆕 {len(new_chapters)} new (up to Ch. {new_chapters[-1]})" if new_chapters else ""
+        print(f"   {i}. {novel_name} ({website}){marker}")
     
     while True:
         try:
@@ -661,12 +713,7 @@ def select_url(urls):
                 folder_name = get_novel_folder_name(selected_url)
                 website_type = detect_website_type(selected_url)
                 
-                if "katreadingcafe.com" in selected_url:
-                    novel_name = selected_url.split('/')[-2].replace('-', ' ').title()
-                elif "novelbin.me" in selected_url:
-                    novel_name = selected_url.split('/')[-1].replace('-', ' ').title()
-                else:
-                    novel_name = folder_name.replace('-', ' ').title()
+                novel_name = novel_name_from_url(selected_url)
                 
                 print(f"✅ Selected: {novel_name}")
                 print(f"🌐 Website: {website_type}")
@@ -699,6 +746,12 @@ def get_latest_chapter(output_dir):
     return max(nums) if nums else 0
 
 
+def store_raw_html(output_dir, chapter_num, url, html):
+    """Keep a fetched chapter page for offline re-extraction when SAVE_RAW_HTML is on"""
+    if SAVE_RAW_HTML:
+        HtmlStore.for_directory(output_dir).save(chapter_num, url, html)
+
+
 def save_chapter(title, content, chapter_num, output_dir):
     """Save chapter content to file with safe filename"""
     safe_title = re.sub(r'[<>:"/\\|?*#]', '', title)
@@ -732,390 +785,434 @@ def save_chapter(title, content, chapter_num, output_dir):
             print(f"❌ Failed to save chapter {chapter_num}: {e}")
             return False
 
+def discover_katreadingcafe_chapters(driver, series_url, min_volume=None):
+    """Expand KatReadingCafe volumes and return {chapter_num: (url, volume)}
+
+    Volumes before min_volume are assumed to be indexed already and are skipped.
+    """
+    # Navigate to series page
+    driver.get(series_url)
+    wait_for_document_ready(driver)
+    
+    # The latest volume is already open; every older one is expanded in the same script call
+    return expand_all_volumes(driver, min_volume=min_volume)
+
 def scrape_katreadingcafe(driver, wait, series_url, chapters_per_run, start, end, output_dir):
     """Scrape chapters from KatReadingCafe with multi-volume support"""
     print("🔍 KatReadingCafe: Checking available volumes and chapters...")
     
-    # Navigate to series page
-    driver.get(series_url)
-    time.sleep(3)
+    index = ChapterIndex.for_directory(output_dir)
+    if not index.covers(end):
+        discover_chapters_from_sitemap(series_url, "katreadingcafe", output_dir)
+    fetcher = get_http_fetcher()
+    api = WordPressApi(fetcher, series_url) if USE_WP_REST_API and fetcher else None
+    if api and not index.covers(end):
+        new_posts = discover_new_posts(api, series_url, KATREADINGCAFE, index.last_discovered_at())
+        print(f"📦 WordPress API found {len(new_posts)} chapter posts to index")
+        index.update(new_posts)
     
-    # Detect the latest volume from "New Chapter" elements (this is typically already visible)
-    latest_volume_from_new_chapter = None
-    new_chapter_elements = driver.find_elements(By.XPATH, "//*[contains(text(), 'New Chapter')]")
+    if index.covers(end):
+        print(f"📇 Chapter index already covers up to chapter {index.last_known_chapter()}, skipping discovery")
+    else:
+        discovered = discover_katreadingcafe_chapters(driver, series_url, min_volume=index.last_known_volume())
+        new_entries = index.update(discovered)
+        print(f"📇 Chapter index updated with {new_entries} new or changed chapters")
     
-    if new_chapter_elements:
-        print(f"Found {len(new_chapter_elements)} 'New Chapter' elements")
-        for elem in new_chapter_elements:
-            try:
-                next_sibling = driver.execute_script("return arguments[0].nextElementSibling;", elem)
-                if next_sibling:
-                    sibling_text = next_sibling.text
-                    vol_match = re.search(r'Vol\.\s*(\d+)', sibling_text)
-                    if vol_match:
-                        latest_volume_from_new_chapter = int(vol_match.group(1))
-                        print(f"✅ Latest Vol. {latest_volume_from_new_chapter} detected from 'New Chapter' sibling (should be already visible)!")
-                        break
-            except:
-                continue
-    
-    # Find all available volume buttons
-    all_volumes = []
-    vol_elements = driver.find_elements(By.XPATH, "//span[contains(text(), 'Vol.')]")
-    for elem in vol_elements:
-        vol_text = elem.text.strip()
-        vol_match = re.search(r'Vol\.\s*(\d+)', vol_text)
-        if vol_match:
-            vol_num = int(vol_match.group(1))
-            all_volumes.append(vol_num)
-    
-    all_volumes = sorted(list(set(all_volumes)))
-    if all_volumes:
-        print(f"📚 Available volumes: {all_volumes}")
-        if latest_volume_from_new_chapter:
-            print(f"🎯 Vol. {latest_volume_from_new_chapter} is the latest (from 'New Chapter'), should be already visible")
-    
-    # Collect all chapters from all necessary volumes
-    all_chapters = {}  # {chapter_num: (url, volume)}
-    
-    for vol_num in all_volumes:
-        vol_selector = f"//span[text()='Vol. {vol_num}']"
-        
-        # Skip expanding if this is the latest volume (it's always already expanded on page load)
-        if latest_volume_from_new_chapter and vol_num == latest_volume_from_new_chapter:
-            print(f"⏩ Skipping Vol. {vol_num} expansion (latest volume, always already expanded on page load)")
-        else:
-            # Expand older volumes since they are collapsed by default
-            try:
-                vol_element = driver.find_element(By.XPATH, vol_selector)
-                print(f"🔍 Expanding Vol. {vol_num} (older volume, needs to be expanded)...")
-                driver.execute_script("arguments[0].scrollIntoView(true);", vol_element)
-                time.sleep(1)
-                vol_element.click()
-                time.sleep(3)
-            except Exception as e:
-                print(f"❌ Could not expand Vol. {vol_num}: {e}")
-                continue
-        
-        # Collect chapter links for this volume (whether it was already visible or just expanded)
-        try:
-            links = driver.find_elements(By.TAG_NAME, "a")
-            vol_chapters = 0
-            
-            for a in links:
-                txt = a.text.strip()
-                # Match patterns like "Vol. 1 Ch. 1" or "Vol. 2 Ch. 15"
-                m = re.match(rf'Vol\.\s*{vol_num}\s*Ch\.\s*(\d+)', txt)
-                if m:
-                    chapter_num = int(m.group(1))
-                    chapter_url = a.get_attribute("href")
-                    if chapter_url:
-                        all_chapters[chapter_num] = (chapter_url, vol_num)
-                        vol_chapters += 1
-            
-            print(f"📋 Vol. {vol_num}: Found {vol_chapters} chapters")
-            
-        except Exception as e:
-            print(f"❌ Could not collect chapters from Vol. {vol_num}: {e}")
-            continue
+    all_chapters = index.as_chapter_map()
     
     # Sort chapters by number
     sorted_chapters = sorted(all_chapters.keys())
     if sorted_chapters:
         print(f"📊 Total chapters available: {len(sorted_chapters)} (Ch. {sorted_chapters[0]} - Ch. {sorted_chapters[-1]})")
     
-    # Download the requested chapters
-    downloaded = 0
+    wanted = [num for num in sorted_chapters if start <= num <= end][:chapters_per_run]
+    source = None
+    if api:
+        source = WordPressChapterSource(api, {num: all_chapters[num][0] for num in wanted},
+                                        title_suffix=KATREADINGCAFE.page_title_suffix)
     
-    for chapter_num in sorted_chapters:
-        if chapter_num < start or chapter_num > end or downloaded >= chapters_per_run:
-            continue
+    def fetch_chapter(chapter_num, chapter_url, volume):
+        """One attempt at a chapter: WordPress API batch, plain HTTP, then the browser; returns (title, content) or None"""
+        chapter = source.get(chapter_num) if source else None
+        if chapter:
+            print(f"⚡ Got Chapter {chapter_num} from Vol. {volume or '?'} through the WordPress API")
+            return chapter
         
-        chapter_url, volume = all_chapters[chapter_num]
-        print(f"🌐 Loading Chapter {chapter_num} (Vol. {volume}) -> {chapter_url}")
+        # Server-rendered WordPress pages usually don't need a browser at all
+        chapter = fetcher.fetch(chapter_url, KATREADINGCAFE.content_selectors) if fetcher else None
+        if chapter:
+            title, content, final_url, html = chapter
+            store_raw_html(output_dir, chapter_num, final_url, html)
+            print(f"⚡ Fetched Chapter {chapter_num} from Vol. {volume or '?'} over HTTP")
+            return title, content
+        
+        # A 404 or block from the API or HTTP step says nothing about how the browser will do
+        take_failure()
+        print(f"🌐 Loading Chapter {chapter_num} (Vol. {volume or '?'}) -> {chapter_url}")
         
         try:
             driver.get(chapter_url)
-            time.sleep(2)
+            wait_for_content(driver, KATREADINGCAFE.content_selectors)
+            if SAVE_RAW_HTML:
+                store_raw_html(output_dir, chapter_num, driver.current_url, driver.page_source)
             
-            title = driver.title.strip()
+            stats = SelectorStats.for_directory(output_dir)
+            page = None
+            if USE_SCRIPT_EXTRACTION:
+                page = extract_page_text(driver, KATREADINGCAFE.content_selectors, KATREADINGCAFE.min_content_length,
+                                         False, stats, KATREADINGCAFE.name)
             
-            # Try different content selectors
-            content = ""
-            selectors = ["div.entry-content", ".post-content", ".chapter-content", "article", ".content"]
-            
-            for sel in selectors:
-                try:
-                    content = driver.find_element(By.CSS_SELECTOR, sel).text
-                    break
-                except:
-                    continue
+            if page:
+                title, _, content = page
+            else:
+                title = driver.title.strip()
+                
+                # Try content selectors, the ones that worked for this novel before first
+                found = find_content(driver, KATREADINGCAFE.content_selectors, KATREADINGCAFE.min_content_length,
+                                     stats, KATREADINGCAFE.name)
+                content = found[1] if found else ""
             
             if not content:
                 print(f"❌ Could not extract content for chapter {chapter_num}")
-                continue
+                if is_challenge_title(title):
+                    report_failure(BLOCKED)
+                return None
             
-            if save_chapter(title, content, chapter_num, output_dir):
-                downloaded += 1
-                print(f"✅ Downloaded Chapter {chapter_num} from Vol. {volume}")
+            return title, content
             
         except Exception as e:
             print(f"❌ Error downloading chapter {chapter_num}: {e}")
-            continue
+            return None
+    
+    def fetch(chapter_num):
+        chapter_url, volume = all_chapters[chapter_num]
+        return fetch_with_retry(lambda: fetch_chapter(chapter_num, chapter_url, volume), chapter_url,
+                                get_retry_policy(), label=f"Chapter {chapter_num}")
+    
+    def commit(title, content, chapter_num):
+        return save_chapter(title, content, chapter_num, output_dir)
+    
+    # Download the requested chapters
+    downloaded = 0
+    for chapter_num in wanted:
+        chapter = fetch(chapter_num)
+        if chapter and commit(chapter[0], chapter[1], chapter_num):
+            downloaded += 1
     
     return downloaded
 
-def scrape_novelbin_single_with_fresh_browser(series_url, target_chapter, output_dir):
-    """Scrape a single chapter from NovelBin with fresh browser instance"""
-    print(f"🔍 NovelBin: Downloading chapter {target_chapter}...")
+def is_valid_chapter_page(driver, target_chapter=None):
+    """Check the loaded page is a real chapter (not a 404 or a redirect elsewhere)"""
+    try:
+        title = driver.title.strip()
+        current_url = driver.current_url
+    except Exception:
+        return False
+    return is_valid_chapter(title, current_url, target_chapter)
+
+def fetch_novelbin_chapter_over_http(series_url, target_chapter, index):
+    """Fetch a NovelBin chapter from its indexed or templated URL without a browser"""
+    fetcher = get_http_fetcher()
+    if not fetcher:
+        return None
     
-    # Setup fresh Chrome driver for this chapter
-    driver = setup_chrome_driver()
-    if not driver:
-        print(f"❌ Failed to setup Chrome driver for chapter {target_chapter}")
-        return 0
+    chapter_url = index.get_url(target_chapter) or index.build_url(target_chapter, NOVELBIN.url_template(series_url))
+    chapter = fetcher.fetch(chapter_url, NOVELBIN.content_selectors)
+    if not chapter:
+        return None
     
-    wait = WebDriverWait(driver, 30)
+    title, content, final_url, html = chapter
+    if not is_valid_chapter(title, final_url, target_chapter):
+        print(f"⚠️ HTTP response for chapter {target_chapter} is not the right chapter page, using browser")
+        return None
+    store_raw_html(index.output_dir, target_chapter, final_url, html)
     
+    index.update({target_chapter: (final_url, None)})
+    return title, content
+
+def try_novelbin_url_template(driver, series_url, target_chapter, index):
+    """Load the chapter straight from its templated chapter-N URL; True if the page is valid"""
+    default_template = NOVELBIN.url_template(series_url)
+    chapter_url = index.build_url(target_chapter, default_template)
+    
+    print(f"🎯 Trying templated URL for chapter {target_chapter}: {chapter_url}")
     try:
-        # Create the chapter list URL
-        chapters_list_url = series_url.rstrip('/') + "#tab-chapters-title"
-        print(f"📋 Loading chapter list: {chapters_list_url}")
-        
-        # Navigate to chapter list
-        driver.get(chapters_list_url)
-        time.sleep(random.uniform(3, 6))
-        
-        # Activate chapter tab if needed
-        try:
-            chapter_tab = driver.find_element(By.CSS_SELECTOR, "#tab-chapters-title")
-            if not chapter_tab.get_attribute("aria-expanded") == "true":
-                driver.execute_script("arguments[0].scrollIntoView({behavior: 'smooth'});", chapter_tab)
-                time.sleep(random.uniform(1, 2))
-                chapter_tab.click()
-                time.sleep(random.uniform(2, 4))
-        except:
-            pass
-        
-        # Smart chapter loading prioritizing early chapters
-        print("📜 Loading chapters with early chapter priority...")
-        
-        def get_current_chapters():
-            """Get all chapter links currently loaded on the page"""
-            # Try multiple selectors for chapter links
-            link_selectors = [
-                "//a[contains(@href, '/chapter-')]",
-                "//a[contains(@class, 'chapter')]",
-                ".chapter-item a",
-                ".list-chapter a",
-                "a[href*='chapter']"
-            ]
-            
-            all_links = []
-            for selector in link_selectors:
-                try:
-                    if selector.startswith("//"):
-                        links = driver.find_elements(By.XPATH, selector)
-                    else:
-                        links = driver.find_elements(By.CSS_SELECTOR, selector)
-                    all_links.extend(links)
-                except:
-                    continue
-            
-            return list(set(all_links))  # Remove duplicates
+        driver.get(chapter_url)
+        wait_for_document_ready(driver)
+    except Exception as e:
+        print(f"⚠️ Templated URL failed to load: {e}")
+        return False
+    
+    if not is_valid_chapter_page(driver, target_chapter):
+        print(f"⚠️ Templated URL did not land on chapter {target_chapter}, falling back to chapter list")
+        return False
+    
+    wait_for_content(driver, NOVELBIN.content_selectors, min_length=100)
+    
+    # Remember the real (possibly redirected) URL for next time
+    index.update({target_chapter: (driver.current_url, None)})
+    return True
+
+def find_novelbin_chapter_url(driver, series_url, target_chapter, discovered):
+    """Load the NovelBin chapter list and search it for the target chapter URL
+
+    Every chapter link analysed is added to `discovered` as {chapter: (url, None)}
+    so callers can store it in the chapter index.
+    """
+    # Create the chapter list URL
+    chapters_list_url = NOVELBIN.chapter_list_url(series_url)
+    print(f"📋 Loading chapter list: {chapters_list_url}")
+    
+    # Navigate to chapter list
+    driver.get(chapters_list_url)
+    wait_for_document_ready(driver)
+    
+    # Activate chapter tab if needed
+    try:
+        chapter_tab = driver.find_element(By.CSS_SELECTOR, "#tab-chapters-title")
+        if not chapter_tab.get_attribute("aria-expanded") == "true":
+            driver.execute_script("arguments[0].scrollIntoView({behavior: 'smooth'});", chapter_tab)
+            chapter_tab.click()
+            wait_for_chapter_links(driver, timeout=10)
+    except:
+        pass
+    
+    # Smart chapter loading prioritizing early chapters
+    print("📜 Loading chapters with early chapter priority...")
+    
+    def get_current_chapters():
+        """Get {chapter: url} for all chapter links currently loaded on the page in one round trip"""
+        return harvest_chapter_links(driver)
+    
+    # Start from the very top to prioritize early chapters
+    driver.execute_script("window.scrollTo(0, 0);")
+    link_count = count_links(driver)
+    
+    # Check if target chapter is in early chapters (likely to be found quickly)
+    early_chapter_threshold = 100
+    is_early_chapter = target_chapter <= early_chapter_threshold
+    
+    last_chapter_count = 0
+    max_iterations = 25 if is_early_chapter else 30  # Adjust iterations based on target
+    stable_count = 0
+    
+    print(f"🎯 Searching for chapter {target_chapter} ({'early' if is_early_chapter else 'later'} chapter)")
+    
+    for iteration in range(max_iterations):
+        # Scroll down incrementally
+        scroll_height = driver.execute_script("return document.body.scrollHeight;")
+        current_scroll = driver.execute_script("return window.pageYOffset;")
         
-        # Start from the very top to prioritize early chapters
-        driver.execute_script("window.scrollTo(0, 0);")
-        time.sleep(2)
+        # Adaptive scrolling strategy for better early chapter detection
+        if is_early_chapter and iteration < 10:
+            # For early chapters, scroll more gradually from the top
+            scroll_amount = 400 + (iteration * 150)
+        elif iteration < 15:
+            # Medium scrolls for middle range
+            scroll_amount = random.randint(600, 1000)
+        else:
+            # Larger scrolls for comprehensive coverage
+            scroll_amount = random.randint(1000, 1500)
         
-        # Check if target chapter is in early chapters (likely to be found quickly)
-        early_chapter_threshold = 100
-        is_early_chapter = target_chapter <= early_chapter_threshold
+        driver.execute_script(f"window.scrollBy(0, {scroll_amount});")
+        link_count = wait_for_more_links(driver, link_count, timeout=4)
         
-        last_chapter_count = 0
-        max_iterations = 25 if is_early_chapter else 30  # Adjust iterations based on target
-        stable_count = 0
+        # Check current chapter count
+        current_links = get_current_chapters()
+        current_count = len(current_links)
         
-        print(f"🎯 Searching for chapter {target_chapter} ({'early' if is_early_chapter else 'later'} chapter)")
+        print(f"📊 Iteration {iteration + 1}: Found {current_count} chapter links")
         
-        for iteration in range(max_iterations):
-            # Scroll down incrementally
-            scroll_height = driver.execute_script("return document.body.scrollHeight;")
-            current_scroll = driver.execute_script("return window.pageYOffset;")
-            
-            # Adaptive scrolling strategy for better early chapter detection
-            if is_early_chapter and iteration < 10:
-                # For early chapters, scroll more gradually from the top
-                scroll_amount = 400 + (iteration * 150)
-            elif iteration < 15:
-                # Medium scrolls for middle range
-                scroll_amount = random.randint(600, 1000)
-            else:
-                # Larger scrolls for comprehensive coverage
-                scroll_amount = random.randint(1000, 1500)
-            
-            driver.execute_script(f"window.scrollBy(0, {scroll_amount});")
-            time.sleep(random.uniform(2, 4))  # Wait longer for content to load
-            
-            # Check current chapter count
-            current_links = get_current_chapters()
-            current_count = len(current_links)
-            
-            print(f"📊 Iteration {iteration + 1}: Found {current_count} chapter links")
-            
-            # If no new chapters loaded, increment stable counter
-            if current_count == last_chapter_count:
-                stable_count += 1
-                if stable_count >= 3:  # If count stable for 3 iterations, we're likely done
-                    print("📝 Chapter count stabilized, moving to search phase")
-                    break
-            else:
-                stable_count = 0  # Reset if new content was loaded
-            
-            last_chapter_count = current_count
-            
-            # Also check if we've reached the bottom
-            new_scroll_height = driver.execute_script("return document.body.scrollHeight;")
-            if current_scroll + driver.execute_script("return window.innerHeight;") >= new_scroll_height - 100:
-                print("� Reached bottom of page")
+        # If no new chapters loaded, increment stable counter
+        if current_count == last_chapter_count:
+            stable_count += 1
+            if stable_count >= 3:  # If count stable for 3 iterations, we're likely done
+                print("📝 Chapter count stabilized, moving to search phase")
                 break
+        else:
+            stable_count = 0  # Reset if new content was loaded
         
-        # Final aggressive scroll to absolute bottom
-        driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-        time.sleep(3)
-        
-        # Now search for the target chapter
-        chapter_url = None
-        all_chapter_links = get_current_chapters()
-        found_chapters = []
+        last_chapter_count = current_count
         
-        print(f"🔍 Analyzing {len(all_chapter_links)} total chapter links...")
+        # Also check if we've reached the bottom
+        new_scroll_height = driver.execute_script("return document.body.scrollHeight;")
+        if current_scroll + driver.execute_script("return window.innerHeight;") >= new_scroll_height - 100:
+            print("� Reached bottom of page")
+            break
+    
+    # Final aggressive scroll to absolute bottom
+    driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+    wait_for_more_links(driver, link_count, timeout=3)
+    
+    # Now search for the target chapter
+    chapter_url = None
+    all_chapter_links = get_current_chapters()
+    found_chapters = []
+    
+    print(f"🔍 Analyzing {len(all_chapter_links)} total chapter links...")
+    
+    for chapter_num, href in all_chapter_links.items():
+        if chapter_num:
+            found_chapters.append(chapter_num)
+            discovered[chapter_num] = (href, None)
+            if chapter_num == target_chapter:
+                chapter_url = href
+                print(f"✅ Found target chapter {target_chapter}: {href}")
+    
+    # Sort and show available chapters for debugging
+    found_chapters = sorted(list(set(found_chapters)))
+    if found_chapters:
+        print(f"📋 Available chapters: {min(found_chapters)} - {max(found_chapters)} ({len(found_chapters)} total)")
+        # Show chapters around the target
+        nearby_chapters = [ch for ch in found_chapters if abs(ch - target_chapter) <= 10]
+        if nearby_chapters:
+            print(f"🎯 Chapters near {target_chapter}: {nearby_chapters}")
+    
+    # If still not found, try URL construction as fallback
+    if not chapter_url and found_chapters:
+        print(f"🔧 Chapter {target_chapter} not found in list, trying URL construction...")
         
-        for link in all_chapter_links:
-            try:
-                href = link.get_attribute("href")
-                if not href:
-                    continue
-                    
-                # Try different regex patterns for chapter numbers
-                patterns = [
-                    r'chapter-(\d+)',
-                    r'ch-(\d+)',
-                    r'chapter/(\d+)',
-                    r'c(\d+)',
-                    r'chap-(\d+)'
-                ]
-                
-                chapter_num = None
-                for pattern in patterns:
-                    match = re.search(pattern, href)
-                    if match:
-                        chapter_num = int(match.group(1))
-                        break
-                
-                if chapter_num:
-                    found_chapters.append(chapter_num)
-                    if chapter_num == target_chapter:
-                        chapter_url = href
-                        print(f"✅ Found target chapter {target_chapter}: {href}")
-                        break
-            except Exception as e:
-                continue
+        # Analyze existing URLs to construct the target URL
+        sample_urls = [href for href in list(all_chapter_links.values())[:10]  # Take first 10 for analysis
+                       if 'chapter-' in href]
         
-        # Sort and show available chapters for debugging
-        found_chapters = sorted(list(set(found_chapters)))
+        if sample_urls:
+            # Try to construct the URL based on pattern
+            base_url = sample_urls[0]
+            for pattern in [r'chapter-\d+', r'ch-\d+', r'c\d+']:
+                if re.search(pattern, base_url):
+                    constructed_url = re.sub(pattern, f'chapter-{target_chapter}', base_url)
+                    print(f"🎯 Constructed URL: {constructed_url}")
+                    chapter_url = constructed_url
+                    break
+    
+    if not chapter_url:
+        print(f"❌ Chapter {target_chapter} not found in the list after comprehensive search")
+        print(f"💡 This might mean:")
+        print(f"   - Chapter {target_chapter} doesn't exist yet")
+        print(f"   - We've reached the end of available chapters")
+        print(f"   - The chapter numbering might be different")
         if found_chapters:
-            print(f"📋 Available chapters: {min(found_chapters)} - {max(found_chapters)} ({len(found_chapters)} total)")
-            # Show chapters around the target
-            nearby_chapters = [ch for ch in found_chapters if abs(ch - target_chapter) <= 10]
-            if nearby_chapters:
-                print(f"🎯 Chapters near {target_chapter}: {nearby_chapters}")
-        
-        # If still not found, try URL construction as fallback
-        if not chapter_url and found_chapters:
-            print(f"🔧 Chapter {target_chapter} not found in list, trying URL construction...")
-            
-            # Analyze existing URLs to construct the target URL
-            sample_urls = []
-            for link in all_chapter_links[:10]:  # Take first 10 for analysis
-                href = link.get_attribute("href")
-                if href and 'chapter-' in href:
-                    sample_urls.append(href)
-            
-            if sample_urls:
-                # Try to construct the URL based on pattern
-                base_url = sample_urls[0]
-                for pattern in [r'chapter-\d+', r'ch-\d+', r'c\d+']:
-                    if re.search(pattern, base_url):
-                        constructed_url = re.sub(pattern, f'chapter-{target_chapter}', base_url)
-                        print(f"🎯 Constructed URL: {constructed_url}")
-                        chapter_url = constructed_url
-                        break
+            print(f"   - Try chapter {max(found_chapters)} instead (latest available)")
+        return None
+    
+    return chapter_url
+
+def download_novelbin_chapter(series_url, target_chapter, output_dir, save_func=None):
+    """Download one NovelBin chapter, retrying transient failures and bot checks; returns 1 or 0"""
+    return fetch_with_retry(
+        lambda: scrape_novelbin_single_with_fresh_browser(series_url, target_chapter, output_dir, save_func),
+        series_url, get_retry_policy(), label=f"Chapter {target_chapter}"
+    ) or 0
+
+def scrape_novelbin_single_with_fresh_browser(series_url, target_chapter, output_dir, save_func=None):
+    """Scrape a single chapter from NovelBin with a pooled browser (cleared between chapters)
+
+    save_func(title, content, chapter_num, output_dir) defaults to save_chapter;
+    the concurrent downloader passes its own to defer saving until commit.
+    """
+    if save_func is None:
+        save_func = save_chapter
+    
+    print(f"🔍 NovelBin: Downloading chapter {target_chapter}...")
+    
+    # Try a plain HTTP fetch first; the browser is only needed when it fails
+    chapter = fetch_novelbin_chapter_over_http(series_url, target_chapter, ChapterIndex.for_directory(output_dir))
+    if chapter:
+        title, content = chapter
+        if save_func(title, content, target_chapter, output_dir):
+            print(f"⚡ Downloaded chapter {target_chapter} over HTTP ({len(content)} characters)")
+            return 1
+        print(f"❌ Failed to save chapter {target_chapter}")
+        return 0
+    
+    # A 404 or block from the HTTP step says nothing about how the browser will do
+    take_failure()
+    
+    # Lease a Chrome driver for this chapter
+    driver = get_driver_pool().acquire()
+    if not driver:
+        print(f"❌ Failed to setup Chrome driver for chapter {target_chapter}")
+        return 0
+    
+    wait = WebDriverWait(driver, 30)
+    
+    try:
+        index = ChapterIndex.for_directory(output_dir)
+        chapter_url = index.get_url(target_chapter)
+        already_loaded = False
         
-        if not chapter_url:
-            print(f"❌ Chapter {target_chapter} not found in the list after comprehensive search")
-            print(f"💡 This might mean:")
-            print(f"   - Chapter {target_chapter} doesn't exist yet")
-            print(f"   - We've reached the end of available chapters")
-            print(f"   - The chapter numbering might be different")
-            if found_chapters:
-                print(f"   - Try chapter {max(found_chapters)} instead (latest available)")
-            return 0
+        if chapter_url:
+            print(f"📇 Chapter {target_chapter} found in chapter index")
+        elif try_novelbin_url_template(driver, series_url, target_chapter, index):
+            # Templated chapter-N URL landed on the right page, no list search needed
+            chapter_url = driver.current_url
+            already_loaded = True
+        else:
+            discovered = discover_chapters_from_archive(series_url, "novelbin", driver=driver)
+            chapter_url = discovered.get(target_chapter, (None, None))[0]
+            if not chapter_url:
+                chapter_url = find_novelbin_chapter_url(driver, series_url, target_chapter, discovered)
+            if discovered:
+                index.update(discovered)
+                index.learn_url_template()
+            if not chapter_url:
+                report_failure(NOT_FOUND)
+                return 0
         
+        # Misses while looking for the URL (a wrong template guess, a failed archive request) don't describe this load
+        take_failure()
         print(f"🌐 Found Chapter {target_chapter}: {chapter_url}")
         
         # Navigate directly to the chapter
-        print(f"📖 Loading chapter content...")
-        driver.get(chapter_url)
-        time.sleep(random.uniform(3, 6))  # Give more time for content to load
+        if not already_loaded:
+            print(f"📖 Loading chapter content...")
+            driver.get(chapter_url)
+            wait_for_content(driver, NOVELBIN.content_selectors, min_length=100)
         
         # Check if we got redirected or if page loaded properly
         current_url = driver.current_url
+        if SAVE_RAW_HTML:
+            store_raw_html(output_dir, target_chapter, current_url, driver.page_source)
         if "chapter" not in current_url.lower():
             print(f"⚠️ Warning: May have been redirected. Current URL: {current_url}")
         
         # Extract content with improved error handling
         title = ""
         content = ""
+        stats = SelectorStats.for_directory(output_dir)
+        
+        # Title and text (including the paragraph fallbacks) in one script call
+        page = None
+        if USE_SCRIPT_EXTRACTION:
+            page = extract_page_text(driver, NOVELBIN.content_selectors, NOVELBIN.min_content_length,
+                                     True, stats, NOVELBIN.name)
         
         try:
-            title = driver.title.strip()
-            if not title or "404" in title or "not found" in title.lower():
+            title = page[0] if page else driver.title.strip()
+            failure = chapter_failure(title, current_url)
+            if failure:
                 print(f"❌ Chapter page seems invalid (title: {title})")
+                report_failure(failure)
                 return 0
         except:
             title = f"Chapter {target_chapter}"
         
-        # Try multiple content selectors with more comprehensive search
-        content_selectors = [
-            ".chr-c",           # Common NovelBin selector
-            ".chapter-content", 
-            ".content", 
-            "#chr-content", 
-            ".reading-content", 
-            "article",
-            ".chapter-body",
-            ".chapter-text",
-            ".text-left",
-            "#chapter-content",
-            ".entry-content",
-            ".post-content"
-        ]
-        
-        for sel in content_selectors:
-            try:
-                content_element = driver.find_element(By.CSS_SELECTOR, sel)
-                content = content_element.text.strip()
-                if len(content) > 100:  # Ensure we got substantial content
-                    print(f"✅ Found content using selector: {sel} ({len(content)} characters)")
-                    break
-                else:
-                    print(f"⚠️ Selector {sel} found content but too short ({len(content)} chars)")
-            except:
-                continue
+        if page:
+            source, content = page[1], page[2]
+            if content:
+                print(f"✅ Found content using: {source} ({len(content)} characters)")
+        else:
+            # Try content selectors, the ones that worked for this novel before first
+            found = find_content(driver, NOVELBIN.content_selectors, NOVELBIN.min_content_length,
+                                 stats, NOVELBIN.name)
+            if found:
+                sel, content = found
+                content = content.strip()
+                print(f"✅ Found content using selector: {sel} ({len(content)} characters)")
         
-        # If still no content, try alternative extraction methods
-        if not content or len(content) < 100:
+        # If still no content, try alternative extraction methods (the script call already ran its own)
+        if not page and (not content or len(content) < 100):
             print("🔍 Trying alternative content extraction methods...")
             
             # Method 1: Look for any large text blocks
@@ -1163,7 +1260,7 @@ def scrape_novelbin_single_with_fresh_browser(series_url, target_chapter, output
             return 0
         
         # Save the chapter
-        if save_chapter(title, content, target_chapter, output_dir):
+        if save_func(title, content, target_chapter, output_dir):
             print(f"✅ Successfully downloaded and saved chapter {target_chapter}")
             print(f"📊 Content: {len(content)} characters")
             return 1
@@ -1190,15 +1287,51 @@ def scrape_novelbin_single_with_fresh_browser(series_url, target_chapter, output
         
         return 0
     finally:
-        # Always close the browser for this chapter
-        try:
-            driver.quit()
-            print(f"🔄 Closed browser for chapter {target_chapter}")
-        except:
-            pass
+        # Always hand the browser back; the pool clears or recycles it
+        get_driver_pool().release(driver)
+        print(f"🔄 Released browser for chapter {target_chapter}")
+
+def scrape_novelbin_concurrent(series_url, chapters_per_run, start, end, output_dir):
+    """Fetch NovelBin chapters in parallel, saving them strictly in chapter order"""
+    print(f"⚡ NovelBin: Downloading {chapters_per_run} chapters with {DOWNLOAD_WORKERS} parallel workers...")
+    
+    def fetch(chapter_num):
+        captured = {}
+        
+        def capture(title, content, num, out_dir):
+            captured["chapter"] = (title, content)
+            return True
+        
+        if download_novelbin_chapter(series_url, chapter_num, output_dir, save_func=capture):
+            return captured.get("chapter")
+        return None
+    
+    def on_chapter(chapter_num, status):
+        if status == "completed" and VOICE_ENABLED:
+            progress["downloaded"] += 1
+            if progress["downloaded"] % 10 == 0:
+                speak_message(f"Progress update: I have successfully downloaded {progress['downloaded']} chapters so far.")
+    
+    progress = {"downloaded": 0}
+    downloader = ConcurrentChapterDownloader(
+        max_workers=DOWNLOAD_WORKERS,
+        per_host_limit=PER_HOST_CONCURRENCY,
+        max_consecutive_failures=2
+    )
+    last_chapter = min(end, start + chapters_per_run - 1)
+    return downloader.run(
+        series_url,
+        range(start, last_chapter + 1),
+        fetch=fetch,
+        commit=lambda title, content, chapter_num: save_chapter(title, content, chapter_num, output_dir),
+        progress_callback=on_chapter
+    )
 
 def scrape_novelbin_multiple(series_url, chapters_per_run, start, end, output_dir):
     """Execute multiple single chapter downloads with fresh browser for each chapter"""
+    if DOWNLOAD_WORKERS > 1:
+        return scrape_novelbin_concurrent(series_url, chapters_per_run, start, end, output_dir)
+    
     print(f"🔍 NovelBin: Will download {chapters_per_run} chapters with fresh browser for each...")
     
     downloaded = 0
@@ -1217,7 +1350,7 @@ def scrape_novelbin_multiple(series_url, chapters_per_run, start, end, output_di
         print(f"{'='*50}")
 
         # Download single chapter with fresh browser
-        result = scrape_novelbin_single_with_fresh_browser(series_url, current_chapter, output_dir)
+        result = download_novelbin_chapter(series_url, current_chapter, output_dir)
 
         if result == 1:
             downloaded += 1
@@ -1252,6 +1385,7 @@ def scrape_novelbin_multiple(series_url, chapters_per_run, start, end, output_di
 def setup_chrome_driver():
     """Setup and return Chrome driver with optimal options"""
     options = Options()
+    options.page_load_strategy = PAGE_LOAD_STRATEGY
     options.add_argument("--headless")  # Enable headless mode
     options.add_argument("--no-sandbox")
     options.add_argument("--disable-blink-features=AutomationControlled")
@@ -1271,14 +1405,12 @@ def setup_chrome_driver():
         print("🔧 Setting up Chrome driver...")
         driver = webdriver.Chrome(options=options)
         print("✅ Chrome driver initialized successfully!")
-        return driver
     except Exception as e:
         try:
             # Fallback: try with chromedriver.exe in current directory
             print("🔧 Trying chromedriver.exe in current directory...")
             driver = webdriver.Chrome(service=Service("chromedriver.exe"), options=options)
             print("✅ Chrome driver initialized successfully!")
-            return driver
         except Exception as e2:
             print(f"❌ Failed to start ChromeDriver: {e}")
             print("💡 Solutions:")
@@ -1287,42 +1419,99 @@ def setup_chrome_driver():
             print("   3. Add chromedriver to your system PATH")
             print("   4. Make sure Chrome browser is installed")
             return None
+    
+    if BLOCK_REQUESTS:
+        enable_request_blocking(driver, BLOCK_STYLESHEETS)
+    enable_site_page_loads(driver, PAGE_LOAD_STRATEGY)
+    limit_navigation_rate(driver)
+    return driver
 
 
-def main():
-    """Main execution function"""
-    # Load URLs from file
-    urls = load_urls()
-    if not urls:
-        print("❌ No URLs found. Exiting...")
-        return
+def get_driver_pool():
+    """Return the shared browser pool, creating it on first use"""
+    global _driver_pool
+    if _driver_pool is None:
+        _driver_pool = ChromeDriverPool(
+            setup_chrome_driver,
+            size=max(DRIVER_POOL_SIZE, DOWNLOAD_WORKERS),
+            max_page_loads=DRIVER_MAX_PAGE_LOADS,
+            max_rss_mb=DRIVER_MAX_RSS_MB,
+            clear_between_leases=DRIVER_FRESH_SESSION
+        )
+    return _driver_pool
 
-    # Let user select which novel to download
-    series_url, novel_folder, website_type = select_url(urls)
-    if not series_url:
-        print("❌ No URL selected. Exiting...")
-        return
 
-    # Set up output directory
-    output_dir = os.path.join(BASE_OUTPUT_DIR, novel_folder)
-    
-    # Create the novel-specific output directory
-    os.makedirs(output_dir, exist_ok=True)
-    
-    # Get latest chapter already downloaded
-    latest = get_latest_chapter(output_dir)
-    print(f"\n📁 Found {latest} existing chapters in {output_dir}")
-    
-    # Check available chapters on the website
-    min_available, max_available, latest_volume = get_available_chapters_info(series_url, website_type)
-    
-    # Ask how many chapters to download with context
-    chapters_per_run = ask_chapters_to_download(latest, min_available, max_available, latest_volume)
-    if not chapters_per_run:
-        print("❌ No chapters specified. Exiting...")
-        return
+def get_retry_policy():
+    """Return the per-chapter retry policy built from the settings above"""
+    return RetryPolicy(max_attempts=RETRY_MAX_ATTEMPTS, base_delay=RETRY_BASE_DELAY)
+
+
+def get_http_fetcher():
+    """Return the shared plain HTTP chapter fetcher, or None when disabled or unavailable"""
+    global _http_fetcher
+    if not USE_HTTP_FETCH or not HTTP_FETCH_AVAILABLE:
+        return None
+    if _http_fetcher is None:
+        _http_fetcher = HttpChapterFetcher(pool_size=max(DOWNLOAD_WORKERS, PER_HOST_CONCURRENCY))
+    return _http_fetcher
 
+
+def close_http_fetcher():
+    """Close the HTTP fetcher's pooled connections"""
+    global _http_fetcher
+    if _http_fetcher is not None:
+        _http_fetcher.close()
+        _http_fetcher = None
+
+
+def close_driver_pool():
+    """Quit every pooled browser"""
+    global _driver_pool
+    if _driver_pool is not None:
+        _driver_pool.close_all()
+        _driver_pool = None
+
+
+def main():
+    """Main execution function"""
+    get_rate_limiter().configure(RATE_LIMIT_PER_MINUTE, RATE_LIMIT_BURST, RATE_LIMIT_JITTER, RATE_LIMIT_OVERRIDES)
+    get_circuit_breaker().configure(BREAKER_THRESHOLD, BREAKER_COOLDOWN)
+    
     try:
+        # Load URLs from file
+        urls = load_urls()
+        if not urls:
+            print("❌ No URLs found. Exiting...")
+            return
+
+        # Let user select which novel to download
+        series_url, novel_folder, website_type = select_url(urls, check_feeds_for_updates(urls))
+        if not series_url:
+            print("❌ No URL selected. Exiting...")
+            return
+
+        # Set up output directory
+        output_dir = os.path.join(BASE_OUTPUT_DIR, novel_folder)
+        
+        # Create the novel-specific output directory
+        os.makedirs(output_dir, exist_ok=True)
+        
+        # Get latest chapter already downloaded
+        latest = get_latest_chapter(output_dir)
+        print(f"\n📁 Found {latest} existing chapters in {output_dir}")
+        
+        # Check available chapters on the website
+        min_available, max_available, latest_volume = get_available_chapters_info(series_url, website_type, output_dir)
+        if max_available is not None and latest >= max_available:
+            announce_caught_up(max_available)
+            return
+        
+        # Ask how many chapters to download with context
+        chapters_per_run = ask_chapters_to_download(latest, min_available, max_available, latest_volume)
+        if not chapters_per_run:
+            print("❌ No chapters specified. Exiting...")
+            return
+        
         # Calculate range, accounting for novels that start from Chapter 0
         if latest == 0 and min_available is not None and min_available == 0:
             # Novel starts from Chapter 0 and user has no chapters downloaded
@@ -1333,6 +1522,15 @@ def main():
             start = latest + 1
         
         end = start + chapters_per_run - 1  # Fixed: end should be inclusive
+        
+        # Don't launch browsers for chapters the site doesn't have yet
+        if max_available is not None and end > max_available:
+            if start > max_available:
+                announce_caught_up(max_available)
+                return
+            end = max_available
+            chapters_per_run = end - start + 1
+            print(f"📝 Only {chapters_per_run} chapter(s) available, stopping at chapter {end}")
 
         print(f"\n🚀 Will download chapters {start} to {end}")
         
@@ -1344,7 +1542,7 @@ def main():
         # Use appropriate scraping method based on website
         if website_type == "katreadingcafe":
             # KatReadingCafe uses a single browser session
-            driver = setup_chrome_driver()
+            driver = get_driver_pool().acquire()
             if not driver:
                 return
             
@@ -1353,11 +1551,8 @@ def main():
             try:
                 downloaded = scrape_katreadingcafe(driver, wait, series_url, chapters_per_run, start, end, output_dir)
             finally:
-                try:
-                    driver.quit()
-                    print("👋 Browser closed for KatReadingCafe!")
-                except:
-                    pass
+                get_driver_pool().release(driver)
+                print("👋 Browser released for KatReadingCafe!")
                     
         elif website_type == "novelbin":
             # NovelBin uses fresh browser for each chapter
@@ -1384,6 +1579,9 @@ def main():
         import traceback
         traceback.print_exc()
     finally:
+        SelectorStats.flush_all()
+        close_driver_pool()
+        close_http_fetcher()
         print("👋 Goodbye!")
 
 
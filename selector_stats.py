@@ -0,0 +1,135 @@
+"""
+Adaptive content selector ordering
+Remembers which content selector worked for each site and novel in chapters/<novel>/.selectors.json and tries it first next time
+"""
+
+import datetime
+import json
+import os
+import threading
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.common.by import By
+
+SAVE_EVERY = 10  # Recorded attempts between saves while the winning selector stays the same; flush() writes the rest
+
+
+class SelectorStats:
+    """Per-novel hit/miss counts for content selectors
+
+    The selector that found content most recently ("best") is tried first,
+    so a site layout change takes effect on the next chapter. The rest are
+    ordered by hits minus misses: untried ones keep their declared order and
+    selectors that keep failing sink below them.
+    """
+
+    STATS_FILENAME = ".selectors.json"
+
+    _instances: Dict[str, "SelectorStats"] = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, output_dir: str):
+        self.output_dir = output_dir
+        self.path = os.path.join(output_dir, self.STATS_FILENAME)
+        self.sites: Dict[str, dict] = {}
+        self._unsaved = 0
+        self._lock = threading.Lock()
+        self.load()
+
+    @classmethod
+    def for_directory(cls, output_dir: str) -> "SelectorStats":
+        """Return the shared stats for a novel folder so threads never write over each other"""
+        key = os.path.abspath(output_dir)
+        with cls._instances_lock:
+            if key not in cls._instances:
+                cls._instances[key] = cls(output_dir)
+            return cls._instances[key]
+
+    def load(self):
+        """Load the stats from disk, starting empty if they are missing or unreadable"""
+        with self._lock:
+            self.sites = {}
+            if not os.path.exists(self.path):
+                return
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    self.sites = json.load(f).get("sites", {})
+            except (OSError, ValueError) as e:
+                print(f"⚠️ Ignoring unreadable selector stats {self.path}: {e}")
+
+    def _save(self):
+        data = {
+            "updated_at": datetime.datetime.now().isoformat(timespec="seconds"),
+            "sites": self.sites
+        }
+        tmp_path = self.path + ".tmp"
+        try:
+            os.makedirs(self.output_dir, exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=1)
+            os.replace(tmp_path, self.path)
+            self._unsaved = 0
+        except OSError as e:
+            print(f"⚠️ Could not save selector stats: {e}")
+
+    def flush(self):
+        """Write counts recorded since the last save"""
+        with self._lock:
+            if self._unsaved:
+                self._save()
+
+    @classmethod
+    def flush_all(cls):
+        """Flush every novel's stats; called when a run ends"""
+        with cls._instances_lock:
+            instances = list(cls._instances.values())
+        for stats in instances:
+            stats.flush()
+
+    def ordered(self, site: str, selectors: Sequence[str]) -> List[str]:
+        """Return the selectors with the best past performers first"""
+        with self._lock:
+            site_stats = self.sites.get(site, {})
+            best = site_stats.get("best")
+            counts = site_stats.get("selectors", {})
+            scores = {sel: counts.get(sel, {}).get("hits", 0) - counts.get(sel, {}).get("misses", 0)
+                      for sel in selectors}
+        return sorted(selectors, key=lambda sel: (sel != best, -scores[sel]))
+
+    def record(self, site: str, selector: str, success: bool):
+        """Count a hit or miss; saved at once when the winning selector changes"""
+        with self._lock:
+            site_stats = self.sites.setdefault(site, {"best": None, "selectors": {}})
+            counts = site_stats["selectors"].setdefault(selector, {"hits": 0, "misses": 0})
+            counts["hits" if success else "misses"] += 1
+            self._unsaved += 1
+
+            new_best = success and site_stats["best"] != selector
+            if new_best:
+                site_stats["best"] = selector
+            if new_best or self._unsaved >= SAVE_EVERY:
+                self._save()
+
+
+def find_content(driver, selectors: Sequence[str], min_length: int = 1,
+                 stats: Optional[SelectorStats] = None, site: Optional[str] = None) -> Optional[Tuple[str, str]]:
+    """Return (selector, text) for the first selector with at least min_length characters
+
+    With stats, selectors are tried in learned order and every attempt is
+    recorded, so in steady state this is a single find_element call.
+    """
+    if stats and site:
+        selectors = stats.ordered(site, selectors)
+
+    for sel in selectors:
+        try:
+            text = driver.find_element(By.CSS_SELECTOR, sel).text
+        except WebDriverException:
+            text = ""
+        found = len(text.strip()) >= min_length
+        if stats and site:
+            stats.record(site, sel, found)
+        if found:
+            return sel, text
+    return None
@@ -0,0 +1,145 @@
+"""
+Site adapter registry
+Each supported website declares its URLs, link patterns and content selectors once; patterns are compiled at import time
+"""
+
+import re
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from link_harvest import CHAPTER_URL_PATTERNS, DISCOVERY_URL_PATTERNS, VOLUME_CHAPTER_PATTERN
+
+
+class SiteAdapter:
+    """Everything the scrapers need to know about one website"""
+
+    def __init__(self, name: str, display_name: str, domain: str, content_selectors: Sequence[str],
+                 chapter_url_patterns: Sequence[re.Pattern] = CHAPTER_URL_PATTERNS,
+                 discovery_url_patterns: Sequence[re.Pattern] = DISCOVERY_URL_PATTERNS,
+                 chapter_list_suffix: str = "", url_template_suffix: Optional[str] = None,
+                 min_content_length: int = 100,
+                 volume_pattern: Optional[re.Pattern] = None, volume_link_pattern: Optional[re.Pattern] = None,
+                 request_allowlist: Sequence[str] = (), page_load_strategy: Optional[str] = None,
+                 sitemap_paths: Sequence[str] = ("/sitemap.xml",), wordpress_api: bool = False,
+                 update_feeds: Sequence[str] = (), chapter_archive_path: Optional[str] = None,
+                 page_title_suffix: str = "", early_chapter_paths: Sequence[str] = ()):
+        self.name = name
+        self.display_name = display_name
+        self.domain = domain
+        self.content_selectors = list(content_selectors)
+        self.chapter_url_patterns = list(chapter_url_patterns)
+        self.discovery_url_patterns = list(discovery_url_patterns)
+        self.chapter_list_suffix = chapter_list_suffix
+        self.url_template_suffix = url_template_suffix
+        self.min_content_length = min_content_length
+        self.volume_pattern = volume_pattern
+        self.volume_link_pattern = volume_link_pattern
+        self.request_allowlist = list(request_allowlist)  # Blocked-URL patterns this site needs to load
+        self.page_load_strategy = page_load_strategy  # "eager" or "none"; None uses the configured default
+        self.sitemap_paths = list(sitemap_paths)  # Tried after any sitemaps robots.txt lists
+        self.wordpress_api = wordpress_api  # Chapters are WordPress posts served by /wp-json
+        self.update_feeds = list(update_feeds)  # Site-wide RSS/Atom feeds or latest-update pages, relative to the domain
+        self.chapter_archive_path = chapter_archive_path  # AJAX endpoint serving the full chapter list, with '{novel_id}'
+        self.page_title_suffix = page_title_suffix  # What the site appends to post titles in the page <title>
+        self.early_chapter_paths = list(early_chapter_paths)  # Chapter URL shapes after the series URL, with '{n}'
+
+    def matches(self, url: str) -> bool:
+        return self.domain in url
+
+    def chapter_list_url(self, series_url: str) -> str:
+        """URL of the page that lists the novel's chapters"""
+        return series_url.rstrip('/') + self.chapter_list_suffix
+
+    def url_template(self, series_url: str) -> Optional[str]:
+        """Default chapter URL template containing '{n}', if the site has one"""
+        if self.url_template_suffix is None:
+            return None
+        return series_url.rstrip('/') + self.url_template_suffix
+
+    def early_chapter_urls(self, series_url: str) -> List[Tuple[int, str]]:
+        """Likely (chapter, URL) pairs for chapter 0, then chapter 1, to visit before reading the chapter list"""
+        base_url = series_url.rstrip('/')
+        return [(n, base_url + path.format(n=n)) for n in (0, 1) for path in self.early_chapter_paths]
+
+    def extract_chapter_number(self, href: str) -> Optional[int]:
+        for pattern in self.chapter_url_patterns:
+            match = pattern.search(href)
+            if match:
+                return int(match.group(1))
+        return None
+
+
+KATREADINGCAFE = SiteAdapter(
+    name="katreadingcafe",
+    display_name="KatReadingCafe",
+    domain="katreadingcafe.com",
+    content_selectors=["div.entry-content", ".post-content", ".chapter-content", "article", ".content"],
+    min_content_length=1,
+    volume_pattern=re.compile(r'Vol\.\s*(\d+)'),
+    volume_link_pattern=VOLUME_CHAPTER_PATTERN,
+    # Server-rendered pages: every navigation is followed by an explicit content or readiness wait
+    page_load_strategy="none",
+    # WordPress: Yoast/Rank Math index first, then core WordPress sitemaps
+    sitemap_paths=["/sitemap_index.xml", "/wp-sitemap.xml", "/sitemap.xml"],
+    wordpress_api=True,
+    update_feeds=["/feed/"],
+    page_title_suffix=" – ☕ Kat Reading Cafe"
+)
+
+NOVELBIN = SiteAdapter(
+    name="novelbin",
+    display_name="NovelBin",
+    domain="novelbin.me",
+    content_selectors=[
+        ".chr-c",           # Common NovelBin selector
+        ".chapter-content",
+        ".content",
+        "#chr-content",
+        ".reading-content",
+        "article",
+        ".chapter-body",
+        ".chapter-text",
+        ".text-left",
+        "#chapter-content",
+        ".entry-content",
+        ".post-content"
+    ],
+    chapter_list_suffix="#tab-chapters-title",
+    url_template_suffix="/chapter-{n}",
+    # Visiting chapter 0 or 1 first makes the chapter list start loading from the top
+    early_chapter_paths=["/chapter-{n}", "/ch-{n}", "/c{n}", "/chapter/{n}"],
+    # The chapter list lazy-loads on scroll, which needs the real page layout
+    request_allowlist=["*.css", "*.css?*"],
+    update_feeds=["/sort/latest"],
+    # What the chapter tab lazy-loads; returns every chapter link in one response
+    chapter_archive_path="/ajax/chapter-archive?novelId={novel_id}"
+)
+
+ADAPTERS: Dict[str, SiteAdapter] = {adapter.name: adapter for adapter in (KATREADINGCAFE, NOVELBIN)}
+
+
+def get_adapter(website_type: str, default: Optional[SiteAdapter] = NOVELBIN) -> Optional[SiteAdapter]:
+    """Return the adapter registered under a website type name"""
+    return ADAPTERS.get(website_type, default)
+
+
+def adapter_for_url(url: str, default: Optional[SiteAdapter] = None) -> Optional[SiteAdapter]:
+    """Return the adapter whose domain appears in the URL"""
+    for adapter in ADAPTERS.values():
+        if adapter.matches(url):
+            return adapter
+    return default
+
+
+def novel_name_from_url(url: str) -> str:
+    """Human-readable novel name from the series URL"""
+    return url.rstrip('/').split('/')[-1].replace('-', ' ').title()
+
+
+def detect_website_type(url: str, default: str = "unknown") -> str:
+    """Detect which website type based on URL"""
+    adapter = adapter_for_url(url)
+    return adapter.name if adapter else default
+
+
+def registered_types() -> List[str]:
+    return list(ADAPTERS)
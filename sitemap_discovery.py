@@ -0,0 +1,146 @@
+"""
+Sitemap-based chapter discovery
+Streams a site's XML sitemaps through an incremental parser and collects one novel's chapter URLs without a browser
+"""
+
+import re
+import xml.etree.ElementTree as ET
+import zlib
+from typing import Dict, Iterator, List, Optional, Tuple
+from urllib.parse import urljoin, urlparse
+
+from http_fetch import HttpChapterFetcher
+from site_adapters import SiteAdapter
+
+CHUNK_SIZE = 64 * 1024
+MAX_SITEMAPS = 40  # Upper bound on sitemap files read for one novel
+CHILD_SITEMAP_KEYWORDS = ("chapter", "post", "novel")  # Child sitemaps worth reading when none names the novel
+
+_ROBOTS_SITEMAP = re.compile(r'^\s*sitemap:\s*(\S+)', re.IGNORECASE | re.MULTILINE)
+# What may follow a novel's slug inside a chapter slug ("my-novel-vol-3-ch-52", "my-novel-chapter-7")
+_CHAPTER_MARKER = re.compile(r'-(?:vol(?:ume)?|ch(?:ap(?:ter)?)?|episode|ep)[-.]?\d')
+_TITLE_CHAPTER_MARKER = r'\s*[-–—:|,]?\s*(?:vol(?:ume)?|ch(?:ap(?:ter)?)?|episode|ep)\b'
+
+
+def _local_name(tag: str) -> str:
+    return tag.rsplit('}', 1)[-1]
+
+
+def iter_sitemap(chunks: Iterator[bytes], gzipped: bool = False) -> Iterator[Tuple[str, str]]:
+    """Yield ("sitemap" | "url", loc) entries while the document is still arriving
+
+    Each entry is cleared once read, so memory stays flat on sitemaps with
+    tens of thousands of URLs.
+    """
+    parser = ET.XMLPullParser(events=("end",))
+    inflate = zlib.decompressobj(16 + zlib.MAX_WBITS) if gzipped else None
+    for chunk in chunks:
+        parser.feed(inflate.decompress(chunk) if inflate else chunk)
+        for _, elem in parser.read_events():
+            kind = _local_name(elem.tag)
+            if kind not in ("sitemap", "url"):
+                continue
+            loc = next((child.text for child in elem if _local_name(child.tag) == "loc"), None)
+            if loc and loc.strip():
+                yield kind, loc.strip()
+            elem.clear()
+    parser.close()
+
+
+def novel_slug(series_url: str) -> str:
+    """Last path segment of the series URL, which every chapter URL of the novel contains"""
+    return series_url.split('#')[0].rstrip('/').rsplit('/', 1)[-1].lower()
+
+
+def url_matches_novel(url: str, slug: str) -> bool:
+    """True when a path segment is the slug, or the slug followed by a volume/chapter marker
+
+    A plain substring test would also match sequels and spin-offs
+    ("martial-peak-2", "martial-peak-remake").
+    """
+    for segment in urlparse(url).path.lower().split('/'):
+        if segment == slug or (segment.startswith(slug) and _CHAPTER_MARKER.match(segment, len(slug))):
+            return True
+    return False
+
+
+def title_matches_novel(title: str, name: str) -> bool:
+    """True when the title is the novel's name on its own or followed by a volume/chapter marker"""
+    pattern = r'\b' + re.escape(name) + r'(?:\s*$|' + _TITLE_CHAPTER_MARKER + r')'
+    return re.search(pattern, title, re.IGNORECASE) is not None
+
+
+def root_sitemaps(fetcher: HttpChapterFetcher, series_url: str, adapter: SiteAdapter) -> List[str]:
+    """Sitemaps listed in robots.txt, then the site's usual sitemap locations"""
+    site_root = urljoin(series_url, "/")
+    roots = []
+    robots = fetcher.get_html(urljoin(site_root, "robots.txt"))
+    if robots:
+        roots += _ROBOTS_SITEMAP.findall(robots[0])
+    roots += [urljoin(site_root, path) for path in adapter.sitemap_paths]
+    return list(dict.fromkeys(roots))
+
+
+def _relevant_children(children: List[str], slug: str) -> List[str]:
+    """Child sitemaps most likely to list the novel's chapters"""
+    named = [url for url in children
+             if re.search(r'(?<![a-z0-9])' + re.escape(slug) + r'(?=[./_?]|$)', urlparse(url).path.lower())]
+    if named:
+        return named
+    keyword = [url for url in children
+               if any(word in urlparse(url).path.lower() for word in CHILD_SITEMAP_KEYWORDS)]
+    return keyword or children
+
+
+def _read_sitemap(fetcher: HttpChapterFetcher, url: str) -> Optional[Iterator[Tuple[str, str]]]:
+    response = fetcher.stream(url)
+    if response is None:
+        return None
+
+    def entries():
+        try:
+            gzipped = url.endswith(".gz") and "gzip" not in response.headers.get("Content-Encoding", "")
+            yield from iter_sitemap(response.iter_content(CHUNK_SIZE), gzipped)
+        finally:
+            response.close()
+
+    return entries()
+
+
+def discover_from_sitemap(fetcher: HttpChapterFetcher, series_url: str,
+                          adapter: SiteAdapter) -> Dict[int, Tuple[str, Optional[int]]]:
+    """Return {chapter_num: (url, None)} for the novel from the site's sitemaps, or {} if none list it"""
+    slug = novel_slug(series_url)
+    series = series_url.split('#')[0].rstrip('/')
+    chapters: Dict[int, Tuple[str, Optional[int]]] = {}
+
+    for root in root_sitemaps(fetcher, series_url, adapter):
+        pending, seen = [root], set()
+        while pending and len(seen) < MAX_SITEMAPS:
+            url = pending.pop(0)
+            if url in seen:
+                continue
+            seen.add(url)
+
+            entries = _read_sitemap(fetcher, url)
+            if entries is None:
+                continue
+            children = []
+            try:
+                for kind, loc in entries:
+                    if kind == "sitemap":
+                        children.append(loc)
+                    elif url_matches_novel(loc, slug) and loc.rstrip('/') != series:
+                        chapter_num = adapter.extract_chapter_number(loc)
+                        if chapter_num is not None:
+                            chapters[chapter_num] = (loc, None)
+            except (ET.ParseError, zlib.error) as e:
+                print(f"⚠️ Could not parse sitemap {url}: {e}")
+            pending += _relevant_children(children, slug)
+
+        if seen and (chapters or len(seen) > 1):
+            break  # This root was a real sitemap; the fallbacks would only list the same URLs
+
+    if chapters:
+        print(f"🗺️ Sitemap lists {len(chapters)} chapters (Ch. {min(chapters)} - Ch. {max(chapters)})")
+    return dict(sorted(chapters.items()))
@@ -0,0 +1,45 @@
+from chapter_archive import archive_url, find_novel_id, parse_archive
+from site_adapters import NOVELBIN
+
+SERIES_URL = "https://novelbin.me/novel-book/martial-peak"
+
+
+def test_find_novel_id_and_archive_url():
+    page = '<div id="rating" data-novel-id="martial-peak-id"></div>'
+    assert find_novel_id(page) == "martial-peak-id"
+    assert find_novel_id("<html></html>") is None
+    assert archive_url(SERIES_URL, NOVELBIN, "abc") == "https://novelbin.me/ajax/chapter-archive?novelId=abc"
+    assert archive_url(SERIES_URL, NOVELBIN) == "https://novelbin.me/ajax/chapter-archive?novelId=martial-peak"
+
+
+def test_parse_archive_reads_urls_and_titles():
+    html = """
+    <ul class="list-chapter">
+      <li><a href="/b/martial-peak/chapter-2-the-duel" title="Chapter 2 The Duel">Chapter 2</a></li>
+      <li><a href="https://novelbin.me/b/martial-peak/prologue" title="Chapter 1: Prologue">Prologue</a></li>
+      <li><a href="/b/martial-peak/side-story"><span>Chapter 3</span> Side Story</a></li>
+      <li><a href="/b/martial-peak/chapter-2" title="Chapter 2 (duplicate)">Chapter 2</a></li>
+    </ul>
+    """
+    chapters = parse_archive(html, SERIES_URL, NOVELBIN)
+    assert chapters == {
+        1: ("https://novelbin.me/b/martial-peak/prologue", None),
+        2: ("https://novelbin.me/b/martial-peak/chapter-2-the-duel", None),
+        3: ("https://novelbin.me/b/martial-peak/side-story", None)
+    }
+    assert list(chapters) == [1, 2, 3]
+
+
+def test_parse_archive_skips_sequels_and_the_series_page():
+    html = """
+    <a href="/b/martial-peak-2/chapter-1" title="Chapter 1">Chapter 1</a>
+    <a href="/b/martial-peak-remake/chapter-5">Chapter 5</a>
+    <a href="/novel-book/martial-peak" title="Chapter 9">Martial Peak</a>
+    <a href="/b/martial-peak/chapter-4">Chapter 4</a>
+    """
+    assert parse_archive(html, SERIES_URL, NOVELBIN) == {4: ("https://novelbin.me/b/martial-peak/chapter-4", None)}
+
+
+def test_parse_archive_empty():
+    assert parse_archive("", SERIES_URL, NOVELBIN) == {}
+    assert parse_archive('<ul class="list-chapter"></ul>', SERIES_URL, NOVELBIN) == {}
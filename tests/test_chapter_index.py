@@ -0,0 +1,62 @@
+import json
+import os
+
+from chapter_index import ChapterIndex, infer_url_template
+
+
+def test_infer_template_from_plain_chapter_urls():
+    urls = ["https://novelbin.me/b/x/chapter-9", "https://novelbin.me/b/x/chapter-10"]
+    assert infer_url_template(urls) == "https://novelbin.me/b/x/chapter-{n}"
+
+
+def test_infer_template_keeps_a_shared_suffix():
+    urls = ["https://example.com/x/chapter/9.html", "https://example.com/x/chapter/10.html"]
+    assert infer_url_template(urls) == "https://example.com/x/chapter/{n}.html"
+
+
+def test_infer_template_drops_title_slugs():
+    urls = ["https://novelbin.me/b/x/chapter-9-the-duel", "https://novelbin.me/b/x/chapter-10-aftermath"]
+    assert infer_url_template(urls) == "https://novelbin.me/b/x/chapter-{n}"
+    assert infer_url_template(urls[:1]) == "https://novelbin.me/b/x/chapter-{n}"
+
+
+def test_infer_template_uses_the_last_number_in_the_url():
+    urls = ["https://katreadingcafe.com/x-vol-2-ch-7/", "https://katreadingcafe.com/x-vol-2-ch-8/"]
+    assert infer_url_template(urls) == "https://katreadingcafe.com/x-vol-2-ch-{n}/"
+
+
+def test_infer_template_rejects_mismatched_or_unknown_urls():
+    assert infer_url_template(["https://a.com/x/chapter-1", "https://a.com/y/chapter-2"]) is None
+    assert infer_url_template(["https://a.com/x/prologue"]) is None
+    assert infer_url_template([]) is None
+
+
+def test_update_merges_and_persists(tmp_path):
+    index = ChapterIndex(str(tmp_path))
+    assert index.update({1: ("https://a.com/x/chapter-1", None), 2: ("https://a.com/x/chapter-2", 1)}) == 2
+    # Unchanged entries and entries without a URL are skipped; a known volume survives a volume-less update
+    assert index.update({1: ("https://a.com/x/chapter-1", None), 3: (None, None)}) == 0
+    assert index.update({2: ("https://a.com/x/chapter-2-new", None)}) == 1
+    assert index.as_chapter_map() == {1: ("https://a.com/x/chapter-1", None), 2: ("https://a.com/x/chapter-2-new", 1)}
+
+    with open(os.path.join(str(tmp_path), ChapterIndex.INDEX_FILENAME), encoding="utf-8") as f:
+        data = json.load(f)
+    assert sorted(data["chapters"]) == ["1", "2"]
+
+    reloaded = ChapterIndex(str(tmp_path))
+    assert reloaded.get_url(2) == "https://a.com/x/chapter-2-new"
+    assert reloaded.last_known_volume() == 1
+    assert reloaded.covers(2) and not reloaded.covers(3)
+
+
+def test_learned_template_builds_unindexed_urls(tmp_path):
+    index = ChapterIndex(str(tmp_path))
+    index.update({9: ("https://a.com/x/chapter-9", None), 10: ("https://a.com/x/chapter-10", None)})
+    assert index.learn_url_template() == "https://a.com/x/chapter-{n}"
+    assert index.build_url(11) == "https://a.com/x/chapter-11"
+    assert ChapterIndex(str(tmp_path)).url_template == "https://a.com/x/chapter-{n}"
+
+
+def test_unreadable_index_starts_empty(tmp_path):
+    (tmp_path / ChapterIndex.INDEX_FILENAME).write_text("{not json", encoding="utf-8")
+    assert ChapterIndex(str(tmp_path)).chapters == {}
@@ -0,0 +1,64 @@
+import pytest
+
+import rate_limit
+from rate_limit import RateLimiter, TokenBucket, domain_of
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+        self.slept = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(rate_limit, "time", fake)
+    return fake
+
+
+def test_bucket_allows_a_burst_then_paces(clock):
+    bucket = TokenBucket(per_minute=60, burst=3)
+    assert [bucket.reserve() for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert bucket.reserve() == pytest.approx(1.0)
+    # Reservations queue up behind each other
+    assert bucket.reserve() == pytest.approx(2.0)
+
+
+def test_bucket_refills_over_time_up_to_capacity(clock):
+    bucket = TokenBucket(per_minute=60, burst=2)
+    bucket.reserve()
+    bucket.reserve()
+    clock.now += 1.5
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == pytest.approx(0.5)
+
+    clock.now += 600
+    assert [bucket.reserve() for _ in range(2)] == [0.0, 0.0]
+    assert bucket.reserve() == pytest.approx(1.0)
+
+
+def test_zero_rate_never_waits(clock):
+    bucket = TokenBucket(per_minute=0, burst=1)
+    assert [bucket.reserve() for _ in range(5)] == [0.0] * 5
+
+
+def test_limiter_keeps_one_bucket_per_domain(clock):
+    limiter = RateLimiter(per_minute=60, burst=1, jitter=0, overrides={"slow.com": 30})
+    assert limiter.wait("https://www.fast.com/a") == 0.0
+    assert limiter.wait("https://fast.com/b") == pytest.approx(1.0)
+    assert limiter.wait("https://slow.com/a") == 0.0
+    assert limiter.wait("https://slow.com/b") == pytest.approx(2.0)
+    assert limiter.wait("about:blank") == 0.0
+
+
+def test_domain_of():
+    assert domain_of("https://www.NovelBin.me/b/x") == "novelbin.me"
+    assert domain_of("data:,") is None
@@ -0,0 +1,139 @@
+import threading
+
+import pytest
+
+import retry_policy
+from retry_policy import (BLOCKED, NOT_FOUND, TRANSIENT, CircuitBreaker, RetryPolicy, fetch_with_retry,
+                          release_while_waiting, report_failure, take_failure)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(retry_policy, "time", fake)
+    return fake
+
+
+@pytest.fixture
+def breaker(monkeypatch):
+    fresh = CircuitBreaker(threshold=2, cooldown=60, max_cooldown=200)
+    monkeypatch.setattr(retry_policy, "_circuit_breaker", fresh)
+    return fresh
+
+
+def test_breaker_opens_after_threshold_blocks(clock, breaker):
+    url = "https://novelbin.me/b/x/chapter-1"
+    breaker.record_block(url)
+    assert breaker.remaining(url) == 0
+    breaker.record_block("https://www.novelbin.me/b/x/chapter-2")
+    assert breaker.remaining(url) == pytest.approx(60)
+    assert breaker.remaining("https://katreadingcafe.com/") == 0
+
+
+def test_breaker_half_open_after_pause(clock, breaker):
+    url = "https://novelbin.me/b/x/chapter-1"
+    breaker.record_block(url)
+    breaker.record_block(url)
+    clock.now += 61
+    assert breaker.remaining(url) == 0
+
+    # A single further block trips it again, for twice as long, capped at max_cooldown
+    breaker.record_block(url)
+    assert breaker.remaining(url) == pytest.approx(120)
+    clock.now += 121
+    breaker.record_block(url)
+    assert breaker.remaining(url) == pytest.approx(200)
+
+
+def test_breaker_success_closes_it(clock, breaker):
+    url = "https://novelbin.me/b/x/chapter-1"
+    breaker.record_block(url)
+    breaker.record_block(url)
+    clock.now += 61
+    breaker.record_success(url)
+    breaker.record_block(url)
+    assert breaker.remaining(url) == 0
+
+
+def test_wait_until_closed_gives_up_on_stop(clock, breaker):
+    url = "https://novelbin.me/"
+    breaker.record_block(url)
+    breaker.record_block(url)
+    assert not breaker.wait_until_closed(url, should_stop=lambda: True)
+    assert breaker.wait_until_closed(url)
+    assert clock.now >= 1060
+
+
+def test_take_failure_defaults_to_transient():
+    take_failure()
+    assert take_failure() == TRANSIENT
+    report_failure(NOT_FOUND)
+    assert take_failure() == NOT_FOUND
+    assert take_failure() == TRANSIENT
+
+
+def test_fetch_with_retry_backs_off_then_succeeds(clock, breaker):
+    results = iter([None, None, "page"])
+    start = clock.now
+    assert fetch_with_retry(lambda: next(results), "https://x.com/", RetryPolicy(3, 5, 100, 0)) == "page"
+    assert clock.now - start == pytest.approx(5 + 10)
+
+
+def test_fetch_with_retry_gives_up_when_not_found(clock, breaker):
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        report_failure(NOT_FOUND)
+        return None
+
+    assert fetch_with_retry(fetch, "https://x.com/", RetryPolicy(3, 5, 100, 0)) is None
+    assert len(calls) == 1
+
+
+def test_fetch_with_retry_feeds_the_breaker_on_blocks(clock, breaker):
+    def fetch():
+        report_failure(BLOCKED)
+        return None
+
+    assert fetch_with_retry(fetch, "https://x.com/", RetryPolicy(2, 5, 100, 0)) is None
+    assert breaker.remaining("https://x.com/") == pytest.approx(60)
+
+
+def test_slot_is_released_while_backing_off(clock, breaker):
+    slot = threading.BoundedSemaphore(1)
+    results = iter([None, "page"])
+
+    def slot_free():
+        if not slot.acquire(blocking=False):
+            return False
+        slot.release()
+        return True
+
+    free_during_fetch, free_during_sleep = [], []
+
+    def fetch():
+        free_during_fetch.append(slot_free())
+        return next(results)
+
+    def sleep(seconds):
+        free_during_sleep.append(slot_free())
+        clock.now += seconds
+
+    clock.sleep = sleep
+    with slot, release_while_waiting(slot):
+        assert fetch_with_retry(fetch, "https://x.com/", RetryPolicy(2, 5, 100, 0)) == "page"
+        assert not slot_free()
+    assert free_during_fetch == [False, False]
+    assert free_during_sleep and all(free_during_sleep)
@@ -0,0 +1,57 @@
+import gzip
+
+from sitemap_discovery import _relevant_children, iter_sitemap, url_matches_novel
+
+SITEMAP_INDEX = b"""<?xml version="1.0" encoding="UTF-8"?>
+<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+  <sitemap><loc>https://example.com/post-sitemap1.xml</loc></sitemap>
+  <sitemap><loc> https://example.com/my-novel-sitemap.xml </loc></sitemap>
+</sitemapindex>"""
+
+URLSET = b"""<?xml version="1.0" encoding="UTF-8"?>
+<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+  <url><loc>https://example.com/my-novel/chapter-1</loc><lastmod>2024-01-01</lastmod></url>
+  <url><loc>https://example.com/my-novel/chapter-2</loc></url>
+  <url><lastmod>2024-01-03</lastmod></url>
+</urlset>"""
+
+
+def chunked(data, size=17):
+    return (data[i:i + size] for i in range(0, len(data), size))
+
+
+def test_iter_sitemap_reads_index_entries():
+    assert list(iter_sitemap(chunked(SITEMAP_INDEX))) == [
+        ("sitemap", "https://example.com/post-sitemap1.xml"),
+        ("sitemap", "https://example.com/my-novel-sitemap.xml")
+    ]
+
+
+def test_iter_sitemap_skips_urls_without_loc():
+    assert list(iter_sitemap(chunked(URLSET))) == [
+        ("url", "https://example.com/my-novel/chapter-1"),
+        ("url", "https://example.com/my-novel/chapter-2")
+    ]
+
+
+def test_iter_sitemap_inflates_gzip_across_chunks():
+    assert list(iter_sitemap(chunked(gzip.compress(URLSET), 5), gzipped=True)) == list(iter_sitemap([URLSET]))
+
+
+def test_url_matches_novel_segment_and_chapter_slugs():
+    assert url_matches_novel("https://novelbin.me/b/martial-peak/chapter-5", "martial-peak")
+    assert url_matches_novel("https://katreadingcafe.com/martial-peak-vol-3-ch-52/", "martial-peak")
+    assert url_matches_novel("https://example.com/martial-peak-chapter-7", "martial-peak")
+
+
+def test_url_matches_novel_rejects_sequels_and_spin_offs():
+    assert not url_matches_novel("https://novelbin.me/b/martial-peak-2/chapter-5", "martial-peak")
+    assert not url_matches_novel("https://novelbin.me/b/martial-peak-remake/chapter-5", "martial-peak")
+    assert not url_matches_novel("https://example.com/martial-peaks-ch-1", "martial-peak")
+
+
+def test_relevant_children_prefers_the_novels_own_sitemap():
+    children = ["https://example.com/post-sitemap1.xml", "https://example.com/sitemaps/my-novel.xml",
+                "https://example.com/sitemaps/my-novel-2.xml"]
+    assert _relevant_children(children, "my-novel") == ["https://example.com/sitemaps/my-novel.xml"]
+    assert _relevant_children(children[:1] + ["https://example.com/page-sitemap.xml"], "other") == children[:1]
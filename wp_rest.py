@@ -0,0 +1,165 @@
+"""
+WordPress REST API chapter backend
+Pulls chapter posts in bulk through /wp-json/wp/v2/posts instead of loading each chapter page in a browser
+"""
+
+import datetime
+import html as html_lib
+import json
+import re
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+from urllib.parse import urlencode, urljoin, urlparse
+
+from http_fetch import BS4_AVAILABLE, HTML_PARSER, MIN_CONTENT_LENGTH, HttpChapterFetcher, element_text
+from link_harvest import VOLUME_CHAPTER_PATTERN
+from site_adapters import SiteAdapter
+from sitemap_discovery import novel_slug, title_matches_novel, url_matches_novel
+
+if BS4_AVAILABLE:
+    from bs4 import BeautifulSoup
+
+POSTS_PATH = "/wp-json/wp/v2/posts"
+MAX_PER_PAGE = 100  # WordPress rejects larger pages
+POST_FIELDS = "slug,link,title,content,modified_gmt"  # _fields filter: skip excerpts, embeds and meta
+MAX_PAGES = 20  # Upper bound on pages read by one incremental sync
+SYNC_OVERLAP = datetime.timedelta(days=1)  # modified_after uses the site's clock; look back a little further
+
+_TAG_PATTERN = re.compile(r'<[^>]+>')
+
+
+def post_slug(url: str) -> str:
+    """WordPress post slug from a permalink (its last path segment)"""
+    return urlparse(url).path.rstrip('/').rsplit('/', 1)[-1].lower()
+
+
+def content_to_text(html: str) -> str:
+    """Rendered post HTML to text with one line per paragraph, like the page extractors produce"""
+    return element_text(BeautifulSoup(html, HTML_PARSER))
+
+
+def post_title(post: dict) -> str:
+    rendered = (post.get("title") or {}).get("rendered", "")
+    return html_lib.unescape(_TAG_PATTERN.sub("", rendered)).strip()
+
+
+class WordPressApi:
+    """Minimal client for a WordPress site's posts endpoint, sharing the HTTP fetcher's sessions and pacing"""
+
+    def __init__(self, fetcher: HttpChapterFetcher, site_url: str):
+        self.fetcher = fetcher
+        self.endpoint = urljoin(site_url, POSTS_PATH)
+
+    def _get(self, params: dict) -> Optional[List[dict]]:
+        page = self.fetcher.get_html(f"{self.endpoint}?{urlencode(params)}")
+        if not page:
+            return None
+        try:
+            posts = json.loads(page[0])
+        except ValueError:
+            print("⚠️ WordPress API returned something other than JSON")
+            return None
+        return posts if isinstance(posts, list) else None
+
+    def posts_by_slug(self, slugs: Sequence[str]) -> Optional[Dict[str, dict]]:
+        """Fetch posts by slug, up to 100 per request; None when the API is unavailable"""
+        posts = {}
+        slugs = list(dict.fromkeys(slugs))
+        for i in range(0, len(slugs), MAX_PER_PAGE):
+            batch = slugs[i:i + MAX_PER_PAGE]
+            result = self._get({"slug": ",".join(batch), "per_page": len(batch), "_fields": POST_FIELDS})
+            if result is None:
+                return posts or None
+            for post in result:
+                posts[(post.get("slug") or "").lower()] = post
+        return posts
+
+    def iter_posts(self, search: Optional[str] = None,
+                   modified_after: Optional[datetime.datetime] = None) -> Iterator[dict]:
+        """Page through posts, oldest change first, optionally only those modified after a time"""
+        params = {"per_page": MAX_PER_PAGE, "orderby": "modified", "order": "asc", "_fields": POST_FIELDS}
+        if search:
+            params["search"] = search
+        if modified_after:
+            params["modified_after"] = modified_after.strftime("%Y-%m-%dT%H:%M:%S")
+        for page in range(1, MAX_PAGES + 1):
+            posts = self._get(dict(params, page=page))
+            if not posts:
+                return
+            yield from posts
+            if len(posts) < MAX_PER_PAGE:
+                return
+
+
+class WordPressChapterSource:
+    """Serves chapters from bulk API requests, loading the next batch only when it is needed
+
+    chapter_urls maps the chapters to download, in order, to their indexed
+    URLs. At most one batch of posts is held in memory. Titles get
+    title_suffix appended so they match the page <title> the other backends save.
+    """
+
+    def __init__(self, api: WordPressApi, chapter_urls: Dict[int, str], batch_size: int = 50,
+                 min_length: int = MIN_CONTENT_LENGTH, title_suffix: str = ""):
+        self.api = api
+        self.chapter_urls = chapter_urls
+        self.order = sorted(chapter_urls)
+        self.batch_size = max(1, min(batch_size, MAX_PER_PAGE))
+        self.min_length = min_length
+        self.title_suffix = title_suffix
+        self.available = True
+        self._requested = set()
+        self._cache: Dict[int, Tuple[str, str]] = {}
+
+    def _load_batch(self, chapter_num: int):
+        start = self.order.index(chapter_num)
+        batch = [num for num in self.order[start:] if num not in self._requested][:self.batch_size]
+        self._requested.update(batch)
+        posts = self.api.posts_by_slug([post_slug(self.chapter_urls[num]) for num in batch])
+        if posts is None:
+            print("⚠️ WordPress API unavailable, loading chapter pages instead")
+            self.available = False
+            return
+        loaded = 0
+        for num in batch:
+            post = posts.get(post_slug(self.chapter_urls[num]))
+            rendered = (post or {}).get("content") or {}
+            if not post or rendered.get("protected"):
+                continue
+            content = content_to_text(rendered.get("rendered", ""))
+            if len(content) >= self.min_length:
+                self._cache[num] = (post_title(post) + self.title_suffix, content)
+                loaded += 1
+        print(f"📦 WordPress API returned {loaded} of {len(batch)} chapters")
+
+    def get(self, chapter_num: int) -> Optional[Tuple[str, str]]:
+        """(title, content) for the chapter, or None to fall back to the page"""
+        if not self.available or chapter_num not in self.chapter_urls:
+            return None
+        if chapter_num not in self._requested:
+            self._load_batch(chapter_num)
+        return self._cache.pop(chapter_num, None)
+
+
+def discover_new_posts(api: WordPressApi, series_url: str, adapter: SiteAdapter,
+                       since: Optional[datetime.datetime] = None) -> Dict[int, Tuple[str, Optional[int]]]:
+    """Find the novel's chapter posts changed after `since` (all of them without it)
+
+    Posts are searched by the novel's name and kept when their permalink
+    or title names this novel (not a sequel or spin-off sharing its name).
+    """
+    slug = novel_slug(series_url)
+    name = slug.replace("-", " ")
+    found = {}
+    for post in api.iter_posts(search=name, modified_after=since - SYNC_OVERLAP if since else None):
+        link = post.get("link") or ""
+        title = post_title(post)
+        if not (url_matches_novel(link, slug) or title_matches_novel(title, name)):
+            continue
+        match = VOLUME_CHAPTER_PATTERN.search(title)
+        if match:
+            found[int(match.group(2))] = (link, int(match.group(1)))
+            continue
+        chapter_num = adapter.extract_chapter_number(link)
+        if chapter_num is not None:
+            found[chapter_num] = (link, None)
+    return found